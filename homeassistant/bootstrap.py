@@ -33,6 +33,7 @@ from .helpers import (
     issue_registry,
     recorder,
     restore_state,
+    storage,
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
@@ -69,6 +70,9 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+STARTUP_PROFILE_STORAGE_KEY = "core.startup_profile"
+STARTUP_PROFILE_STORAGE_VERSION = 1
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 LOGGING_INTEGRATIONS = {
@@ -249,6 +253,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_bytecode_cache(hass),
         restore_state.async_load(hass),
     )
 
@@ -582,6 +587,25 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the platforms used during the last successful startup in the
+    # background and record the platforms used during this one
+    profile_store: storage.Store[list[str]] = storage.Store(
+        hass, STARTUP_PROFILE_STORAGE_VERSION, STARTUP_PROFILE_STORAGE_KEY
+    )
+    startup_profile = await profile_store.async_load() or []
+    preimport_task: asyncio.Task[None] | None = None
+    if platforms_to_preimport := [
+        full_name
+        for full_name in startup_profile
+        if full_name.partition(".")[0] in domains_to_setup
+    ]:
+        preimport_task = hass.async_create_background_task(
+            loader.async_preimport_platforms(hass, platforms_to_preimport),
+            "preimport platforms",
+        )
+    hass.data[loader.DATA_PLATFORM_IMPORTS] = {}
+    startup_succeeded = True
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -650,6 +674,7 @@ async def _async_set_up_integrations(
                 await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+            startup_succeeded = False
 
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
@@ -663,6 +688,11 @@ async def _async_set_up_integrations(
                 await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            startup_succeeded = False
+
+    # The platforms not preimported by now are imported when they are used
+    if preimport_task is not None:
+        preimport_task.cancel()
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -671,10 +701,15 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+        startup_succeeded = False
 
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
+    platform_imports = list(hass.data.pop(loader.DATA_PLATFORM_IMPORTS))
+    if startup_succeeded and platform_imports != startup_profile:
+        profile_store.async_delay_save(lambda: platform_imports)
+
     _LOGGER.debug(
         "Integration setup times: %s",
         {
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from enum import StrEnum
 import logging
-from typing import Literal, final
+from typing import Any, Literal, final
 
 import voluptuous as vol
 
@@ -190,6 +190,14 @@ class BinarySensorEntity(Entity):
     _attr_is_on: bool | None = None
     _attr_state: None = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the static attributes of binary sensors using the base implementation."""
+        super().__init_subclass__(**kwargs)
+        if "_cache_static_attributes" not in cls.__dict__:
+            cls._cache_static_attributes = not cls._static_properties_overridden(
+                BinarySensorEntity
+            )
+
     def _default_to_device_class_name(self) -> bool:
         """Return True if an unnamed entity should be named by its device class.
 
@@ -14,7 +14,12 @@ import voluptuous as vol
 from homeassistant.components import http, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import config_validation as cv, integration_platform
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_platform,
+    entity_registry as er,
+    integration_platform,
+)
 from homeassistant.helpers.device_registry import DeviceEntry, async_get
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
@@ -150,6 +155,29 @@ def handle_get(
     )
 
 
+@callback
+def _async_get_entity_polling(
+    hass: HomeAssistant, config_entry: ConfigEntry, device: DeviceEntry | None
+) -> dict[str, dict[str, Any]]:
+    """Return the poll statistics of the entities of a config entry or device."""
+    entity_ids: set[str] | None = None
+    if device is not None:
+        entity_ids = {
+            entry.entity_id
+            for entry in er.async_entries_for_device(
+                er.async_get(hass), device.id, include_disabled_entities=True
+            )
+        }
+    entity_polling: dict[str, dict[str, Any]] = {}
+    for platform in entity_platform.async_get_platforms(hass, config_entry.domain):
+        if platform.config_entry is not config_entry:
+            continue
+        for entity_id, stats in platform.async_get_poll_statistics().items():
+            if entity_ids is None or entity_id in entity_ids:
+                entity_polling[entity_id] = stats
+    return entity_polling
+
+
 async def _async_get_json_file_response(
     hass: HomeAssistant,
     data: Mapping[str, Any],
@@ -157,6 +185,7 @@ async def _async_get_json_file_response(
     domain: str,
     d_id: str,
     sub_id: str | None = None,
+    entity_polling: dict[str, dict[str, Any]] | None = None,
 ) -> web.Response:
     """Return JSON file from dictionary."""
     hass_sys_info = await async_get_system_info(hass)
@@ -171,14 +200,17 @@ async def _async_get_json_file_response(
             "version": cc_obj.version,
             "requirements": cc_obj.requirements,
         }
+    diagnostics: dict[str, Any] = {
+        "home_assistant": hass_sys_info,
+        "custom_components": custom_components,
+        "integration_manifest": integration.manifest,
+        "data": data,
+    }
+    if entity_polling:
+        diagnostics["entity_polling"] = entity_polling
     try:
         json_data = json.dumps(
-            {
-                "home_assistant": hass_sys_info,
-                "custom_components": custom_components,
-                "integration_manifest": integration.manifest,
-                "data": data,
-            },
+            diagnostics,
             indent=2,
             cls=ExtendedJSONEncoder,
         )
@@ -249,7 +281,12 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
             data = await info.config_entry_diagnostics(hass, config_entry)
             filename = f"{DiagnosticsType.CONFIG_ENTRY}-{filename}"
             return await _async_get_json_file_response(
-                hass, data, filename, config_entry.domain, d_id
+                hass,
+                data,
+                filename,
+                config_entry.domain,
+                d_id,
+                entity_polling=_async_get_entity_polling(hass, config_entry, None),
             )
 
         # Device diagnostics
@@ -267,5 +304,11 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
 
         data = await info.device_diagnostics(hass, config_entry, device)
         return await _async_get_json_file_response(
-            hass, data, filename, config_entry.domain, d_id, sub_id
+            hass,
+            data,
+            filename,
+            config_entry.domain,
+            d_id,
+            sub_id,
+            _async_get_entity_polling(hass, config_entry, device),
         )
@@ -6,12 +6,14 @@ from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -62,6 +64,30 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+# A year, also rejects infinite resolutions
+MAX_RESOLUTION = 365 * 24 * 60 * 60
+
+_DOWNSAMPLE_SCHEMA = {
+    vol.Exclusive("max_points", "downsample_size"): vol.All(int, vol.Range(min=3)),
+    vol.Exclusive("resolution", "downsample_size"): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=MAX_RESOLUTION)
+    ),
+    vol.Optional("downsample", default=history.DownsampleMethod.LTTB): vol.Coerce(
+        history.DownsampleMethod
+    ),
+}
+
+
+def _max_points(msg: dict[str, Any], start_time: dt, end_time: dt | None) -> int | None:
+    """Return how many points numeric entities should be downsampled to."""
+    resolution: float | None = msg.get("resolution")
+    if resolution is None:
+        max_points: int | None = msg.get("max_points")
+        return max_points
+    period = ((end_time or dt_util.utcnow()) - start_time).total_seconds()
+    return max(math.ceil(period / resolution), 1)
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,23 +98,61 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
+    downsample: history.DownsampleMethod,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
+    states = cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            max_points,
+            downsample,
+        ),
+    )
+    return JSON_DUMP(messages.result_message(msg_id, states))
+
+
+def _ws_get_significant_states_columnar(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    max_points: int | None,
+    downsample: history.DownsampleMethod,
+) -> str:
+    """Fetch history as columns and convert them to json in the executor."""
+    with session_scope(hass=hass, read_only=True) as session:
+        columns = history.get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            max_points,
+            downsample,
+        )
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+            {
+                entity_id: entity_columns.as_compressed_state()
+                for entity_id, entity_columns in columns.items()
+            },
         )
     )
 
@@ -103,6 +167,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        **_DOWNSAMPLE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -153,8 +219,26 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points = _max_points(msg, start_time, end_time)
 
-    connection.send_message(
+    if msg["columnar"]:
+        connection.send_result_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_significant_states_columnar,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+                msg["downsample"],
+            )
+        )
+        return
+
+    connection.send_result_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
             hass,
@@ -166,6 +250,8 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
+            msg["downsample"],
         )
     )
 
@@ -220,6 +306,8 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None,
+    downsample: history.DownsampleMethod,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
     states = cast(
@@ -235,6 +323,8 @@ def _generate_historical_response(
             minimal_response,
             no_attributes,
             True,
+            max_points,
+            downsample,
         ),
     )
     last_time_ts = 0.0
@@ -275,6 +365,8 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None = None,
+    downsample: history.DownsampleMethod = history.DownsampleMethod.LTTB,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
@@ -290,6 +382,8 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        max_points,
+        downsample,
     )
     if payload:
         connection.send_message(payload)
@@ -404,6 +498,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        **_DOWNSAMPLE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -443,6 +538,8 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points = _max_points(msg, start_time, end_time or utc_now)
+    downsample: history.DownsampleMethod = msg["downsample"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +566,8 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            max_points,
+            downsample,
         )
         return
 
@@ -533,6 +632,8 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        max_points,
+        downsample,
     )
 
     if msg_id not in connection.subscriptions:
@@ -574,4 +675,6 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        max_points=max_points,
+        downsample=downsample,
     )
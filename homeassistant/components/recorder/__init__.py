@@ -44,6 +44,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_SPILL_DIRECTORY = "recorder_spill"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
@@ -58,6 +59,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SPILL_TO_DISK = "spill_to_disk"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -110,6 +112,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SPILL_TO_DISK, default=False): cv.boolean,
                 }
             ),
         )
@@ -145,6 +148,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    spill_path = (
+        hass.config.path(DEFAULT_SPILL_DIRECTORY) if conf[CONF_SPILL_TO_DISK] else None
+    )
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[str] = set(exclude.get(CONF_EVENT_TYPES, []))
     if EVENT_STATE_CHANGED in exclude_event_types:
@@ -162,6 +168,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
         exclude_attributes_by_domain=exclude_attributes_by_domain,
+        spill_path=spill_path,
     )
     instance.async_initialize()
     instance.async_register()
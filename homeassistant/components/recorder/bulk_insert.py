@@ -0,0 +1,210 @@
+"""Insert the rows of a commit window in bulk."""
+from __future__ import annotations
+
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+import logging
+from typing import Any, cast
+
+from sqlalchemy import Column, insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import RelationshipProperty, class_mapper
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Base
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _RelationshipColumn:
+    """A many-to-one relationship and the foreign key column it populates."""
+
+    key: str
+    column: str
+    remote_key: str
+
+
+@dataclass(slots=True)
+class _TableInsert:
+    """How to turn objects of a mapped class into insert parameters."""
+
+    table: Any
+    primary_key: str
+    columns: list[tuple[str, Column[Any]]]
+    relationships: list[_RelationshipColumn]
+
+
+def dialect_supports_bulk_insert(dialect: Dialect) -> bool:
+    """Return if the dialect can return ids for a bulk insert in order."""
+    return bool(
+        dialect.use_insertmanyvalues
+        and dialect.insert_executemany_returning
+        and dialect.insert_executemany_returning_sort_by_parameter_order
+    )
+
+
+def _table_insert(cls: type[Base]) -> _TableInsert:
+    """Build the insert description for a mapped class."""
+    mapper = class_mapper(cls)
+    (primary_key,) = mapper.primary_key
+    relationships: list[_RelationshipColumn] = []
+    for prop in mapper.relationships:
+        assert isinstance(prop, RelationshipProperty)
+        # Only many-to-one relationships populate a local foreign key
+        if prop.uselist or len(pairs := prop.local_remote_pairs or ()) != 1:
+            continue
+        local, remote = pairs[0]
+        assert local.key is not None
+        relationships.append(
+            _RelationshipColumn(
+                prop.key,
+                local.key,
+                prop.mapper.get_property_by_column(remote).key,
+            )
+        )
+    return _TableInsert(
+        mapper.local_table,
+        mapper.get_property_by_column(primary_key).key,
+        [
+            (prop.key, cast(Column[Any], prop.columns[0]))
+            for prop in mapper.column_attrs
+            if not prop.columns[0].primary_key
+        ],
+        relationships,
+    )
+
+
+class BulkInsertBuffer:
+    """Buffer new rows for the event session and insert them in bulk.
+
+    The rows are the same ORM objects the table managers keep track of,
+    but instead of going through the unit of work they are inserted with
+    one multi-row INSERT per table. The generated primary keys are written
+    back to the objects so the managers can pick them up after the commit.
+
+    Rows that reference another new row (like a state that references
+    the previous state of the same entity) are inserted in a later round
+    once the primary key they depend on is known.
+
+    This class is not thread-safe and must be used from the recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._pending: dict[int, Base] = {}
+        self._table_inserts: dict[type[Base], _TableInsert] = {}
+        self._assigned: list[tuple[Base, str]] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator[Base]:
+        """Iterate the buffered rows in the order they were added."""
+        return iter(self._pending.values())
+
+    def add(self, obj: Base) -> None:
+        """Buffer a new row."""
+        self._pending[id(obj)] = obj
+
+    def clear(self) -> None:
+        """Forget all buffered rows after they were committed or discarded."""
+        self._pending.clear()
+        self._assigned.clear()
+
+    def rollback(self) -> None:
+        """Forget primary keys assigned by a flush that was not committed."""
+        for obj, primary_key in self._assigned:
+            setattr(obj, primary_key, None)
+        self._assigned.clear()
+
+    def _get_table_insert(self, cls: type[Base]) -> _TableInsert:
+        """Return the cached insert description for a mapped class."""
+        if (table_insert := self._table_inserts.get(cls)) is None:
+            table_insert = self._table_inserts[cls] = _table_insert(cls)
+        return table_insert
+
+    def _add_unbuffered_dependencies(self) -> None:
+        """Buffer new rows that are only referenced from buffered rows.
+
+        This matches the save-update cascade the session would apply.
+        """
+        to_check: list[Base] = list(self._pending.values())
+        while to_check:
+            obj = to_check.pop()
+            for relationship in self._get_table_insert(type(obj)).relationships:
+                if (
+                    (related := getattr(obj, relationship.key)) is not None
+                    and id(related) not in self._pending
+                    and getattr(related, relationship.remote_key) is None
+                ):
+                    self._pending[id(related)] = related
+                    to_check.append(related)
+
+    def flush(self, session: Session) -> None:
+        """Insert all buffered rows using the session's transaction."""
+        self._add_unbuffered_dependencies()
+        remaining: Collection[Base] = self._pending.values()
+        while remaining:
+            ready: dict[type[Base], list[dict[str, Any]]] = {}
+            ready_objs: dict[type[Base], list[Base]] = {}
+            deferred: list[Base] = []
+            for obj in remaining:
+                cls = type(obj)
+                table_insert = self._get_table_insert(cls)
+                if (params := self._params(obj, table_insert)) is None:
+                    deferred.append(obj)
+                    continue
+                ready.setdefault(cls, []).append(params)
+                ready_objs.setdefault(cls, []).append(obj)
+            if not ready:
+                raise RuntimeError(f"Unable to resolve dependencies for {deferred}")
+            for cls, params_list in ready.items():
+                self._insert(session, cls, params_list, ready_objs[cls])
+            remaining = deferred
+
+    def _params(self, obj: Base, table_insert: _TableInsert) -> dict[str, Any] | None:
+        """Return the insert parameters for obj.
+
+        Returns None if obj depends on a row that has no primary key yet.
+        """
+        # Buffered rows are transient so everything that was set on
+        # them is in the instance dict and unset columns are None.
+        obj_dict = obj.__dict__
+        params: dict[str, Any] = {}
+        for key, column in table_insert.columns:
+            value = obj_dict.get(key)
+            if value is None and (default := column.default) is not None:
+                if default.is_callable:
+                    value = default.arg(None)  # type: ignore[attr-defined]
+                elif default.is_scalar:
+                    value = default.arg  # type: ignore[attr-defined]
+            params[column.key] = value
+        for relationship in table_insert.relationships:
+            if (related := obj_dict.get(relationship.key)) is None:
+                continue
+            if (remote_id := getattr(related, relationship.remote_key)) is None:
+                return None
+            params[relationship.column] = remote_id
+        return params
+
+    def _insert(
+        self,
+        session: Session,
+        cls: type[Base],
+        params_list: list[dict[str, Any]],
+        objs: list[Base],
+    ) -> None:
+        """Insert rows for one table and write back the primary keys."""
+        table_insert = self._get_table_insert(cls)
+        table = table_insert.table
+        primary_key = table_insert.primary_key
+        _LOGGER.debug("Bulk inserting %s rows into %s", len(params_list), table.name)
+        result = session.execute(
+            insert(table).returning(table.c[primary_key], sort_by_parameter_order=True),
+            params_list,
+        )
+        for obj, row_id in zip(objs, result.scalars(), strict=True):
+            setattr(obj, primary_key, row_id)
+            self._assigned.append((obj, primary_key))
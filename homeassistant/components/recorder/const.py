@@ -23,6 +23,9 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
+# Events are written to the spill queue and read back from it in batches
+SPILL_WRITE_BATCH_SIZE = 1000
+SPILL_DRAIN_BATCH_SIZE = 1000
 
 # The maximum number of rows (events) we purge in one delete statement
 
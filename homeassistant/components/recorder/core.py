@@ -42,6 +42,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertBuffer, dialect_supports_bulk_insert
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -56,6 +57,8 @@ from .const import (
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
+    SPILL_DRAIN_BATCH_SIZE,
+    SPILL_WRITE_BATCH_SIZE,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
@@ -79,12 +82,15 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import IdRangePurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .spill_queue import SpillQueue, event_from_spill, event_to_spill
+from .statistics_accumulator import StatisticsAccumulator
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -111,6 +117,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpillDrainTask,
     StatesContextIDMigrationTask,
     StatisticsTask,
     StopTask,
@@ -179,6 +186,7 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        spill_path: str | None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -226,8 +234,14 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # Recorded states of statistics platforms so the short term
+        # statistics can be compiled without querying them again
+        self.statistics_accumulator = StatisticsAccumulator()
 
         self.event_session: Session | None = None
+        # Rows for the event session are inserted in bulk when the
+        # database can return the generated ids of a multi-row insert
+        self._bulk_insert: BulkInsertBuffer | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
@@ -238,6 +252,15 @@ class Recorder(threading.Thread):
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
+        # When the backlog is full, events are spilled to disk instead
+        # of the queue until the spilled events have been recorded
+        self._spill_queue = SpillQueue(spill_path) if spill_path else None
+        self._spilling = False
+        self._spill_buffer: list[bytes] = []
+        self._spill_writes_in_progress = 0
+        self._spill_drain_waiting = False
+        self.spill_drain_rate: float | None = None
+        self.purge_progress: IdRangePurgeProgress | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
@@ -251,6 +274,13 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def spill_backlog(self) -> int:
+        """Return the number of events waiting to be read back from disk."""
+        if self._spill_queue is None:
+            return 0
+        return self._spill_queue.size + len(self._spill_buffer)
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -281,6 +311,8 @@ class Recorder(threading.Thread):
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
+        if not enable:
+            self.statistics_accumulator.invalidate()
 
     @callback
     def async_start_executor(self) -> None:
@@ -299,9 +331,21 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._event_listener = self._async_listen_for_events(self._queue.put_nowait)
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            timedelta(minutes=10),
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_for_events(
+        self, queue_put: Callable[[EventTask], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for events that should be recorded and pass them to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
         event_task = EventTask
 
         @callback
@@ -329,17 +373,11 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event_task(event))
 
-        self._event_listener = self.hass.bus.async_listen(
+        return self.hass.bus.async_listen(
             MATCH_ALL,
             _event_listener,
             run_immediately=True,
         )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            timedelta(minutes=10),
-            name="Recorder queue watcher",
-        )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -381,6 +419,19 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Recorder queue size is: %s", size)
         if not self._reached_max_backlog_percentage(100):
             return
+        if self._spill_queue is not None:
+            if not self._spilling:
+                _LOGGER.warning(
+                    (
+                        "The recorder backlog queue reached the maximum size of %s "
+                        "events; new events will be written to %s until the "
+                        "database catches up"
+                    ),
+                    self.backlog,
+                    self._spill_queue.path,
+                )
+                self._async_start_spilling()
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -392,6 +443,136 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_start_spilling(self) -> None:
+        """Spill new events to disk until the spilled events have been recorded.
+
+        The drain task is queued behind the current backlog so
+        the spilled events are recorded in the order they were fired.
+        """
+        if self._spilling or not self._event_listener:
+            return
+        self._spilling = True
+        # Spilled events are recorded after the statistics of
+        # their period may have been compiled
+        self.statistics_accumulator.invalidate()
+        self._event_listener()
+        self._event_listener = self._async_listen_for_events(
+            self._async_spill_event_task
+        )
+        self.queue_task(SpillDrainTask())
+
+    @callback
+    def _async_stop_spilling(self) -> None:
+        """Put new events in the queue again."""
+        self._spilling = False
+        if self._event_listener:
+            self._event_listener()
+            self._event_listener = self._async_listen_for_events(self._queue.put_nowait)
+
+    @callback
+    def _async_spill_event_task(self, task: EventTask) -> None:
+        """Buffer an event that will be spilled to disk."""
+        try:
+            line = event_to_spill(task.event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "Event is not JSON serializable and cannot be spilled: %s", task.event
+            )
+            return
+        self._spill_buffer.append(line)
+        if len(self._spill_buffer) >= SPILL_WRITE_BATCH_SIZE:
+            self._async_write_spill_buffer()
+
+    @callback
+    def _async_write_spill_buffer(self) -> None:
+        """Write the buffered events to the spill queue in the executor."""
+        assert self._spill_queue is not None
+        lines = self._spill_buffer
+        self._spill_buffer = []
+        self._spill_writes_in_progress += 1
+
+        @callback
+        def _async_written(future: asyncio.Future[None]) -> None:
+            self._spill_writes_in_progress -= 1
+            if not future.cancelled() and (err := future.exception()):
+                _LOGGER.error("Error writing events to the spill queue: %s", err)
+            if self._spill_drain_waiting and not self._spill_writes_in_progress:
+                self._spill_drain_waiting = False
+                self.queue_task(SpillDrainTask())
+
+        self.hass.async_add_executor_job(
+            self._spill_queue.append, lines
+        ).add_done_callback(_async_written)
+
+    @callback
+    def _async_spill_queue_drained(self) -> None:
+        """Stop spilling if no events are waiting to be read back from disk."""
+        assert self._spill_queue is not None
+        if not self._spilling:
+            return
+        if self._spill_buffer:
+            self._async_write_spill_buffer()
+        if self._spill_writes_in_progress:
+            # Drain again once the events have been written
+            self._spill_drain_waiting = True
+            return
+        if self._spill_queue.size:
+            self.queue_task(SpillDrainTask())
+            return
+        _LOGGER.info("The recorder has caught up with the events spilled to disk")
+        self._async_stop_spilling()
+
+    def _record_spilled_events(self, max_events: int) -> int:
+        """Record up to max_events events that were spilled to disk.
+
+        Returns the number of events read from the spill queue.
+        """
+        assert self._spill_queue is not None
+        start = time.monotonic()
+        lines = self._spill_queue.read(max_events)
+        for line in lines:
+            try:
+                event = event_from_spill(line)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Skipping invalid event in the spill queue: %s", line)
+                continue
+            self._process_one_event(event)
+        if lines:
+            self.spill_drain_rate = len(lines) / max(time.monotonic() - start, 1e-6)
+        return len(lines)
+
+    def _drain_spill_queue(self) -> None:
+        """Record a batch of events that were spilled to disk."""
+        if (
+            self._record_spilled_events(SPILL_DRAIN_BATCH_SIZE)
+            == SPILL_DRAIN_BATCH_SIZE
+        ):
+            self.queue_task(SpillDrainTask())
+            return
+        self.hass.add_job(self._async_spill_queue_drained)
+
+    def _drain_previous_spill_queue(self) -> None:
+        """Record the events spilled to disk by a previous run.
+
+        They are older than the events queued by this run, so they are
+        recorded before the queue is processed. Only the events found on
+        disk at startup are read here; events spilled by this run while
+        they are recorded are appended after them and recorded in order
+        by SpillDrainTask.
+        """
+        assert self._spill_queue is not None
+        # Spilled events are recorded after the statistics of
+        # their period may have been compiled
+        self.statistics_accumulator.invalidate()
+        remaining = self._spill_queue.size
+        while remaining > 0 and (
+            recorded := self._record_spilled_events(
+                min(remaining, SPILL_DRAIN_BATCH_SIZE)
+            )
+        ):
+            remaining -= recorded
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -421,6 +602,7 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        self.statistics_accumulator.invalidate()
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -466,7 +648,15 @@ class Recorder(threading.Thread):
             self._hass_started.set_result(SHUTDOWN_TASK)
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        if self._spill_buffer:
+            # The spilled events will be recorded after the next start
+            assert self._spill_queue is not None
+            lines = self._spill_buffer
+            self._spill_buffer = []
+            await self.hass.async_add_executor_job(self._spill_queue.append, lines)
         await self.hass.async_add_executor_job(self.join)
+        if self._spill_queue is not None:
+            await self.hass.async_add_executor_job(self._spill_queue.close)
 
     @callback
     def _async_hass_started(self, hass: HomeAssistant) -> None:
@@ -701,7 +891,10 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if (bulk_insert := self._bulk_insert) is not None:
+            bulk_insert.add(obj)  # type: ignore[arg-type]
+        else:
+            session.add(obj)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -767,6 +960,10 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        if self._spill_queue is not None:
+            self._spill_queue.load()
+            if self._spill_queue.size:
+                self._drain_previous_spill_queue()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -1078,6 +1275,7 @@ class Recorder(threading.Thread):
             dbstate.old_state_id = old_state_id
         if entity_removed:
             dbstate.state = None
+            self.statistics_accumulator.remove_entity(entity_id)
         else:
             states_manager.add_pending(entity_id, dbstate)
 
@@ -1134,6 +1332,8 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        if not entity_removed:
+            self.statistics_accumulator.add_state(event.data["new_state"])
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1172,7 +1372,20 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        session.commit()
+        if (bulk_insert := self._bulk_insert) is not None and bulk_insert:
+            try:
+                bulk_insert.flush(session)
+                session.commit()
+            except BaseException:
+                # Forget the ids of the rows that were not committed
+                # so the next attempt inserts them again
+                bulk_insert.rollback()
+                with contextlib.suppress(SQLAlchemyError):
+                    session.rollback()
+                raise
+            bulk_insert.clear()
+        else:
+            session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1199,6 +1412,7 @@ class Recorder(threading.Thread):
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
         self.recorder_runs_manager.reset()
+        self.purge_progress = None
         self._setup_recorder()
         self._setup_run()
 
@@ -1210,6 +1424,10 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        # States that were not committed are lost
+        self.statistics_accumulator.invalidate()
+        if self._bulk_insert is not None:
+            self._bulk_insert.clear()
 
         if not self.event_session:
             return
@@ -1395,6 +1613,12 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        # The dialect knows the server capabilities once it has connected
+        self._bulk_insert = (
+            BulkInsertBuffer()
+            if dialect_supports_bulk_insert(self.engine.dialect)
+            else None
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
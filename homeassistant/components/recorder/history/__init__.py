@@ -3,32 +3,51 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
 
 from ... import recorder
 from ..filters import Filters
+from .columnar import (
+    DownsampleMethod,
+    HistoryColumns,
+    columns_to_compressed_states,
+    downsample_columns,
+    downsample_states,
+    states_to_columns,
+)
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar_with_session as _modern_get_significant_states_columnar_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    state_changes_during_period_columnar as _modern_state_changes_during_period_columnar,
 )
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "DownsampleMethod",
+    "HistoryColumns",
+    "columns_to_compressed_states",
+    "downsample_columns",
+    "states_to_columns",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "state_changes_during_period_columnar",
 ]
 
 
@@ -91,17 +110,38 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    If max_points is set, numeric entities are downsampled
+    to at most max_points with the downsample method.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_downsample(
+            _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ),
+            start_time,
+            end_time,
+            max_points if compressed_state_format else None,
+            downsample,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -112,6 +152,8 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
+        downsample,
     )
 
 
@@ -127,17 +169,39 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    If max_points is set, numeric entities are downsampled
+    to at most max_points with the downsample method.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+        return _legacy_downsample(
+            _legacy_get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ),
+            start_time,
+            end_time,
+            max_points if compressed_state_format else None,
+            downsample,
+        )
+    return _modern_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -149,9 +213,50 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
+        downsample,
     )
 
 
+def _legacy_downsample(
+    states: MutableMapping[str, list[State | dict[str, Any]]],
+    start_time: datetime,
+    end_time: datetime | None,
+    max_points: int | None,
+    downsample: DownsampleMethod,
+) -> MutableMapping[str, list[State | dict[str, Any]]]:
+    """Downsample compressed states fetched before the schema is migrated.
+
+    The kept points are copies of the original compressed
+    states with the downsampled state and time.
+    """
+    if not max_points:
+        return states
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = dt_util.utc_to_timestamp(end_time or dt_util.utcnow())
+    for entity_id, state_list in states.items():
+        compressed_states = cast(list[dict[str, Any]], state_list)
+        if (
+            points := downsample_states(
+                [state[COMPRESSED_STATE_STATE] for state in compressed_states],
+                [state[COMPRESSED_STATE_LAST_UPDATED] for state in compressed_states],
+                max_points,
+                downsample,
+                start_time_ts,
+                end_time_ts,
+            )
+        ) is not None:
+            states[entity_id] = [
+                {
+                    **compressed_states[idx],
+                    COMPRESSED_STATE_STATE: state,
+                    COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                }
+                for idx, state, last_updated_ts in points
+            ]
+    return states
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -181,3 +286,122 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def get_significant_states_columnar_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
+) -> dict[str, HistoryColumns]:
+    """Return the state changes during a time period as columns.
+
+    If max_points is set, numeric entities are downsampled
+    to at most max_points with the downsample method.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+        )
+
+        compressed_states = cast(
+            MutableMapping[str, list[dict[str, Any]]],
+            _legacy_get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                True,
+                True,
+                True,
+            ),
+        )
+        columns = {
+            entity_id: states_to_columns(
+                [state[COMPRESSED_STATE_STATE] for state in states],
+                [state[COMPRESSED_STATE_LAST_UPDATED] for state in states],
+            )
+            for entity_id, states in compressed_states.items()
+        }
+    else:
+        columns = _modern_get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+        )
+    return _downsample(columns, start_time, end_time, max_points, downsample)
+
+
+def state_changes_during_period_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    include_start_time_state: bool = True,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
+) -> dict[str, HistoryColumns]:
+    """Return the state changes of an entity during a time period as columns.
+
+    If max_points is set, numeric entities are downsampled
+    to at most max_points with the downsample method.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            state_changes_during_period as _legacy_state_changes_during_period,
+        )
+
+        columns = {
+            entity_id: states_to_columns(
+                [state.state for state in states],
+                [dt_util.utc_to_timestamp(state.last_updated) for state in states],
+            )
+            for entity_id, states in _legacy_state_changes_during_period(
+                hass,
+                start_time,
+                end_time,
+                entity_id,
+                True,
+                False,
+                None,
+                include_start_time_state,
+            ).items()
+        }
+    else:
+        columns = _modern_state_changes_during_period_columnar(
+            hass, start_time, end_time, entity_id, include_start_time_state
+        )
+    return _downsample(columns, start_time, end_time, max_points, downsample)
+
+
+def _downsample(
+    columns: dict[str, HistoryColumns],
+    start_time: datetime,
+    end_time: datetime | None,
+    max_points: int | None,
+    downsample: DownsampleMethod,
+) -> dict[str, HistoryColumns]:
+    """Downsample the columns of each entity if max_points is set."""
+    if not max_points:
+        return columns
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = dt_util.utc_to_timestamp(end_time or dt_util.utcnow())
+    return {
+        entity_id: downsample_columns(
+            entity_columns, max_points, downsample, start_time_ts, end_time_ts
+        )
+        for entity_id, entity_columns in columns.items()
+    }
@@ -0,0 +1,362 @@
+"""Columnar history results backed by numpy arrays."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import StrEnum
+import math
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+
+COLUMNAR_STRING_TABLE = "st"
+
+# States that do not make an entity non-numeric
+_MISSING_VALUE_STATES = {"", STATE_UNAVAILABLE, STATE_UNKNOWN}
+
+
+class DownsampleMethod(StrEnum):
+    """How to reduce the points of a numeric history."""
+
+    LAST = "last"
+    LTTB = "lttb"
+    MAX = "max"
+    MEAN = "mean"
+    MIN = "min"
+
+
+@dataclass(slots=True)
+class HistoryColumns:
+    """The history of one entity as parallel arrays.
+
+    For numeric entities states holds the values as float64 with NaN
+    for unknown and unavailable states. For other entities states holds
+    indices into string_table.
+
+    Numeric columns built from states also keep the original states as
+    indices into source_table so they can be converted back without
+    reformatting the values. Points reduced by downsampling have a
+    source index of -1.
+
+    row_indices holds the position of the state each point comes from
+    in the states the columns were built from. A point reduced by
+    downsampling comes from the last state of its bucket.
+    """
+
+    timestamps: npt.NDArray[np.float64]
+    states: npt.NDArray[np.float64] | npt.NDArray[np.int32]
+    string_table: list[str] | None = None
+    source_table: list[str] | None = None
+    source_indices: npt.NDArray[np.int32] | None = None
+    row_indices: npt.NDArray[np.intp] | None = None
+
+    @property
+    def numeric(self) -> bool:
+        """Return if the states are numeric values."""
+        return self.string_table is None
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.timestamps)
+
+    def as_compressed_state(self) -> dict[str, Any]:
+        """Return a JSON friendly representation.
+
+        NaN values are serialized as null.
+        """
+        compressed: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: self.states.tolist(),
+            COMPRESSED_STATE_LAST_UPDATED: self.timestamps.tolist(),
+        }
+        if self.string_table is not None:
+            compressed[COLUMNAR_STRING_TABLE] = self.string_table
+        return compressed
+
+    def take(self, keep: npt.NDArray[Any]) -> HistoryColumns:
+        """Return the points selected by keep, a boolean mask or indices."""
+        return HistoryColumns(
+            self.timestamps[keep],
+            self.states[keep],
+            self.string_table,
+            self.source_table,
+            None if self.source_indices is None else self.source_indices[keep],
+            None if self.row_indices is None else self.row_indices[keep],
+        )
+
+
+def _format_value(value: float) -> str:
+    """Format a value which has no source state."""
+    if math.isnan(value):
+        return STATE_UNAVAILABLE
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _column_states(columns: HistoryColumns) -> list[str]:
+    """Return the states of numeric columns.
+
+    Points that come from a state keep the original state. Reduced
+    points use the first source state with the same value or else the
+    formatted value, with NaN values becoming unavailable states.
+    """
+    values: list[float] = columns.states.tolist()
+    source_table = columns.source_table
+    if source_table is None or columns.source_indices is None:
+        return [_format_value(value) for value in values]
+    by_value: dict[float, str] = {}
+    for state in source_table:
+        with suppress(ValueError):
+            by_value.setdefault(float(state), state)
+    return [
+        source_table[idx] if idx >= 0 else by_value.get(value) or _format_value(value)
+        for idx, value in zip(columns.source_indices.tolist(), values, strict=True)
+    ]
+
+
+def columns_to_compressed_states(columns: HistoryColumns) -> list[dict[str, Any]]:
+    """Convert numeric columns to a list of compressed states."""
+    return [
+        {COMPRESSED_STATE_STATE: state, COMPRESSED_STATE_LAST_UPDATED: timestamp}
+        for state, timestamp in zip(
+            _column_states(columns), columns.timestamps.tolist(), strict=True
+        )
+    ]
+
+
+def downsample_states(
+    states: Sequence[str],
+    timestamps: Sequence[float | None],
+    max_points: int,
+    method: DownsampleMethod,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> list[tuple[int, str, float]] | None:
+    """Downsample numeric states ordered by time without building columns for them.
+
+    Returns the position of the state each point comes from, the state
+    and the time of each point, or None if the states are not numeric
+    or there are no more than max_points of them. Unlike
+    states_to_columns, repeated states are kept since the states
+    may differ in their attributes.
+    """
+    if len(states) <= max_points:
+        return None
+    columns = _build_columns(states, timestamps)
+    if not columns.numeric:
+        return None
+    downsampled = downsample_columns(
+        columns, max_points, method, start_time_ts, end_time_ts
+    )
+    assert downsampled.row_indices is not None
+    return list(
+        zip(
+            downsampled.row_indices.tolist(),
+            _column_states(downsampled),
+            downsampled.timestamps.tolist(),
+            strict=True,
+        )
+    )
+
+
+def states_to_columns(
+    states: Sequence[str], timestamps: Sequence[float | None]
+) -> HistoryColumns:
+    """Build columns from states ordered by time.
+
+    Consecutive duplicate states are dropped since the
+    columns do not carry attributes.
+    """
+    return _drop_repeats(_build_columns(states, timestamps))
+
+
+def _build_columns(
+    states: Sequence[str], timestamps: Sequence[float | None]
+) -> HistoryColumns:
+    """Build columns with a point for each state."""
+    table: dict[str, int] = {}
+    setdefault = table.setdefault
+    indices = np.fromiter(
+        (setdefault(state, len(table)) for state in states), np.int32, len(states)
+    )
+    string_table = list(table)
+    values = np.empty(len(string_table), dtype=np.float64)
+    has_number = False
+    for idx, state in enumerate(string_table):
+        try:
+            values[idx] = float(state)
+            has_number = True
+        except ValueError:
+            if state not in _MISSING_VALUE_STATES:
+                break
+            values[idx] = np.nan
+    else:
+        if has_number:
+            # Parsing each distinct state once and gathering is
+            # much cheaper than parsing every row
+            return HistoryColumns(
+                np.array(timestamps, dtype=np.float64),
+                values[indices],
+                source_table=string_table,
+                source_indices=indices,
+                row_indices=np.arange(len(states)),
+            )
+    return HistoryColumns(
+        np.array(timestamps, dtype=np.float64),
+        indices,
+        string_table,
+        row_indices=np.arange(len(states)),
+    )
+
+
+def _drop_repeats(columns: HistoryColumns) -> HistoryColumns:
+    """Drop points that repeat the previous state."""
+    states = columns.states
+    if len(states) < 2:
+        return columns
+    keep = np.empty(len(states), dtype=bool)
+    keep[0] = True
+    np.not_equal(states[1:], states[:-1], out=keep[1:])
+    if columns.numeric:
+        # NaN never equals NaN
+        nans = np.isnan(states)
+        keep[1:] &= ~(nans[1:] & nans[:-1])
+    if keep.all():
+        return columns
+    return columns.take(keep)
+
+
+def rows_to_columns(
+    rows: Iterable[Any],
+    state_idx: int,
+    last_updated_ts_idx: int,
+    start_time_ts: float | None,
+) -> HistoryColumns:
+    """Build columns from database rows of a single entity ordered by time.
+
+    The start time state row has a last_updated_ts of 0
+    and is moved to start_time_ts.
+    """
+    states: list[str] = []
+    timestamps: list[float | None] = []
+    states_append = states.append
+    timestamps_append = timestamps.append
+    for row in rows:
+        states_append(row[state_idx])
+        timestamps_append(row[last_updated_ts_idx] or start_time_ts)
+    return states_to_columns(states, timestamps)
+
+
+def downsample_columns(
+    columns: HistoryColumns,
+    max_points: int,
+    method: DownsampleMethod,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> HistoryColumns:
+    """Reduce numeric columns to at most max_points.
+
+    max_points must be at least one. The period is split into max_points
+    buckets of equal width and each non-empty bucket is reduced to one
+    point at the time of its last point, so the last point is always the
+    latest state. LTTB instead picks the points that keep the shape of
+    the graph. Columns that are not numeric are returned unchanged.
+    """
+    if max_points < 1:
+        raise ValueError(f"max_points must be at least 1, got {max_points}")
+    if not columns.numeric or len(columns) <= max_points:
+        return columns
+    timestamps = columns.timestamps
+    values: npt.NDArray[np.float64] = columns.states  # type: ignore[assignment]
+    if method is DownsampleMethod.LTTB:
+        return columns.take(_lttb_indices(timestamps, values, max_points))
+
+    width = max(end_time_ts - start_time_ts, 1e-9) / max_points
+    buckets = np.clip(
+        ((timestamps - start_time_ts) // width).astype(np.int64), 0, max_points - 1
+    )
+    starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+    ends = np.append(starts[1:] - 1, len(values) - 1)
+    if method is DownsampleMethod.LAST:
+        return columns.take(ends)
+    if method is DownsampleMethod.MIN:
+        reduced = np.fmin.reduceat(values, starts)
+    elif method is DownsampleMethod.MAX:
+        reduced = np.fmax.reduceat(values, starts)
+    else:
+        finite = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(finite, values, 0.0), starts)
+        counts = np.add.reduceat(finite.astype(np.int64), starts)
+        reduced = np.divide(
+            sums, counts, out=np.full(len(starts), np.nan), where=counts > 0
+        )
+    source_indices = None
+    if columns.source_indices is not None:
+        # Buckets without numbers keep the missing state of their last point
+        source_indices = np.where(
+            np.isnan(reduced), columns.source_indices[ends], -1
+        ).astype(np.int32)
+    return HistoryColumns(
+        timestamps[ends],
+        reduced,
+        source_table=columns.source_table,
+        source_indices=source_indices,
+        row_indices=None if columns.row_indices is None else columns.row_indices[ends],
+    )
+
+
+def _lttb_indices(
+    timestamps: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    max_points: int,
+) -> npt.NDArray[np.intp]:
+    """Return the indices of the points picked by Largest-Triangle-Three-Buckets.
+
+    Points that start a gap (NaN after a number) are kept so gaps stay
+    visible; LTTB picks from the remaining finite points. If there are
+    too many gaps to leave LTTB at least three points, evenly spaced
+    points are picked instead. At most max_points indices are returned.
+    """
+    nans = np.isnan(values)
+    gap_starts = np.flatnonzero(nans & ~np.r_[False, nans[:-1]])
+    finite = np.flatnonzero(~nans)
+    threshold = max_points - len(gap_starts)
+    if len(finite) <= threshold:
+        return np.union1d(finite, gap_starts)
+    if threshold < 3:
+        # The step between picked points is greater than one,
+        # so the rounded positions are distinct
+        return np.linspace(0, len(values) - 1, max_points).round().astype(np.intp)
+
+    x = timestamps[finite]
+    y = values[finite]
+    count = len(finite)
+    every = (count - 2) / (threshold - 2)
+    picked = np.empty(threshold, dtype=np.intp)
+    picked[0] = 0
+    picked[-1] = count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        range_start = int(bucket * every) + 1
+        range_end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, count)
+        avg_x = x[range_end:next_end].mean()
+        avg_y = y[range_end:next_end].mean()
+        prev_x = x[previous]
+        prev_y = y[previous]
+        areas = np.abs(
+            (prev_x - avg_x) * (y[range_start:range_end] - prev_y)
+            - (prev_x - x[range_start:range_end]) * (avg_y - prev_y)
+        )
+        previous = range_start + int(areas.argmax())
+        picked[bucket + 1] = previous
+    return np.union1d(finite[picked], gap_starts)
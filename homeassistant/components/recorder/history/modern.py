@@ -36,6 +36,12 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .columnar import (
+    DownsampleMethod,
+    HistoryColumns,
+    downsample_states,
+    rows_to_columns,
+)
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -102,6 +108,8 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -117,6 +125,8 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
+            downsample,
         )
 
 
@@ -195,11 +205,17 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
     entity_ids is an optional iterable of entities to include in the results.
 
+    If max_points is set, the states of numeric entities are downsampled
+    to at most max_points with the downsample method before they are
+    converted.
+
     filters is an optional SQLAlchemy filter which will be applied to the database
     queries unless entity_ids is given, in which case its ignored.
 
@@ -211,6 +227,86 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        result := _get_significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts_or_none, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts_or_none,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        max_points=max_points,
+        downsample=downsample,
+        period=(
+            dt_util.utc_to_timestamp(start_time),
+            dt_util.utc_to_timestamp(end_time or dt_util.utcnow()),
+        ),
+    )
+
+
+def get_significant_states_columnar_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, HistoryColumns]:
+    """Return state changes during UTC period start_time - end_time as columns.
+
+    Attributes are not included so only changes of the state are returned.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        result := _get_significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+        )
+    ):
+        return {}
+    rows, start_time_ts_or_none, entity_id_to_metadata_id = result
+    return _sorted_states_to_columns(
+        rows, start_time_ts_or_none, entity_ids, entity_id_to_metadata_id
+    )
+
+
+def _get_significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the rows for significant states and how to map them to entities.
+
+    The second item is the start time timestamp if the start time
+    state was included.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +315,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +353,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -371,59 +463,122 @@ def state_changes_during_period(
     """Return states changes during UTC period start_time - end_time."""
     if not entity_id:
         raise ValueError("entity_id must be provided")
-    entity_ids = [entity_id.lower()]
+    entity_id = entity_id.lower()
 
     with session_scope(hass=hass, read_only=True) as session:
-        instance = recorder.get_instance(hass)
         if not (
-            possible_metadata_id := instance.states_meta_manager.get(
-                entity_id, session, False
-            )
-        ):
-            return {}
-        single_metadata_id = possible_metadata_id
-        entity_id_to_metadata_id: dict[str, int | None] = {
-            entity_id: single_metadata_id
-        }
-        run_start_ts: float | None = None
-        if include_start_time_state and not (
-            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
-        ):
-            include_start_time_state = False
-        start_time_ts = dt_util.utc_to_timestamp(start_time)
-        end_time_ts = datetime_to_timestamp_or_none(end_time)
-        stmt = lambda_stmt(
-            lambda: _state_changed_during_period_stmt(
-                start_time_ts,
-                end_time_ts,
-                single_metadata_id,
+            result := _get_state_changes_during_period_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_id,
                 no_attributes,
                 limit,
                 include_start_time_state,
-                run_start_ts,
-            ),
-            track_on=[
-                bool(end_time_ts),
-                no_attributes,
-                bool(limit),
-                include_start_time_state,
-            ],
-        )
+            )
+        ):
+            return {}
+        rows, start_time_ts_or_none, single_metadata_id = result
         return cast(
             MutableMapping[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
-                start_time_ts if include_start_time_state else None,
-                entity_ids,
-                entity_id_to_metadata_id,
+                rows,
+                start_time_ts_or_none,
+                [entity_id],
+                {entity_id: single_metadata_id},
                 descending=descending,
                 no_attributes=no_attributes,
             ),
         )
 
 
+def state_changes_during_period_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, HistoryColumns]:
+    """Return states changes during UTC period start_time - end_time as columns."""
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    entity_id = entity_id.lower()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            result := _get_state_changes_during_period_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_id,
+                True,
+                None,
+                include_start_time_state,
+            )
+        ):
+            return {}
+        rows, start_time_ts_or_none, single_metadata_id = result
+        return _sorted_states_to_columns(
+            rows, start_time_ts_or_none, [entity_id], {entity_id: single_metadata_id}
+        )
+
+
+def _get_state_changes_during_period_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_id: str,
+    no_attributes: bool,
+    limit: int | None,
+    include_start_time_state: bool,
+) -> tuple[Iterable[Row], float | None, int] | None:
+    """Return the rows for the state changes of a single entity and its metadata_id.
+
+    The second item is the start time timestamp if the start time
+    state was included.
+    """
+    instance = recorder.get_instance(hass)
+    if not (
+        possible_metadata_id := instance.states_meta_manager.get(
+            entity_id, session, False
+        )
+    ):
+        return None
+    single_metadata_id = possible_metadata_id
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    stmt = lambda_stmt(
+        lambda: _state_changed_during_period_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            no_attributes,
+            limit,
+            include_start_time_state,
+            run_start_ts,
+        ),
+        track_on=[
+            bool(end_time_ts),
+            no_attributes,
+            bool(limit),
+            include_start_time_state,
+        ],
+    )
+    return (
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts if include_start_time_state else None,
+        single_metadata_id,
+    )
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False)
@@ -640,6 +795,9 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    max_points: int | None = None,
+    downsample: DownsampleMethod = DownsampleMethod.LTTB,
+    period: tuple[float, float] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -648,6 +806,10 @@ def _sorted_states_to_dict(
 
     States must be sorted by entity_id and last_updated
 
+    If max_points is set, the rows of numeric entities are downsampled
+    over the period before they are converted, only the kept rows are
+    converted with their attributes and last_changed.
+
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
@@ -693,10 +855,53 @@ def _sorted_states_to_dict(
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
-        if (
+        full_response = (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
+        )
+        if max_points:
+            assert period is not None
+            rows = list(group)
+            if (
+                points := downsample_states(
+                    [row[state_idx] for row in rows],
+                    [row[last_updated_ts_idx] or start_time_ts for row in rows],
+                    max_points,
+                    downsample,
+                    *period,
+                )
+            ) is not None:
+                # With minimal response only the first point is a native State
+                for idx, (row_idx, state, last_updated_ts) in enumerate(points):
+                    if full_response or not idx:
+                        ent_results.append(
+                            state_class(
+                                rows[row_idx],
+                                attr_cache,
+                                start_time_ts,
+                                entity_id,
+                                state,
+                                last_updated_ts,
+                                not full_response and no_attributes,
+                            )
+                        )
+                    elif compressed_state_format:
+                        ent_results.append(
+                            {attr_state: state, attr_time: last_updated_ts}
+                        )
+                    else:
+                        ent_results.append(
+                            {
+                                attr_state: state,
+                                attr_time: dt_util.utc_from_timestamp(
+                                    last_updated_ts
+                                ).isoformat(),
+                            }
+                        )
+                continue
+            group = iter(rows)
+
+        if full_response:
             ent_results.extend(
                 state_class(
                     db_state,
@@ -768,3 +973,29 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+) -> dict[str, HistoryColumns]:
+    """Convert SQL results into columns per entity.
+
+    States must be sorted by entity_id and last_updated
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    columns_by_entity_id: dict[str, HistoryColumns] = {}
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        columns_by_entity_id[metadata_id_to_entity_id[metadata_id]] = rows_to_columns(
+            group, _FIELD_MAP["state"], _FIELD_MAP["last_updated_ts"], start_time_ts
+        )
+    # Keep the order of the requested entities
+    return {
+        entity_id: columns_by_entity_id[entity_id]
+        for entity_id in entity_ids
+        if entity_id in columns_by_entity_id
+    }
@@ -31,3 +31,8 @@ class DatabaseOptimizer:
     # https://jira.mariadb.org/browse/MDEV-25020
     #
     slow_range_in_select: bool
+
+    # Purge states and events by deleting contiguous id ranges instead of
+    # lists of ids. Server databases can delete a primary key range without
+    # looking up each row in the index on the timestamp first.
+    purge_by_id_range: bool = False
@@ -1,12 +1,14 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -23,23 +25,36 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_events_id_range,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_id_range,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    disconnect_states_id_range,
     disconnect_states_rows,
     find_entity_ids_to_purge,
+    find_event_data_id_range,
+    find_event_not_to_purge_in_id_range,
     find_event_types_to_purge,
+    find_events_id_range_to_purge,
     find_events_to_purge,
+    find_events_to_purge_in_id_range,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_state_attributes_id_range,
+    find_state_not_to_purge_in_id_range,
+    find_states_id_range_to_purge,
     find_states_to_purge,
+    find_states_to_purge_in_id_range,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids_in_id_range,
+    find_unused_data_ids_in_id_range,
 )
 from .repack import repack_database
 from .util import chunked, retryable_database_job, session_scope
@@ -54,6 +69,35 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class IdRangePurgeProgress:
+    """Progress of purging states and events by id range.
+
+    All the rows with an id before the next id of a table have been
+    purged. The last id is the id of the newest row to purge when the
+    purge started. The ids are None until the purge of a table starts.
+    """
+
+    purge_before: datetime
+    next_state_id: int | None = None
+    last_state_id: int | None = None
+    next_attributes_id: int | None = None
+    last_attributes_id: int | None = None
+    next_event_id: int | None = None
+    last_event_id: int | None = None
+    next_data_id: int | None = None
+    last_data_id: int | None = None
+    states_purged: int = 0
+    attributes_purged: int = 0
+    events_purged: int = 0
+    event_data_purged: int = 0
+    finished: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress for diagnostics."""
+        return asdict(self) | {"purge_before": self.purge_before.isoformat()}
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -71,7 +115,9 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
-    with session_scope(session=instance.get_session()) as session:
+    with _purge_progress_scope(instance), session_scope(
+        session=instance.get_session()
+    ) as session:
         # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -80,6 +126,17 @@ def purge_old_data(
                 " remaining"
             )
             has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+        elif (
+            database_engine := instance.database_engine
+        ) and database_engine.optimizer.purge_by_id_range:
+            _LOGGER.debug("Purge running in new format by id range")
+            progress = _get_id_range_purge_progress(instance, purge_before)
+            has_more_to_purge |= _purge_states_and_attributes_by_id_range(
+                instance, session, states_batch_size, progress
+            )
+            has_more_to_purge |= _purge_events_and_data_by_id_range(
+                instance, session, events_batch_size, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -121,6 +178,8 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+        if purge_progress := instance.purge_progress:
+            purge_progress.finished = True
     if repack:
         repack_database(instance)
     return True
@@ -239,6 +298,220 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+@contextmanager
+def _purge_progress_scope(instance: Recorder) -> Generator[None, None, None]:
+    """Restore the purge progress if the purge is not committed.
+
+    The progress is advanced while purging, but the rows are only
+    deleted once the session is committed. Restoring the progress
+    makes the next purge start from the same ids again.
+    """
+    progress = instance.purge_progress
+    committed = None if progress is None else replace(progress)
+    try:
+        yield
+    except BaseException:
+        instance.purge_progress = committed
+        raise
+
+
+def _get_id_range_purge_progress(
+    instance: Recorder, purge_before: datetime
+) -> IdRangePurgeProgress:
+    """Return the progress of the purge by id range, starting a new one if needed."""
+    progress = instance.purge_progress
+    if progress is None or progress.finished or progress.purge_before != purge_before:
+        progress = instance.purge_progress = IdRangePurgeProgress(purge_before)
+    return progress
+
+
+def _purge_states_and_attributes_by_id_range(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    progress: IdRangePurgeProgress,
+) -> bool:
+    """Purge a range of states ids or a range of unused attributes ids.
+
+    The states are deleted in contiguous ranges of state ids, oldest first.
+    Once the newest state to purge has been reached, the state_attributes
+    table is scanned in ranges of ids for attributes no longer used by any
+    states. States recorded out of order with an id after the newest state
+    to purge are purged by the batches of ids afterwards.
+
+    Returns true if there are more states or attributes to purge.
+    """
+    chunk_size = states_batch_size * SQLITE_MAX_BIND_VARS
+    purge_before_ts = dt_util.utc_to_timestamp(progress.purge_before)
+    if progress.next_state_id is None or progress.last_state_id is None:
+        first_id, last_id = session.execute(
+            find_states_id_range_to_purge(purge_before_ts)
+        ).one()
+        progress.next_state_id = first_id or 0
+        progress.last_state_id = last_id if last_id is not None else -1
+    if progress.next_state_id <= progress.last_state_id:
+        _purge_states_id_range(
+            instance,
+            session,
+            progress,
+            purge_before_ts,
+            progress.next_state_id,
+            min(progress.next_state_id + chunk_size, progress.last_state_id + 1),
+        )
+        return True
+
+    if progress.next_attributes_id is None or progress.last_attributes_id is None:
+        first_id, last_id = session.execute(find_state_attributes_id_range()).one()
+        progress.next_attributes_id = first_id or 0
+        progress.last_attributes_id = last_id if last_id is not None else -1
+    if progress.next_attributes_id <= progress.last_attributes_id:
+        end_id = progress.next_attributes_id + chunk_size
+        if unused_attributes_ids := {
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_unused_attributes_ids_in_id_range(
+                    progress.next_attributes_id, end_id
+                )
+            )
+        }:
+            _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+            progress.attributes_purged += len(unused_attributes_ids)
+        progress.next_attributes_id = end_id
+        return True
+
+    return _purge_states_and_attributes_ids(
+        instance, session, states_batch_size, progress.purge_before
+    )
+
+
+def _purge_states_id_range(
+    instance: Recorder,
+    session: Session,
+    progress: IdRangePurgeProgress,
+    purge_before_ts: float,
+    start_id: int,
+    end_id: int,
+) -> None:
+    """Purge the states from start_id up to end_id."""
+    if (
+        session.execute(
+            find_state_not_to_purge_in_id_range(start_id, end_id, purge_before_ts)
+        ).first()
+        is None
+    ):
+        # See _purge_state_ids for why the states are disconnected first
+        session.execute(disconnect_states_id_range(start_id, end_id))
+        purged = (
+            session.connection()
+            .execute(delete_states_id_range(start_id, end_id))
+            .rowcount
+        )
+        instance.states_manager.evict_purged_state_id_range(start_id, end_id)
+    else:
+        # Some states in the range were recorded out of order
+        # and are newer than purge_before, keep them
+        state_ids = [
+            state_id
+            for (state_id,) in session.execute(
+                find_states_to_purge_in_id_range(start_id, end_id, purge_before_ts)
+            )
+        ]
+        for state_ids_chunk in chunked(state_ids, SQLITE_MAX_BIND_VARS):
+            _purge_state_ids(instance, session, set(state_ids_chunk))
+        purged = len(state_ids)
+    _LOGGER.debug("Purged %s states with ids %s-%s", purged, start_id, end_id - 1)
+    progress.states_purged += purged
+    progress.next_state_id = end_id
+
+
+def _purge_events_and_data_by_id_range(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    progress: IdRangePurgeProgress,
+) -> bool:
+    """Purge a range of events ids or a range of unused data ids.
+
+    See _purge_states_and_attributes_by_id_range.
+
+    Returns true if there are more events or event data to purge.
+    """
+    chunk_size = events_batch_size * SQLITE_MAX_BIND_VARS
+    purge_before_ts = dt_util.utc_to_timestamp(progress.purge_before)
+    if progress.next_event_id is None or progress.last_event_id is None:
+        first_id, last_id = session.execute(
+            find_events_id_range_to_purge(purge_before_ts)
+        ).one()
+        progress.next_event_id = first_id or 0
+        progress.last_event_id = last_id if last_id is not None else -1
+    if progress.next_event_id <= progress.last_event_id:
+        _purge_events_id_range(
+            session,
+            progress,
+            purge_before_ts,
+            progress.next_event_id,
+            min(progress.next_event_id + chunk_size, progress.last_event_id + 1),
+        )
+        return True
+
+    if progress.next_data_id is None or progress.last_data_id is None:
+        first_id, last_id = session.execute(find_event_data_id_range()).one()
+        progress.next_data_id = first_id or 0
+        progress.last_data_id = last_id if last_id is not None else -1
+    if progress.next_data_id <= progress.last_data_id:
+        end_id = progress.next_data_id + chunk_size
+        if unused_data_ids := {
+            data_id
+            for (data_id,) in session.execute(
+                find_unused_data_ids_in_id_range(progress.next_data_id, end_id)
+            )
+        }:
+            _purge_batch_data_ids(instance, session, unused_data_ids)
+            progress.event_data_purged += len(unused_data_ids)
+        progress.next_data_id = end_id
+        return True
+
+    return _purge_events_and_data_ids(
+        instance, session, events_batch_size, progress.purge_before
+    )
+
+
+def _purge_events_id_range(
+    session: Session,
+    progress: IdRangePurgeProgress,
+    purge_before_ts: float,
+    start_id: int,
+    end_id: int,
+) -> None:
+    """Purge the events from start_id up to end_id."""
+    if (
+        session.execute(
+            find_event_not_to_purge_in_id_range(start_id, end_id, purge_before_ts)
+        ).first()
+        is None
+    ):
+        purged = (
+            session.connection()
+            .execute(delete_events_id_range(start_id, end_id))
+            .rowcount
+        )
+    else:
+        # Some events in the range were recorded out of order
+        # and are newer than purge_before, keep them
+        event_ids = [
+            event_id
+            for (event_id,) in session.execute(
+                find_events_to_purge_in_id_range(start_id, end_id, purge_before_ts)
+            )
+        ]
+        for event_ids_chunk in chunked(event_ids, SQLITE_MAX_BIND_VARS):
+            _purge_event_ids(session, set(event_ids_chunk))
+        purged = len(event_ids)
+    _LOGGER.debug("Purged %s events with ids %s-%s", purged, start_id, end_id - 1)
+    progress.events_purged += purged
+    progress.next_event_id = end_id
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime
 ) -> tuple[set[int], set[int]]:
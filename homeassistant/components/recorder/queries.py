@@ -634,6 +634,164 @@ def find_states_to_purge(purge_before: float) -> StatementLambdaElement:
     )
 
 
+def find_states_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the first state_id and the state_id of the newest state to purge."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(States.state_id)).scalar_subquery(),
+            select(States.state_id)
+            .filter(States.last_updated_ts < purge_before)
+            .order_by(States.last_updated_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+
+
+def find_state_not_to_purge_in_id_range(
+    start_id: int, end_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find a state in the id range that must not be purged."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.state_id >= start_id)
+        .filter(States.state_id < end_id)
+        .filter(States.last_updated_ts >= purge_before)
+        .limit(1)
+    )
+
+
+def find_states_to_purge_in_id_range(
+    start_id: int, end_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find the states to purge in the id range."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.state_id >= start_id)
+        .filter(States.state_id < end_id)
+        .filter(States.last_updated_ts < purge_before)
+    )
+
+
+def disconnect_states_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Disconnect the states linked to the states in the id range."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= start_id)
+        .where(States.old_state_id < end_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Delete the states in the id range."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= start_id)
+        .where(States.state_id < end_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_state_attributes_id_range() -> StatementLambdaElement:
+    """Find the first and last attributes_id."""
+    return lambda_stmt(
+        lambda: select(
+            func.min(StateAttributes.attributes_id),
+            func.max(StateAttributes.attributes_id),
+        )
+    )
+
+
+def find_unused_attributes_ids_in_id_range(
+    start_id: int, end_id: int
+) -> StatementLambdaElement:
+    """Find the attributes ids in the id range not used by any states."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.attributes_id >= start_id)
+        .filter(StateAttributes.attributes_id < end_id)
+        .filter(
+            ~select(States.state_id)
+            .filter(States.attributes_id == StateAttributes.attributes_id)
+            .exists()
+        )
+    )
+
+
+def find_events_id_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the first event_id and the event_id of the newest event to purge."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(Events.event_id)).scalar_subquery(),
+            select(Events.event_id)
+            .filter(Events.time_fired_ts < purge_before)
+            .order_by(Events.time_fired_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+
+
+def find_event_not_to_purge_in_id_range(
+    start_id: int, end_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find an event in the id range that must not be purged."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.event_id >= start_id)
+        .filter(Events.event_id < end_id)
+        .filter(Events.time_fired_ts >= purge_before)
+        .limit(1)
+    )
+
+
+def find_events_to_purge_in_id_range(
+    start_id: int, end_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find the events to purge in the id range."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.event_id >= start_id)
+        .filter(Events.event_id < end_id)
+        .filter(Events.time_fired_ts < purge_before)
+    )
+
+
+def delete_events_id_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Delete the events in the id range."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= start_id)
+        .where(Events.event_id < end_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_event_data_id_range() -> StatementLambdaElement:
+    """Find the first and last data_id."""
+    return lambda_stmt(
+        lambda: select(func.min(EventData.data_id), func.max(EventData.data_id))
+    )
+
+
+def find_unused_data_ids_in_id_range(
+    start_id: int, end_id: int
+) -> StatementLambdaElement:
+    """Find the data ids in the id range not used by any events."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.data_id >= start_id)
+        .filter(EventData.data_id < end_id)
+        .filter(
+            ~select(Events.event_id)
+            .filter(Events.data_id == EventData.data_id)
+            .exists()
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime,
 ) -> StatementLambdaElement:
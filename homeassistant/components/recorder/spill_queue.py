@@ -0,0 +1,220 @@
+"""Disk backed overflow for the recorder queue.
+
+Events are spilled as JSON, so the attributes of spilled states and the
+data of spilled events are restored with JSON types: tuples and sets
+become lists, datetimes become ISO 8601 strings and non string keys
+become strings. The recorder stores them as JSON as well, so the rows
+of a spilled event match the rows it would have had if it was recorded
+without being spilled.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, BinaryIO
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+SEGMENT_SUFFIX = ".jsonl"
+
+
+def _state_to_spill(state: State | None) -> dict[str, Any] | None:
+    """Convert a state to a compact dict that can be spilled to disk."""
+    if state is None:
+        return None
+    last_changed = state.last_changed
+    context = state.context
+    return {
+        "e": state.entity_id,
+        "s": state.state,
+        "a": state.attributes,
+        "lu": dt_util.utc_to_timestamp(state.last_updated),
+        "lc": None
+        if last_changed == state.last_updated
+        else dt_util.utc_to_timestamp(last_changed),
+        "c": (context.id, context.user_id, context.parent_id),
+    }
+
+
+def _state_from_spill(data: dict[str, Any] | None) -> State | None:
+    """Convert a spilled state back to a state."""
+    if data is None:
+        return None
+    context_id, user_id, parent_id = data["c"]
+    last_updated = dt_util.utc_from_timestamp(data["lu"])
+    return State(
+        data["e"],
+        data["s"],
+        data["a"],
+        None if data["lc"] is None else dt_util.utc_from_timestamp(data["lc"]),
+        last_updated,
+        Context(user_id, parent_id, context_id),
+        validate_entity_id=False,
+    )
+
+
+def event_to_spill(event: Event) -> bytes:
+    """Serialize an event to a single line that can be spilled to disk."""
+    data: dict[str, Any] = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_to_spill(data.get("old_state")),
+            "new_state": _state_to_spill(data.get("new_state")),
+        }
+    context = event.context
+    return json_bytes(
+        {
+            "t": event.event_type,
+            "d": data,
+            "o": event.origin.value,
+            "f": dt_util.utc_to_timestamp(event.time_fired),
+            "c": (context.id, context.user_id, context.parent_id),
+        }
+    )
+
+
+def event_from_spill(line: bytes) -> Event:
+    """Deserialize an event that was spilled to disk."""
+    spilled: dict[str, Any] = json_loads_object(line)
+    event_type: str = spilled["t"]
+    data: dict[str, Any] = spilled["d"]
+    if event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_from_spill(data["old_state"]),
+            "new_state": _state_from_spill(data["new_state"]),
+        }
+    context_id, user_id, parent_id = spilled["c"]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(spilled["o"]),
+        dt_util.utc_from_timestamp(spilled["f"]),
+        Context(user_id, parent_id, context_id),
+    )
+
+
+class SpillQueue:
+    """An append-only queue of serialized events stored in segment files.
+
+    Events are appended to the newest segment and read back in order
+    from the oldest one. A segment is removed once it has been read
+    completely and a new segment is started once the newest one grows
+    beyond SEGMENT_MAX_BYTES.
+
+    The read position is only kept in memory, so a segment that was
+    partially read when Home Assistant stopped is read again from the
+    start on the next run.
+
+    This class is thread-safe, but its methods do I/O and must
+    not be called from the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spill queue."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._segments: list[int] = []
+        self._writer: BinaryIO | None = None
+        self._reader: BinaryIO | None = None
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of events that have not been read yet."""
+        return self._size
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment file."""
+        return os.path.join(self.path, f"{segment:08d}{SEGMENT_SUFFIX}")
+
+    def load(self) -> None:
+        """Find segments left over from a previous run."""
+        with self._lock:
+            if not os.path.isdir(self.path):
+                return
+            self._segments = sorted(
+                int(name.removesuffix(SEGMENT_SUFFIX))
+                for name in os.listdir(self.path)
+                if name.endswith(SEGMENT_SUFFIX)
+                and name.removesuffix(SEGMENT_SUFFIX).isdigit()
+            )
+            size = 0
+            for segment in self._segments:
+                with open(self._segment_path(segment), "rb") as segment_file:
+                    size += sum(1 for _ in segment_file)
+            self._size = size
+            if size:
+                _LOGGER.info("Found %s events spilled to disk by a previous run", size)
+
+    def append(self, lines: list[bytes]) -> None:
+        """Append serialized events to the newest segment."""
+        with self._lock:
+            writer = self._writer
+            if writer is None or writer.tell() >= SEGMENT_MAX_BYTES:
+                if writer is not None:
+                    writer.close()
+                os.makedirs(self.path, exist_ok=True)
+                segment = self._segments[-1] + 1 if self._segments else 1
+                self._segments.append(segment)
+                # pylint: disable-next=consider-using-with
+                writer = self._writer = open(  # noqa: SIM115
+                    self._segment_path(segment), "ab"
+                )
+            writer.write(b"\n".join(lines))
+            writer.write(b"\n")
+            writer.flush()
+            self._size += len(lines)
+
+    def read(self, max_lines: int) -> list[bytes]:
+        """Read up to max_lines serialized events in the order they were appended."""
+        lines: list[bytes] = []
+        with self._lock:
+            while len(lines) < max_lines and self._segments:
+                if self._reader is None:
+                    # pylint: disable-next=consider-using-with
+                    self._reader = open(  # noqa: SIM115
+                        self._segment_path(self._segments[0]), "rb"
+                    )
+                reader = self._reader
+                while len(lines) < max_lines:
+                    # A line without a newline can only be left
+                    # behind by a run that was interrupted mid-write
+                    if not (line := reader.readline()).endswith(b"\n"):
+                        break
+                    lines.append(line[:-1])
+                else:
+                    break
+                # The segment was read completely; appends after this
+                # point start a new segment since the lock is held
+                self._remove_oldest_segment()
+            self._size = max(self._size - len(lines), 0) if self._segments else 0
+        return lines
+
+    def _remove_oldest_segment(self) -> None:
+        """Remove the oldest segment after it has been read completely."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        segment = self._segments.pop(0)
+        if not self._segments and self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        os.unlink(self._segment_path(segment))
+
+    def close(self) -> None:
+        """Close the open segment files."""
+        with self._lock:
+            for file in (self._reader, self._writer):
+                if file is not None:
+                    file.close()
+            self._reader = self._writer = None
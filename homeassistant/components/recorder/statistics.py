@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from statistics import mean
@@ -22,7 +23,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
-from homeassistant.core import HomeAssistant, callback, valid_entity_id
+from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
@@ -43,6 +44,7 @@ from homeassistant.util.unit_conversion import (
     VolumeConverter,
 )
 
+from . import history
 from .const import (
     DOMAIN,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
@@ -67,6 +69,7 @@ from .models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
+from .statistics_accumulator import PeriodAggregate
 from .util import (
     execute,
     execute_stmt_lambda_element,
@@ -148,6 +151,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reducing fewer rows than this is faster without numpy, numpy is
+# only imported when reducing more rows and is not required
+VECTORIZED_REDUCE_MIN_ROWS = 100
+
 
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
@@ -488,6 +495,7 @@ def _compile_statistics(
     # Return if we already have 5-minute statistics for the requested period
     if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
         _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
+        instance.statistics_accumulator.discard_until(end)
         return modified_statistic_ids
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
@@ -514,6 +522,10 @@ def _compile_statistics(
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
+    # The states before the end of the period are only
+    # needed to know the state at the start of the next one
+    instance.statistics_accumulator.discard_until(end)
+
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -542,6 +554,87 @@ def _compile_statistics(
     return modified_statistic_ids
 
 
+def get_period_aggregates_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime,
+    end: datetime,
+    entity_ids: list[str],
+) -> tuple[dict[str, PeriodAggregate | None], MutableMapping[str, list[State]]]:
+    """Return what is needed to compile the mean, min and max of a period.
+
+    The running aggregates of the measurements accumulated by the recorder
+    are returned when possible. The significant states of the other
+    entities are read from the database.
+
+    Note: This may query the database and must not be run in the event loop
+    """
+    accumulator = get_instance(hass).statistics_accumulator
+    if (accumulated := accumulator.get_aggregates(start, end, entity_ids)) is None:
+        _LOGGER.debug("Reading states for %s-%s from the database", start, end)
+        return {}, _get_period_states_from_database(
+            hass, session, start, end, entity_ids, True
+        )
+    aggregates, unknown_entity_ids = accumulated
+    if not unknown_entity_ids:
+        return aggregates, {}
+    from_database = _get_period_states_from_database(
+        hass, session, start, end, unknown_entity_ids, True
+    )
+    accumulator.add_start_states(start, unknown_entity_ids, from_database)
+    return aggregates, from_database
+
+
+def get_period_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime,
+    end: datetime,
+    state_classes: Mapping[str, str],
+) -> MutableMapping[str, list[State]]:
+    """Return the states to compile the sum of a period.
+
+    state_classes maps the entity_ids to their state class. The states
+    are taken from the states accumulated by the recorder when possible
+    and are otherwise read from the database.
+
+    Note: This may query the database and must not be run in the event loop
+    """
+    accumulator = get_instance(hass).statistics_accumulator
+    if (accumulated := accumulator.get_states(start, end, state_classes)) is None:
+        _LOGGER.debug("Reading states for %s-%s from the database", start, end)
+        return _get_period_states_from_database(
+            hass, session, start, end, list(state_classes), False
+        )
+    states, unknown_entity_ids = accumulated
+    if unknown_entity_ids:
+        from_database = _get_period_states_from_database(
+            hass, session, start, end, unknown_entity_ids, False
+        )
+        accumulator.add_start_states(start, unknown_entity_ids, from_database)
+        states.update(from_database)
+    return states
+
+
+def _get_period_states_from_database(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime,
+    end: datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> MutableMapping[str, list[State]]:
+    """Read the states of a period, including the state at its start."""
+    return history.get_full_significant_states_with_session(
+        hass,
+        session,
+        start - timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+    )
+
+
 def _adjust_sum_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -816,6 +909,12 @@ def _reduce_statistics(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily or monthly statistics."""
+    if (
+        sum(map(len, stats.values())) >= VECTORIZED_REDUCE_MIN_ROWS
+        and (reduced := _reduce_statistics_vectorized(stats, period_start_end, types))
+        is not None
+    ):
+        return reduced
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     period_seconds = period.total_seconds()
     _want_mean = "mean" in types
@@ -867,6 +966,106 @@ def _reduce_statistics(
     return result
 
 
+def _period_boundaries(
+    first: float,
+    last: float,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> tuple[list[float], list[float]]:
+    """Return the starts and ends of the periods from first to last."""
+    starts: list[float] = []
+    ends: list[float] = []
+    start, end = period_start_end(first)
+    while True:
+        starts.append(start)
+        ends.append(end)
+        if end > last:
+            return starts, ends
+        start, end = period_start_end(end)
+
+
+def _reduce_statistics_vectorized(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Reduce hourly statistics to daily or monthly statistics with numpy.
+
+    The rows of each period are found by looking up the start of
+    each row in the period boundaries and the mean, min and max of
+    each period are reduced with array operations.
+
+    Returns None if numpy is not installed.
+    """
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    if not (stat_lists := [stat_list for stat_list in stats.values() if stat_list]):
+        return result
+    period_starts, period_ends = _period_boundaries(
+        min(stat_list[0]["start"] for stat_list in stat_lists),
+        max(stat_list[-1]["start"] for stat_list in stat_lists),
+        period_start_end,
+    )
+    boundaries = np.array(period_starts)
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    for statistic_id, stat_list in stats.items():
+        if not stat_list:
+            continue
+        period_idx = (
+            np.searchsorted(
+                boundaries, [row["start"] for row in stat_list], side="right"
+            )
+            - 1
+        )
+        first_idx = np.flatnonzero(np.diff(period_idx, prepend=-1))
+        last_idx: list[int] = np.append(first_idx[1:] - 1, len(stat_list) - 1).tolist()
+        reduced: dict[str, list[float | None]] = {}
+        for key in ("mean", "min", "max"):
+            if key not in types:
+                continue
+            # None is converted to NaN
+            values = np.array([row.get(key) for row in stat_list], dtype=np.float64)
+            if key == "mean":
+                finite = ~np.isnan(values)
+                sums = np.add.reduceat(np.where(finite, values, 0.0), first_idx)
+                counts = np.add.reduceat(finite.astype(np.int64), first_idx)
+                reduced_values = np.divide(
+                    sums, counts, out=np.full(len(first_idx), np.nan), where=counts > 0
+                )
+            elif key == "min":
+                reduced_values = np.fmin.reduceat(values, first_idx)
+            else:
+                reduced_values = np.fmax.reduceat(values, first_idx)
+            reduced[key] = [
+                None if math.isnan(value) else value
+                for value in reduced_values.tolist()
+            ]
+        rows = result[statistic_id]
+        for idx, (period, last) in enumerate(
+            zip(period_idx[first_idx].tolist(), last_idx, strict=True)
+        ):
+            row: StatisticsRow = {
+                "start": period_starts[period],
+                "end": period_ends[period],
+            }
+            for key, key_values in reduced.items():
+                row[key] = key_values[idx]  # type: ignore[literal-required]
+            last_stat = stat_list[last]
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
+    return result
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
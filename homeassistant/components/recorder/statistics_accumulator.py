@@ -0,0 +1,441 @@
+"""Keep running aggregates of recent states for compiling short term statistics."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, MutableMapping
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import math
+from typing import Any
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+from .db_schema import StatisticsShortTerm
+from .history.const import SIGNIFICANT_DOMAINS
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+# The attributes statistics platforms use to describe their states
+ATTR_LAST_RESET = "last_reset"
+ATTR_STATE_CLASS = "state_class"
+STATE_CLASS_MEASUREMENT = "measurement"
+STATE_CLASS_TOTAL_INCREASING = "total_increasing"
+SUM_STATE_CLASSES = {"total", STATE_CLASS_TOTAL_INCREASING}
+
+
+def _float_or_none(state: str) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        fstate = float(state)
+    except (ValueError, TypeError):
+        return None
+    return fstate if math.isfinite(fstate) else None
+
+
+@dataclass(slots=True)
+class PeriodAggregate:
+    """Running aggregate of the float states of an entity during a period.
+
+    Only the significant states are aggregated, which are the states
+    the history returns when significant_changes_only is set.
+    """
+
+    first_timestamp: float
+    last_timestamp: float
+    last: float
+    min: float
+    max: float
+    time_weighted_sum: float
+    # The last aggregated state, all aggregated states have its unit
+    state: State
+
+    def add(self, fstate: float, timestamp: float, state: State) -> None:
+        """Add a float state."""
+        self.time_weighted_sum += self.last * (timestamp - self.last_timestamp)
+        self.last_timestamp = timestamp
+        self.last = fstate
+        if fstate < self.min:
+            self.min = fstate
+        elif fstate > self.max:
+            self.max = fstate
+        self.state = state
+
+    def mean(self, end: datetime) -> float:
+        """Return the time weighted average until end."""
+        end_ts = dt_util.utc_to_timestamp(end)
+        if (period_seconds := end_ts - self.first_timestamp) == 0:
+            # Same as the sensor statistics when the only
+            # state changed at the exact end of the period
+            return 0.0
+        accumulated = self.time_weighted_sum + self.last * (
+            end_ts - self.last_timestamp
+        )
+        return accumulated / period_seconds
+
+
+def _same_cycle(previous: State, state: State) -> bool:
+    """Return if two states of a sum have the same unit and last reset."""
+    previous_attributes = previous.attributes
+    attributes = state.attributes
+    return previous_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == attributes.get(
+        ATTR_UNIT_OF_MEASUREMENT
+    ) and previous_attributes.get(ATTR_LAST_RESET) == attributes.get(ATTR_LAST_RESET)
+
+
+class _Period:
+    """The states of an entity during a period.
+
+    Measurements are kept as a running aggregate. Sums keep their float
+    states, but a state between two states of the same cycle is dropped
+    when the sum over the period does not depend on it.
+    """
+
+    __slots__ = (
+        "aggregate",
+        "consistent",
+        "start_known",
+        "start_state",
+        "state_class",
+        "states",
+    )
+
+    def __init__(
+        self,
+        start_timestamp: float,
+        start_known: bool,
+        start_state: State | None,
+        state_class: Any,
+    ) -> None:
+        """Initialize a period with the state at its start."""
+        self.start_known = start_known
+        self.start_state = start_state
+        self.state_class = state_class
+        # False if the state class or unit changed during the period
+        self.consistent = True
+        self.aggregate: PeriodAggregate | None = None
+        self.states: list[tuple[float, State]] = []
+        if start_state is None or (fstate := _float_or_none(start_state.state)) is None:
+            return
+        if state_class == STATE_CLASS_MEASUREMENT:
+            self.aggregate = PeriodAggregate(
+                start_timestamp,
+                start_timestamp,
+                fstate,
+                fstate,
+                fstate,
+                0.0,
+                start_state,
+            )
+        elif state_class in SUM_STATE_CLASSES:
+            self.states.append((fstate, start_state))
+
+    def add(self, state: State, timestamp: float) -> None:
+        """Add a state recorded during the period."""
+        if not self.consistent:
+            return
+        if state.attributes.get(ATTR_STATE_CLASS) != self.state_class:
+            self._set_inconsistent()
+            return
+        if (fstate := _float_or_none(state.state)) is None:
+            return
+        if self.state_class == STATE_CLASS_MEASUREMENT:
+            if not (
+                state.domain in SIGNIFICANT_DOMAINS
+                or state.last_changed == state.last_updated
+            ):
+                return
+            if (aggregate := self.aggregate) is None:
+                self.aggregate = PeriodAggregate(
+                    timestamp, timestamp, fstate, fstate, fstate, 0.0, state
+                )
+            elif aggregate.state.attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            ) != state.attributes.get(ATTR_UNIT_OF_MEASUREMENT):
+                self._set_inconsistent()
+            else:
+                aggregate.add(fstate, timestamp, state)
+            return
+        if self.state_class not in SUM_STATE_CLASSES:
+            return
+        states = self.states
+        if len(states) >= 2:
+            before_previous_fstate, before_previous = states[-2]
+            previous_fstate, previous = states[-1]
+            if (
+                _same_cycle(before_previous, previous)
+                and _same_cycle(previous, state)
+                and (
+                    self.state_class != STATE_CLASS_TOTAL_INCREASING
+                    or 0 <= before_previous_fstate <= previous_fstate <= fstate
+                )
+            ):
+                # The previous state adds nothing to the sum of the period
+                states[-1] = (fstate, state)
+                return
+        states.append((fstate, state))
+
+    def _set_inconsistent(self) -> None:
+        """Stop accumulating, the period must be read from the database."""
+        self.consistent = False
+        self.aggregate = None
+        self.states = []
+
+
+class _EntityStates:
+    """The accumulated periods of an entity."""
+
+    __slots__ = ("last_state", "last_timestamp", "periods", "start_known")
+
+    def __init__(
+        self, start_known: bool, last_state: State | None, last_timestamp: float
+    ) -> None:
+        """Initialize the entity."""
+        # If the last state is known, it is None if the entity has no state
+        self.start_known = start_known
+        self.last_state = last_state
+        self.last_timestamp = last_timestamp
+        # Periods with states by their start timestamp, in order
+        self.periods: dict[float, _Period] = {}
+
+    def start_of(self, period_start: float) -> tuple[bool, State | None]:
+        """Return the state at the start of a period without states."""
+        for start, period in self.periods.items():
+            if start > period_start:
+                return period.start_known, period.start_state
+        return self.start_known, self.last_state
+
+
+class StatisticsAccumulator:
+    """Accumulate the states recorded for statistics platforms.
+
+    States are aggregated per short term statistics period as they are
+    recorded, so the states of a period do not need to be queried from
+    the database again when the period is compiled. The memory used
+    depends on the number of periods that were not compiled yet, not
+    on how often the states change.
+
+    The accumulator only knows about states recorded since it was last
+    reset. Periods that start before that, periods that have already
+    been discarded and entities whose state at the start of a period
+    is not known must be read from the database instead.
+
+    This class is not thread-safe and must be used from the recorder
+    thread, except for invalidate which may be called from any thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self.domains: set[str] = set()
+        self._entities: dict[str, _EntityStates] = {}
+        self._covered_since = 0.0
+        self._discarded_until = 0.0
+        self._invalidated = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all states and only trust states recorded from now on."""
+        self._entities.clear()
+        self._covered_since = dt_util.utc_to_timestamp(dt_util.utcnow())
+        self._discarded_until = 0.0
+        self._invalidated = False
+
+    def add_domain(self, domain: str) -> None:
+        """Accumulate the states of a domain with a statistics platform.
+
+        The accumulator is reset since the states of the domain
+        recorded before are not known.
+        """
+        self.domains.add(domain)
+        self.reset()
+
+    def invalidate(self) -> None:
+        """Mark the accumulated states as incomplete.
+
+        Called when states may not be recorded in the order they
+        happened or at all. The accumulator is reset the next
+        time it is used.
+        """
+        self._invalidated = True
+
+    def add_state(self, state: State) -> None:
+        """Add a state that was recorded."""
+        if state.domain not in self.domains:
+            return
+        timestamp = dt_util.utc_to_timestamp(state.last_updated)
+        if timestamp < self._discarded_until:
+            # The period this state belongs to may already have been compiled
+            self._invalidated = True
+            return
+        if (entity := self._entities.get(state.entity_id)) is None:
+            entity = self._entities[state.entity_id] = _EntityStates(
+                False, None, timestamp
+            )
+        elif timestamp < entity.last_timestamp:
+            self._invalidated = True
+            return
+        period_start = timestamp - timestamp % PERIOD_SECONDS
+        if (period := entity.periods.get(period_start)) is None:
+            period = entity.periods[period_start] = _Period(
+                period_start,
+                entity.start_known,
+                entity.last_state,
+                state.attributes.get(ATTR_STATE_CLASS),
+            )
+        period.add(state, timestamp)
+        entity.start_known = True
+        entity.last_state = state
+        entity.last_timestamp = timestamp
+
+    def remove_entity(self, entity_id: str) -> None:
+        """Forget an entity that was removed."""
+        self._entities.pop(entity_id, None)
+
+    def _covered_period_start(
+        self, start_time: datetime, end_time: datetime
+    ) -> float | None:
+        """Return the start timestamp of a period if it is covered."""
+        if self._invalidated:
+            _LOGGER.debug("Accumulated statistics states are incomplete, resetting")
+            self.reset()
+            return None
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        if (
+            start_time_ts < self._covered_since
+            or start_time_ts < self._discarded_until
+            or start_time_ts % PERIOD_SECONDS
+            or dt_util.utc_to_timestamp(end_time) - start_time_ts != PERIOD_SECONDS
+        ):
+            return None
+        return start_time_ts
+
+    def get_aggregates(
+        self, start_time: datetime, end_time: datetime, entity_ids: Iterable[str]
+    ) -> tuple[dict[str, PeriodAggregate | None], list[str]] | None:
+        """Return the aggregates of measurements during start_time - end_time.
+
+        The aggregate of an entity is None if it has states, but none of
+        them is a float. Entities without states are left out. The
+        entities that are not known or that were not measurements during
+        the whole period are returned separately. Returns None if the
+        period is not covered.
+        """
+        if (period_start := self._covered_period_start(start_time, end_time)) is None:
+            return None
+        result: dict[str, PeriodAggregate | None] = {}
+        unknown: list[str] = []
+        for entity_id in entity_ids:
+            if (entity := self._entities.get(entity_id)) is None:
+                unknown.append(entity_id)
+                continue
+            if (period := entity.periods.get(period_start)) is None:
+                start_known, start_state = entity.start_of(period_start)
+                if not start_known:
+                    unknown.append(entity_id)
+                elif start_state is not None:
+                    result[entity_id] = _Period(
+                        period_start, True, start_state, STATE_CLASS_MEASUREMENT
+                    ).aggregate
+                continue
+            if (
+                not period.start_known
+                or not period.consistent
+                or period.state_class != STATE_CLASS_MEASUREMENT
+            ):
+                unknown.append(entity_id)
+                continue
+            result[entity_id] = period.aggregate
+        return result, unknown
+
+    def get_states(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        state_classes: Mapping[str, str],
+    ) -> tuple[MutableMapping[str, list[State]], list[str]] | None:
+        """Return the float states of sums during start_time - end_time.
+
+        state_classes maps the entity_ids to the state class the sums are
+        compiled for. The result matches the full states the history would
+        return, including the state at start_time, except for non float
+        states and states which do not change the sum. The entities that
+        are not known or that had another state class during the period are
+        returned separately. Returns None if the period is not covered.
+        """
+        if (period_start := self._covered_period_start(start_time, end_time)) is None:
+            return None
+        result: dict[str, list[State]] = {}
+        unknown: list[str] = []
+        for entity_id, state_class in state_classes.items():
+            if (entity := self._entities.get(entity_id)) is None:
+                unknown.append(entity_id)
+                continue
+            if (period := entity.periods.get(period_start)) is None:
+                start_known, start_state = entity.start_of(period_start)
+                if not start_known:
+                    unknown.append(entity_id)
+                elif start_state is not None:
+                    result[entity_id] = [
+                        state
+                        for _, state in _Period(
+                            period_start, True, start_state, state_class
+                        ).states
+                    ]
+                continue
+            if (
+                not period.start_known
+                or not period.consistent
+                or period.state_class != state_class
+            ):
+                unknown.append(entity_id)
+                continue
+            result[entity_id] = [state for _, state in period.states]
+        return result, unknown
+
+    def add_start_states(
+        self,
+        start_time: datetime,
+        entity_ids: Iterable[str],
+        states: MutableMapping[str, list[State]],
+    ) -> None:
+        """Add the state at the end of a period of entities that were not known.
+
+        states is the history read from the database during the period
+        starting at start_time for the entity_ids the accumulator did not
+        know. The entities had no states recorded during the period.
+        """
+        if dt_util.utc_to_timestamp(start_time) < self._covered_since:
+            return
+        for entity_id in entity_ids:
+            if (
+                entity_id.partition(".")[0] not in self.domains
+                or entity_id in self._entities
+            ):
+                continue
+            if entity_states := states.get(entity_id):
+                last_state = entity_states[-1]
+                self._entities[entity_id] = _EntityStates(
+                    True,
+                    last_state,
+                    dt_util.utc_to_timestamp(last_state.last_updated),
+                )
+            else:
+                self._entities[entity_id] = _EntityStates(True, None, 0.0)
+
+    def discard_until(self, end_time: datetime) -> None:
+        """Discard the periods which end before end_time, they were compiled."""
+        end_time_ts = dt_util.utc_to_timestamp(end_time)
+        if end_time_ts <= self._discarded_until:
+            return
+        self._discarded_until = end_time_ts
+        for entity in self._entities.values():
+            periods = entity.periods
+            for period_start in [
+                period_start
+                for period_start in periods
+                if period_start + PERIOD_SECONDS <= end_time_ts
+            ]:
+                del periods[period_start]
@@ -1,13 +1,14 @@
 """Support managing StateAttributes."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, MutableMapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
@@ -28,6 +29,13 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of serialized attributes to cache in memory
+#
+# States share their attributes object when the attributes did not
+# change or have the same content as another state, so keeping the
+# serialized form for recently seen objects avoids encoding them again.
+SERIALIZED_CACHE_SIZE = 2048
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -42,9 +50,48 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         self.active = True  # always active
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
         self._entity_sources = entity_sources(recorder.hass)
+        # (id of attributes, domain, integration) ->
+        #   (attributes, domain excludes, integration excludes, serialized)
+        self._serialized: MutableMapping[
+            tuple[int, str, str | None],
+            tuple[Any, set[str] | None, set[str] | None, bytes],
+        ] = LRU(SERIALIZED_CACHE_SIZE)
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
+        state: State | None = event.data.get("new_state")
+        if state is None:
+            return self._serialize_from_event(event)
+        # Attributes are read only so the serialized form can be reused as
+        # long as the same object is seen and the excludes did not change.
+        attributes = state.attributes
+        domain = state.domain
+        entity_info = self._entity_sources.get(state.entity_id)
+        integration = entity_info["domain"] if entity_info else None
+        exclude_attributes_by_domain = self._exclude_attributes_by_domain
+        domain_excludes = exclude_attributes_by_domain.get(domain)
+        integration_excludes = (
+            exclude_attributes_by_domain.get(integration) if integration else None
+        )
+        key = (id(attributes), domain, integration)
+        if (
+            (cached := self._serialized.get(key))
+            and cached[0] is attributes
+            and cached[1] is domain_excludes
+            and cached[2] is integration_excludes
+        ):
+            return cached[3]
+        if (serialized := self._serialize_from_event(event)) is not None:
+            self._serialized[key] = (
+                attributes,
+                domain_excludes,
+                integration_excludes,
+                serialized,
+            )
+        return serialized
+
+    def _serialize_from_event(self, event: Event) -> bytes | None:
+        """Serialize event data without using the cache."""
         try:
             return StateAttributes.shared_attrs_bytes_from_event(
                 event,
@@ -80,6 +80,17 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(self, start_id: int, end_id: int) -> None:
+        """Evict the states purged from start_id up to end_id from the committed states.
+
+        When we purge states we need to make sure the next call to record a state
+        does not link the old_state_id to the purged state.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if start_id <= state_id < end_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
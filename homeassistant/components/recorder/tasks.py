@@ -14,7 +14,7 @@ from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_COMPILE_STATISTICS
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -281,6 +281,18 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass(slots=True)
+class SpillDrainTask(RecorderTask):
+    """Record events that were spilled to disk."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._drain_spill_queue()
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
@@ -320,6 +332,8 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if hasattr(platform, INTEGRATION_PLATFORM_COMPILE_STATISTICS):
+            instance.statistics_accumulator.add_domain(domain)
 
 
 @dataclass(slots=True)
@@ -132,7 +132,7 @@ async def ws_get_statistic_during_period(
 
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
-    connection.send_message(
+    connection.send_result_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_statistic_during_period,
             hass,
@@ -201,7 +201,7 @@ async def ws_handle_get_statistics_during_period(
 
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
-    connection.send_message(
+    connection.send_result_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_statistics_during_period,
             hass,
@@ -256,7 +256,7 @@ async def ws_handle_list_statistic_ids(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """Fetch a list of available statistic_id."""
-    connection.send_message(
+    connection.send_result_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_list_statistic_ids,
             hass,
@@ -500,13 +500,17 @@ def ws_info(
     migration_is_live = async_migration_is_live(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    purge_progress = instance.purge_progress if instance else None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": instance.max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress.as_dict() if purge_progress else None,
         "recording": recording,
+        "spill_backlog": instance.spill_backlog,
+        "spill_drain_rate": instance.spill_drain_rate,
         "thread_running": thread_alive,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -173,6 +173,29 @@ class SensorEntity(Entity):
     _last_reset_reported = False
     _sensor_option_display_precision: int | None = None
     _sensor_option_unit_of_measurement: str | None | UndefinedType = UNDEFINED
+    _static_attributes_sources = (
+        *Entity._static_attributes_sources,
+        "_attr_native_unit_of_measurement",
+        "_attr_options",
+        "_attr_state_class",
+        "_attr_suggested_unit_of_measurement",
+        "_sensor_option_unit_of_measurement",
+    )
+    _static_attribute_properties = (
+        *Entity._static_attribute_properties,
+        "native_unit_of_measurement",
+        "options",
+        "state_class",
+        "suggested_unit_of_measurement",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the static attributes of sensors using the base implementation."""
+        super().__init_subclass__(**kwargs)
+        if "_cache_static_attributes" not in cls.__dict__:
+            cls._cache_static_attributes = not cls._static_properties_overridden(
+                SensorEntity
+            )
 
     @callback
     def add_to_platform_start(
@@ -331,6 +354,11 @@ class SensorEntity(Entity):
 
         return None
 
+    def _static_attributes_key(self) -> tuple[Any, ...]:
+        """Return the values the cached static state attributes were derived from."""
+        # The unit of temperature sensors follows the configured unit system
+        return (*super()._static_attributes_key(), self.hass.config.units)
+
     def _get_initial_suggested_unit(self) -> str | UndefinedType:
         """Return the initial unit."""
         # Unit suggested by the integration
@@ -14,7 +14,6 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components.recorder import (
     DOMAIN as RECORDER_DOMAIN,
     get_instance,
-    history,
     statistics,
     util as recorder_util,
 )
@@ -23,6 +22,7 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.statistics_accumulator import PeriodAggregate
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -418,37 +418,42 @@ def _compile_statistics(  # noqa: C901
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
     # Get history between start and end
-    entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
-    ]
+    entities_full_history = {
+        i.entity_id: i.attributes[ATTR_STATE_CLASS]
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id]
+    }
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = statistics.get_period_states_with_session(
+            hass, session, start, end, entities_full_history
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    aggregates: dict[str, PeriodAggregate | None] = {}
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        aggregates, _history_list = statistics.get_period_aggregates_with_session(
+            hass, session, start, end, entities_significant_history
         )
         history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in aggregates:
+            if (aggregate := aggregates[entity_id]) is None:
+                continue
+            # Unit conversions are increasing affine functions, so the
+            # converted min, max and mean are those of the converted states
+            entities_with_float_states[entity_id] = [
+                (aggregate.min, aggregate.state),
+                (aggregate.max, aggregate.state),
+                (aggregate.mean(end), aggregate.state),
+            ]
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -529,23 +534,29 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
+        if entity_id in aggregates:
+            # The float states are the min, max and mean of the period
+            stat["min"], stat["max"], stat["mean"] = (
+                fstate for fstate, _ in valid_float_states
             )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(
+                        zip(*valid_float_states),  # type: ignore[typeddict-item]
+                        1,
+                    )
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(
+                        zip(*valid_float_states),  # type: ignore[typeddict-item]
+                        1,
+                    )
                 )
-            )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
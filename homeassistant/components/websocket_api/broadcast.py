@@ -0,0 +1,125 @@
+"""Broadcast state changes to the subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from functools import partial
+from typing import Final
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from . import messages
+
+DATA_ENTITIES_BROADCAST: Final = "websocket_api_entities_broadcast"
+
+_SendMessage = Callable[[Hashable, str, Callable[[], str]], None]
+_Subscription = tuple[frozenset[str], User, _SendMessage, int]
+_Group = tuple[frozenset[str], User, list[tuple[_SendMessage, int]]]
+
+
+class EntitiesBroadcast:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves all the subscriptions. The
+    subscriptions are grouped by entity filter and by user, the scope the
+    permissions are checked for, so each state change is filtered and
+    checked once per group instead of once per subscription. The state
+    diff message is serialized once and only the message id is spliced
+    in for each subscription.
+
+    The messages are sent as collapsible messages so a connection that
+    cannot keep up only has the latest state of each entity queued.
+    """
+
+    __slots__ = ("_hass", "_subscriptions", "_groups", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the broadcast."""
+        self._hass = hass
+        self._subscriptions: list[_Subscription] = []
+        # Rebuilt when the subscriptions change so the groups
+        # are never modified while a state change is forwarded
+        self._groups: list[_Group] | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        entity_ids: set[str],
+        user: User,
+        send_message: _SendMessage,
+        msg_id: int,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the state changes of entity_ids or all entities if empty.
+
+        send_message is the send_collapsible_message of the connection.
+        """
+        subscription: _Subscription = (
+            frozenset(entity_ids),
+            user,
+            send_message,
+            msg_id,
+        )
+        self._subscriptions.append(subscription)
+        self._groups = None
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe from the state changes."""
+            self._subscriptions.remove(subscription)
+            self._groups = None
+            if not self._subscriptions and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    def _build_groups(self) -> list[_Group]:
+        """Group the subscriptions by entity filter and user."""
+        groups: dict[tuple[frozenset[str], str], _Group] = {}
+        for entity_ids, user, send_message, msg_id in self._subscriptions:
+            if (group := groups.get((entity_ids, user.id))) is None:
+                group = groups[(entity_ids, user.id)] = (entity_ids, user, [])
+            group[2].append((send_message, msg_id))
+        return list(groups.values())
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state change to the subscriptions."""
+        if (groups := self._groups) is None:
+            groups = self._groups = self._build_groups()
+        entity_id: str = event.data["entity_id"]
+        message_parts: tuple[str, str] | None = None
+        for entity_ids, user, subscribers in groups:
+            if entity_ids and entity_id not in entity_ids:
+                continue
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            permissions = user.permissions
+            if not permissions.access_all_entities(
+                POLICY_READ
+            ) and not permissions.check_entity(entity_id, POLICY_READ):
+                continue
+            if message_parts is None:
+                message_parts = messages.cached_state_diff_message_parts(event)
+            head, tail = message_parts
+            for send_message, msg_id in subscribers:
+                send_message(
+                    (msg_id, entity_id),
+                    f"{head}{msg_id}{tail}",
+                    partial(messages.cached_state_message, msg_id, event),
+                )
+
+
+@callback
+def async_get_entities_broadcast(hass: HomeAssistant) -> EntitiesBroadcast:
+    """Return the broadcast for the subscribe_entities subscriptions."""
+    if (broadcast := hass.data.get(DATA_ENTITIES_BROADCAST)) is None:
+        broadcast = hass.data[DATA_ENTITIES_BROADCAST] = EntitiesBroadcast(hass)
+    return broadcast
@@ -50,6 +50,7 @@ from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .broadcast import async_get_entities_broadcast
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 from .messages import construct_event_message, construct_result_message
@@ -298,28 +299,9 @@ def _send_handle_get_states_response(
 ) -> None:
     """Send handle get states response."""
     joined_states = ",".join(serialized_states)
-    connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
-
-
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    connection.send_result_message(
+        construct_result_message(msg_id, f"[{joined_states}]")
+    )
 
 
 @callback
@@ -338,18 +320,10 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
-        ),
-        run_immediately=True,
+    connection.subscriptions[msg["id"]] = async_get_entities_broadcast(
+        hass
+    ).async_subscribe(
+        entity_ids, connection.user, connection.send_collapsible_message, msg["id"]
     )
     connection.send_result(msg["id"])
 
@@ -388,9 +362,9 @@ def _send_handle_entities_init_response(
 ) -> None:
     """Send handle entities init response."""
     joined_states = ",".join(serialized_states)
-    connection.send_message(
-        construct_event_message(msg_id, f'{{"a":{{{joined_states}}}}}')
-    )
+    message = construct_event_message(msg_id, f'{{"a":{{{joined_states}}}}}')
+    # Queued like the state changes that follow so it is never dropped
+    connection.send_collapsible_message(msg_id, message, lambda: message)
 
 
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> str:
@@ -415,7 +389,7 @@ async def handle_get_services(
 ) -> None:
     """Handle get services command."""
     payload = await _async_get_all_descriptions_json(hass)
-    connection.send_message(construct_result_message(msg["id"], payload))
+    connection.send_result_message(construct_result_message(msg["id"], payload))
 
 
 @callback
@@ -37,11 +37,15 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_collapsible_message",
+        "send_result_message",
         "user",
         "refresh_token_id",
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_compress",
+        "backpressure",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -59,11 +63,21 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the transport when it can collapse queued messages
+        self.send_collapsible_message: Callable[
+            [Hashable, str, Callable[[], str]], None
+        ] = self._send_collapsible_message
+        # Replaced by the transport when it sends results first
+        self.send_result_message: Callable[
+            [str | dict[str, Any]], None
+        ] = self._send_result_message
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_compress = False
+        self.backpressure = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
@@ -79,6 +93,27 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_compress = const.FEATURE_COMPRESS_MESSAGES in features
+        self.backpressure = const.FEATURE_BACKPRESSURE in features
+
+    def _send_collapsible_message(
+        self, key: Hashable, message: str, collapsed: Callable[[], str]
+    ) -> None:
+        """Send a message that may be replaced while it is queued.
+
+        Messages with the same key replace the queued message with the
+        message returned by collapsed, which must include the changes of
+        both. This implementation always sends the message.
+        """
+        self.send_message(message)
+
+    def _send_result_message(self, message: str | dict[str, Any]) -> None:
+        """Send a result or error message.
+
+        The transport may send results before other queued messages. This
+        implementation sends the message in order.
+        """
+        self.send_message(message)
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -126,7 +161,7 @@ class ActiveConnection:
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
-        self.send_message(messages.result_message(msg_id, result))
+        self.send_result_message(messages.result_message(msg_id, result))
 
     @callback
     def send_event(self, msg_id: int, event: Any | None = None) -> None:
@@ -136,7 +171,7 @@ class ActiveConnection:
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
-        self.send_message(messages.error_message(msg_id, code, message))
+        self.send_result_message(messages.error_message(msg_id, code, message))
 
     @callback
     def async_handle_binary(self, handler_id: int, payload: bytes) -> None:
@@ -174,7 +209,7 @@ class ActiveConnection:
         ):
             self.logger.error("Received invalid command: %s", msg)
             id_ = msg.get("id") if isinstance(msg, dict) else 0
-            self.send_message(
+            self.send_result_message(
                 messages.error_message(
                     id_,  # type: ignore[arg-type]
                     const.ERR_INVALID_FORMAT,
@@ -184,7 +219,7 @@ class ActiveConnection:
             return
 
         if cur_id <= self.last_id:
-            self.send_message(
+            self.send_result_message(
                 messages.error_message(
                     cur_id, const.ERR_ID_REUSE, "Identifier values have to increase."
                 )
@@ -193,7 +228,7 @@ class ActiveConnection:
 
         if not (handler_schema := self.handlers.get(type_)):
             self.logger.info("Received unknown command: %s", type_)
-            self.send_message(
+            self.send_result_message(
                 messages.error_message(
                     cur_id, const.ERR_UNKNOWN_COMMAND, "Unknown command."
                 )
@@ -259,7 +294,7 @@ class ActiveConnection:
             err_message = "Unknown error"
             log_handler = self.logger.exception
 
-        self.send_message(messages.error_message(msg["id"], code, err_message))
+        self.send_result_message(messages.error_message(msg["id"], code, err_message))
 
         if code:
             err_message += f" ({code})"
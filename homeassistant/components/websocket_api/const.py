@@ -49,3 +49,15 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
+# Collapse queued state changes, send results first and drop events
+# instead of disconnecting clients that cannot keep up
+FEATURE_BACKPRESSURE = "backpressure"
+
+# Messages of at least this many characters are sent deflate compressed
+# as binary frames to connections that support compressed messages
+COMPRESS_MIN_SIZE: Final = 16384
+# Messages of at least this many bytes are compressed in the executor
+# since compressing them takes long enough to delay the event loop
+COMPRESS_EXECUTOR_MIN_SIZE: Final = 262144
+COMPRESS_LEVEL: Final = 6
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 import async_timeout
@@ -20,12 +21,16 @@ from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
+    COMPRESS_EXECUTOR_MIN_SIZE,
+    COMPRESS_LEVEL,
+    COMPRESS_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
+    TYPE_RESULT,
     URL,
 )
 from .error import Disconnect
@@ -60,6 +65,17 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class _CollapsibleMessage:
+    """A queued message that may be replaced until it is sent."""
+
+    __slots__ = ("key", "message")
+
+    def __init__(self, key: Hashable, message: str) -> None:
+        """Initialize the message."""
+        self.key = key
+        self.message = message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -75,6 +91,9 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_priority_queue",
+        "_collapsible_messages",
+        "_dropped_messages",
         "_ready_future",
     )
 
@@ -95,7 +114,11 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | _CollapsibleMessage | None] = deque()
+        # Used with backpressure, see _send_message_with_backpressure
+        self._priority_queue: deque[str] = deque()
+        self._collapsible_messages: dict[Hashable, _CollapsibleMessage] = {}
+        self._dropped_messages = 0
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -120,6 +143,8 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        priority_queue = self._priority_queue
+        pop_message = self._pop_message
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
@@ -130,13 +155,15 @@ class WebSocketHandler:
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
-                if (messages_remaining := len(message_queue)) == 0:
+                if (
+                    messages_remaining := len(message_queue) + len(priority_queue)
+                ) == 0:
                     self._ready_future = loop.create_future()
                     await self._ready_future
-                    messages_remaining = len(message_queue)
+                    messages_remaining = len(message_queue) + len(priority_queue)
 
                 # A None message is used to signal the end of the connection
-                if (message := message_queue.popleft()) is None:
+                if (message := pop_message()) is None:
                     return
 
                 debug_enabled = is_enabled_for(logging_debug)
@@ -149,13 +176,16 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    if len(message) < COMPRESS_MIN_SIZE or not self._can_compress():
+                        await send_str(message)
+                    else:
+                        await self._send_compressed(message)
                     continue
 
                 messages: list[str] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
+                    if (message := pop_message()) is None:
                         return
                     messages.append(message)
                     messages_remaining -= 1
@@ -164,7 +194,13 @@ class WebSocketHandler:
                 coalesced_messages = f"[{joined_messages}]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                if (
+                    len(coalesced_messages) < COMPRESS_MIN_SIZE
+                    or not self._can_compress()
+                ):
+                    await send_str(coalesced_messages)
+                else:
+                    await self._send_compressed(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -175,6 +211,41 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _pop_message(self) -> str | None:
+        """Pop the next message to send, results first."""
+        if self._priority_queue:
+            return self._priority_queue.popleft()
+        message = self._message_queue.popleft()
+        if (
+            type(message) is _CollapsibleMessage
+        ):  # pylint: disable=unidiomatic-typecheck
+            del self._collapsible_messages[message.key]
+            return message.message
+        return message  # type: ignore[return-value]
+
+    def _can_compress(self) -> bool:
+        """Return if messages should be compressed for this connection.
+
+        Messages are not compressed again when the client
+        negotiated permessage-deflate for the websocket.
+        """
+        return bool(
+            (connection := self._connection)
+            and connection.can_compress
+            and not self._wsock.compress
+        )
+
+    async def _send_compressed(self, message: str) -> None:
+        """Send a message as a deflate compressed binary frame."""
+        data = message.encode()
+        if len(data) < COMPRESS_EXECUTOR_MIN_SIZE:
+            compressed = zlib.compress(data, COMPRESS_LEVEL)
+        else:
+            compressed = await self._hass.async_add_executor_job(
+                zlib.compress, data, COMPRESS_LEVEL
+            )
+        await self._wsock.send_bytes(compressed)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -195,6 +266,10 @@ class WebSocketHandler:
             # max pending messages.
             return
 
+        if (connection := self._connection) and connection.backpressure:
+            self._send_message_with_backpressure(message, False)
+            return
+
         if isinstance(message, dict):
             message = message_to_json(message)
 
@@ -231,12 +306,126 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_result_message(self, message: str | dict[str, Any]) -> None:
+        """Send a result message to the client.
+
+        See ActiveConnection.send_result_message.
+        """
+        if (
+            not self._closing
+            and (connection := self._connection)
+            and connection.backpressure
+        ):
+            self._send_message_with_backpressure(message, True)
+            return
+        self._send_message(message)
+
+    @callback
+    def _send_message_with_backpressure(
+        self, message: str | dict[str, Any], is_result: bool
+    ) -> None:
+        """Queue a message for a client that supports backpressure.
+
+        Results skip the queue, other messages are queued with
+        _queue_message_with_backpressure.
+        """
+        if isinstance(message, dict):
+            is_result = is_result or message.get("type") == TYPE_RESULT
+            message = message_to_json(message)
+        if is_result:
+            if len(self._priority_queue) >= MAX_PENDING_MSG:
+                # Results cannot be dropped, the client is not reading them
+                self._logger.error(
+                    (
+                        "%s: Client unable to keep up with pending results. Reached"
+                        " %s pending results"
+                    ),
+                    self.description,
+                    MAX_PENDING_MSG,
+                )
+                self._cancel()
+                return
+            self._priority_queue.append(message)
+            self._wake_writer()
+            return
+        self._queue_message_with_backpressure(message)
+
+    @callback
+    def _queue_message_with_backpressure(
+        self, message: str | _CollapsibleMessage
+    ) -> bool:
+        """Queue a message unless the client is not keeping up and return if it was.
+
+        When the queue holds MAX_PENDING_MSG messages, collapsible or not,
+        messages are dropped instead of disconnecting the client until the
+        queue is back under PENDING_MSG_PEAK.
+        """
+        message_queue = self._message_queue
+        if self._dropped_messages:
+            if len(message_queue) >= PENDING_MSG_PEAK:
+                self._dropped_messages += 1
+                return False
+            self._logger.info(
+                "%s: Client caught up with pending messages, dropped %s messages",
+                self.description,
+                self._dropped_messages,
+            )
+            self._dropped_messages = 0
+        elif len(message_queue) >= MAX_PENDING_MSG:
+            self._logger.warning(
+                (
+                    "%s: Client unable to keep up with pending messages. Reached"
+                    " %s pending messages, dropping messages until the client"
+                    " catches up"
+                ),
+                self.description,
+                MAX_PENDING_MSG,
+            )
+            self._dropped_messages = 1
+            return False
+        message_queue.append(message)
+        self._wake_writer()
+        return True
+
+    @callback
+    def _send_collapsible_message(
+        self, key: Hashable, message: str, collapsed: Callable[[], str]
+    ) -> None:
+        """Send a message that may be replaced while it is queued.
+
+        See ActiveConnection.send_collapsible_message.
+
+        Replacing a queued message does not grow the queue, a message
+        with a new key counts towards MAX_PENDING_MSG like any other.
+        """
+        if self._closing:
+            return
+        if not (connection := self._connection) or not connection.backpressure:
+            self._send_message(message)
+            return
+        if (queued := self._collapsible_messages.get(key)) is not None:
+            queued.message = collapsed()
+            return
+        queued = _CollapsibleMessage(key, message)
+        if self._queue_message_with_backpressure(queued):
+            self._collapsible_messages[key] = queued
+
+    @callback
+    def _wake_writer(self) -> None:
+        """Wake up the writer if it is waiting for messages."""
+        ready_future = self._ready_future
+        if ready_future and not ready_future.done():
+            ready_future.set_result(None)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if len(self._message_queue) < PENDING_MSG_PEAK or (
+            (connection := self._connection) and connection.backpressure
+        ):
             return
 
         self._logger.error(
@@ -324,6 +513,8 @@ class WebSocketHandler:
             if is_enabled_for(logging_debug):
                 debug("%s: Received %s", self.description, auth_msg_data)
             connection = await auth.async_handle(auth_msg_data)
+            connection.send_collapsible_message = self._send_collapsible_message
+            connection.send_result_message = self._send_result_message
             self._connection = connection
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -459,6 +650,8 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._priority_queue.clear()
+                    self._collapsible_messages.clear()
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
@@ -106,19 +106,56 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    head, tail = cached_state_diff_message_parts(event)
+    return f"{head}{iden}{tail}"
 
 
 @lru_cache(maxsize=128)
-def _cached_state_diff_message(event: Event) -> str:
+def cached_state_diff_message_parts(event: Event) -> tuple[str, str]:
     """Cache and serialize the event to json.
 
-    The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    The json is split where the iden goes so the message for
+    a subscription is the parts joined with its iden.
     """
-    return message_to_json(
+    head, _, tail = message_to_json(
         {"id": IDEN_TEMPLATE, "type": "event", "event": _state_diff_event(event)}
-    )
+    ).partition(IDEN_JSON_TEMPLATE)
+    return head, tail
+
+
+def cached_state_message(iden: int, event: Event) -> str:
+    """Return an event message with the full new state of a state_changed event.
+
+    Used instead of the state diff message when the changes of
+    several state_changed events must be sent as one.
+    """
+    head, tail = _cached_state_message_parts(event)
+    return f"{head}{iden}{tail}"
+
+
+@lru_cache(maxsize=128)
+def _cached_state_message_parts(event: Event) -> tuple[str, str]:
+    """Cache and serialize the event to json.
+
+    See cached_state_diff_message_parts.
+    """
+    head, _, tail = message_to_json(
+        {"id": IDEN_TEMPLATE, "type": "event", "event": _state_event(event)}
+    ).partition(IDEN_JSON_TEMPLATE)
+    return head, tail
+
+
+def _state_event(event: Event) -> dict:
+    """Convert a state_changed event to the full new state."""
+    if (event_new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    if TYPE_CHECKING:
+        event_new_state = cast(State, event_new_state)
+    return {
+        ENTITY_EVENT_ADD: {
+            event_new_state.entity_id: event_new_state.as_compressed_state()
+        }
+    }
 
 
 def _state_diff_event(event: Event) -> dict:
@@ -11,6 +11,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     Mapping,
 )
@@ -26,8 +27,10 @@ import re
 import threading
 import time
 from time import monotonic
+from types import NoneType
 from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Self, TypeVar, cast, overload
 from urllib.parse import urlparse
+from weakref import WeakValueDictionary
 
 import async_timeout
 import voluptuous as vol
@@ -69,7 +72,7 @@ from .exceptions import (
     Unauthorized,
 )
 from .helpers.aiohttp_compat import restore_original_aiohttp_cancel_behavior
-from .helpers.json import json_dumps
+from .helpers.json import json_bytes, json_dumps, json_fragment
 from .util import dt as dt_util, location
 from .util.async_ import (
     cancelling,
@@ -971,11 +974,24 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_keyed_listeners",
+        "_batch_listeners",
+        "_match_all_listeners",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
+        # event_type -> data key -> data value -> listeners
+        self._keyed_listeners: dict[
+            str, dict[str, dict[Hashable, list[_FilterableJobType]]]
+        ] = {}
+        self._batch_listeners: dict[
+            str, list[HassJob[[list[Event]], Coroutine[Any, Any, None] | None]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -986,7 +1002,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, batch_listeners in self._batch_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(batch_listeners)
+        for event_type, keyed in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for buckets in keyed.values() for jobs in buckets.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1023,11 +1046,95 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
+        if (batch_listeners := self._batch_listeners.get(event_type)) is None:
+            self._async_fire(event_type, event_data, origin, context, time_fired, False)
+            return
+
+        event = self._async_fire(
+            event_type, event_data, origin, context, time_fired, True
+        )
+        assert event is not None
+        self._async_run_batch_listeners(batch_listeners, [event])
+
+    @callback
+    def async_fire_many(
+        self,
+        event_type: str,
+        events: Iterable[tuple[dict[str, Any] | None, Context | None]],
+        origin: EventOrigin = EventOrigin.local,
+        time_fired: datetime.datetime | None = None,
+    ) -> None:
+        """Fire a batch of events of the same type.
+
+        events is an iterable of (event_data, context) tuples. Regular
+        listeners are called once per event, listeners registered with
+        async_listen_batch are called once with the list of all events.
+
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+
+        if (batch_listeners := self._batch_listeners.get(event_type)) is None:
+            for event_data, context in events:
+                self._async_fire(
+                    event_type, event_data, origin, context, time_fired, False
+                )
+            return
+
+        fired: list[Event] = []
+        for event_data, context in events:
+            event = self._async_fire(
+                event_type, event_data, origin, context, time_fired, True
+            )
+            assert event is not None
+            fired.append(event)
+        if fired:
+            self._async_run_batch_listeners(batch_listeners, fired)
+
+    @callback
+    def _async_run_batch_listeners(
+        self,
+        batch_listeners: list[HassJob[[list[Event]], Coroutine[Any, Any, None] | None]],
+        events: list[Event],
+    ) -> None:
+        """Pass a batch of events to the batch listeners."""
+        for job in batch_listeners:
+            self._hass.async_add_hass_job(job, events)
+
+    @callback
+    def _async_fire(
+        self,
+        event_type: str,
+        event_data: dict[str, Any] | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: datetime.datetime | None,
+        always_create: bool,
+    ) -> Event | None:
+        """Fire an event to the per event listeners.
+
+        Returns the event if it was created. The event is only created
+        when there are listeners for it or always_create is set.
+        """
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
+        if event_data and (keyed := self._keyed_listeners.get(event_type)):
+            for data_key, buckets in keyed.items():
+                try:
+                    keyed_listeners = buckets.get(event_data.get(data_key))
+                except TypeError:  # unhashable value
+                    continue
+                if keyed_listeners:
+                    listeners = listeners + keyed_listeners
+
         if not listeners and not match_all_listeners:
-            return
+            if always_create:
+                return Event(event_type, event_data, origin, time_fired, context)
+            return None
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
         if event_type != EVENT_HOMEASSISTANT_CLOSE:
@@ -1054,6 +1161,8 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+        return event
+
     def listen(
         self,
         event_type: str,
@@ -1106,6 +1215,118 @@ class EventBus:
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: str,
+        listener: Callable[[list[Event]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        The listener is called with a list of events. Events fired with
+        async_fire_many are delivered as one list, events fired with
+        async_fire are delivered as a list with a single event.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Batch listeners can not listen to MATCH_ALL")
+        job: HassJob[[list[Event]], Coroutine[Any, Any, None] | None] = HassJob(
+            listener, f"listen batch {event_type}"
+        )
+        self._batch_listeners.setdefault(event_type, []).append(job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            try:
+                self._batch_listeners[event_type].remove(job)
+            except (KeyError, ValueError):
+                _LOGGER.exception("Unable to remove unknown batch listener %s", job)
+                return
+            if not self._batch_listeners[event_type]:
+                del self._batch_listeners[event_type]
+
+        return remove_listener
+
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: Iterable[Hashable],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a matching data value.
+
+        The listener is only called for events where event.data[data_key]
+        is one of keys. Dispatch is a dict lookup per data_key, so this
+        should be preferred over an event_filter that checks membership
+        when there are many listeners for the same event type, for example
+        listening to state_changed for specific entity_ids.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners can not listen to MATCH_ALL")
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        keys = set(keys)
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type} {data_key}"),
+            None,
+            run_immediately,
+        )
+        buckets = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        for key in keys:
+            buckets.setdefault(key, []).append(filterable_job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(
+                event_type, data_key, keys, filterable_job
+            )
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: set[Hashable],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed = self._keyed_listeners[event_type]
+            buckets = keyed[data_key]
+            for key in keys:
+                buckets[key].remove(filterable_job)
+                # delete key bucket if empty
+                if not buckets[key]:
+                    del buckets[key]
+        except (KeyError, ValueError):
+            # KeyError if the listener was already removed
+            # ValueError if listener did not exist within the bucket
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+        if not buckets:
+            del keyed[data_key]
+        if not keyed:
+            del self._keyed_listeners[event_type]
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
@@ -1207,6 +1428,34 @@ class EventBus:
             )
 
 
+# Attribute value types that can be interned. Containers are excluded
+# since 1 == True would make tuples with different JSON compare equal.
+_INTERNABLE_ATTRIBUTE_TYPES = {str, int, float, bool, NoneType}
+
+
+class InternedAttributes(ReadOnlyDict[str, Any]):
+    """Read only attributes shared by all states with the same content.
+
+    The JSON representation is built once and reused when serializing
+    any state that holds these attributes.
+    """
+
+    _json_fragment: Any = None
+
+    def as_json_fragment(self) -> Any:
+        """Return the attributes as a pre-serialized JSON fragment."""
+        if self._json_fragment is None:
+            self._json_fragment = json_fragment(json_bytes(self))
+        return self._json_fragment
+
+
+def _json_attributes(attributes: ReadOnlyDict[str, Any]) -> Any:
+    """Return the attributes in the cheapest form to pass to json_dumps."""
+    if isinstance(attributes, InternedAttributes):
+        return attributes.as_json_fragment()
+    return attributes
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -1261,7 +1510,11 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        self.attributes = (
+            attributes
+            if isinstance(attributes, ReadOnlyDict)
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1306,7 +1559,10 @@ class State:
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
         if not self._as_dict_json:
-            self._as_dict_json = json_dumps(self.as_dict())
+            as_dict = self.as_dict()
+            self._as_dict_json = json_dumps(
+                as_dict | {"attributes": _json_attributes(self.attributes)}
+            )
         return self._as_dict_json
 
     def as_compressed_state(self) -> dict[str, Any]:
@@ -1341,8 +1597,12 @@ class State:
         It is used for sending multiple states in a single message.
         """
         if not self._as_compressed_state_json:
+            compressed_state = self.as_compressed_state()
+            compressed_state[COMPRESSED_STATE_ATTRIBUTES] = _json_attributes(
+                self.attributes
+            )
             self._as_compressed_state_json = json_dumps(
-                {self.entity_id: self.as_compressed_state()}
+                {self.entity_id: compressed_state}
             )[1:-1]
         return self._as_compressed_state_json
 
@@ -1410,12 +1670,15 @@ class State:
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_reservations", "_bus", "_loop")
+    __slots__ = ("_states", "_reservations", "_interned_attributes", "_bus", "_loop")
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
         self._reservations: set[str] = set()
+        self._interned_attributes: WeakValueDictionary[
+            tuple[tuple[str, type, Any], ...], InternedAttributes
+        ] = WeakValueDictionary()
         self._bus = bus
         self._loop = loop
 
@@ -1603,6 +1866,72 @@ class StateMachine:
         If you just update the attributes and not the state, last changed will
         not be affected.
 
+        This method must be run in the event loop.
+        """
+        if (
+            event_data := self._async_set_state(
+                entity_id, new_state, attributes, force_update, context, None
+            )
+        ) is None:
+            return
+
+        state: State = event_data["new_state"]
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            event_data,
+            EventOrigin.local,
+            state.context,
+            time_fired=state.last_updated,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities in a single pass.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+        All states share the same last_updated time and the state_changed
+        events are fired as one batch so listeners registered with
+        async_listen_batch receive them as a single list.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        events: list[tuple[dict[str, Any] | None, Context | None]] = []
+        for entity_id, new_state, attributes in states:
+            if (
+                event_data := self._async_set_state(
+                    entity_id, new_state, attributes, force_update, context, timestamp
+                )
+            ) is not None:
+                events.append((event_data, event_data["new_state"].context))
+
+        if events:
+            self._bus.async_fire_many(
+                EVENT_STATE_CHANGED,
+                events,
+                EventOrigin.local,
+                time_fired=dt_util.utc_from_timestamp(timestamp),
+            )
+
+    @callback
+    def _async_set_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        timestamp: float | None,
+    ) -> dict[str, Any] | None:
+        """Store a new state and return the state_changed event data.
+
+        Returns None if the state and attributes did not change.
+
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
@@ -1614,11 +1943,14 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Compare with the previous attributes before building an intern
+            # key, most writes do not change the attributes
+            old_attributes = old_state.attributes
+            same_attr = old_attributes is attributes or old_attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
-            return
+            return None
 
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
@@ -1632,16 +1964,22 @@ class StateMachine:
             # timestamp implementation:
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-            timestamp = time.time()
+            if timestamp is None:
+                timestamp = time.time()
             now = dt_util.utc_from_timestamp(timestamp)
             context = Context(id=ulid_at_time(timestamp))
+        elif timestamp is not None:
+            now = dt_util.utc_from_timestamp(timestamp)
         else:
             now = dt_util.utcnow()
 
         state = State(
             entity_id,
             new_state,
-            attributes,
+            # Unchanged attributes are shared with the old state by identity
+            old_state.attributes
+            if same_attr and old_state
+            else self._async_intern_attributes(attributes),
             last_changed,
             now,
             context,
@@ -1650,13 +1988,38 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
-            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
-            context,
-            time_fired=now,
-        )
+        return {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared read only copy of attributes with the same content.
+
+        Attributes that have values which can not be interned are
+        returned as a new ReadOnlyDict. Callers reuse the attributes of
+        the previous state when they are unchanged so the intern key is
+        only built for attributes that changed.
+
+        This method must be run in the event loop.
+        """
+        if isinstance(attributes, InternedAttributes):
+            return attributes
+        key: list[tuple[str, type, Any]] = []
+        for attr, value in attributes.items():
+            if (value_type := type(value)) not in _INTERNABLE_ATTRIBUTE_TYPES:
+                return ReadOnlyDict(attributes)
+            # The type is part of the key so 1, 1.0 and True are not shared
+            # and floats are compared by their exact representation so 0.0
+            # and -0.0 are not shared either
+            key.append(
+                (attr, value_type, value.hex() if value_type is float else value)
+            )
+        interned_key = tuple(key)
+        if (interned := self._interned_attributes.get(interned_key)) is None:
+            interned = InternedAttributes(attributes)
+            self._interned_attributes[interned_key] = interned
+        return interned
 
 
 class SupportsResponse(enum.StrEnum):
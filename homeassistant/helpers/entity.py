@@ -34,7 +34,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
@@ -177,6 +177,16 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
+@dataclass(slots=True)
+class _StaticAttributes:
+    """The state attributes of an entity which rarely change."""
+
+    customize: Any
+    key: tuple[Any, ...]
+    capability_attributes: Mapping[str, Any] | None
+    attributes: dict[str, Any]
+
+
 class EntityPlatformState(Enum):
     """The platform state of an entity."""
 
@@ -252,6 +262,61 @@ class Entity(ABC):
     # Protect for multiple updates
     _update_staged = False
 
+    # If the static state attributes, like the capability attributes, unit of
+    # measurement, device class, icon, name and supported features, only change
+    # with a registry update, a customize reload, a change of one of the
+    # _static_attributes_sources or a call to async_invalidate_static_attributes,
+    # they are cached between writes
+    _cache_static_attributes = False
+    _static_attributes: _StaticAttributes | None = None
+
+    # The instance attributes the static state attributes are derived from,
+    # a change of one of them recalculates the cached static state attributes
+    _static_attributes_sources: tuple[str, ...] = (
+        "_attr_assumed_state",
+        "_attr_attribution",
+        "_attr_capability_attributes",
+        "_attr_device_class",
+        "_attr_entity_picture",
+        "_attr_has_entity_name",
+        "_attr_icon",
+        "_attr_name",
+        "_attr_supported_features",
+        "_attr_translation_key",
+        "_attr_unit_of_measurement",
+        "device_entry",
+        "entity_description",
+        "registry_entry",
+    )
+
+    # The properties and methods the static state attributes are derived from,
+    # entity base classes only cache the static state attributes of subclasses
+    # which don't override any of them
+    _static_attribute_properties: tuple[str, ...] = (
+        "_default_to_device_class_name",
+        "_friendly_name_internal",
+        "_name_internal",
+        "assumed_state",
+        "attribution",
+        "capability_attributes",
+        "device_class",
+        "entity_picture",
+        "has_entity_name",
+        "icon",
+        "name",
+        "supported_features",
+        "translation_key",
+        "unit_of_measurement",
+        "use_device_name",
+    )
+
+    # If writes of the same state and state attributes as the last write are
+    # skipped, without building the attributes, while the static attributes
+    # are cached and the state machine still holds the last written state.
+    # Entities which need every write to reach the state machine opt out.
+    _skip_unchanged_writes = True
+    _write_fingerprint: tuple[State | None, str, dict[str, Any]] | None = None
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -781,14 +846,104 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        customize = hass.data.get(DATA_CUSTOMIZE)
+        cache = self._cache_static_attributes
+        static_key = self._static_attributes_key() if cache else ()
+        static = self._static_attributes
+        if not (
+            static_cached := static is not None
+            and static.customize is customize
+            and static.key == static_key
+        ):
+            capability_attributes = self.capability_attributes
+        else:
+            capability_attributes = None
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
+        dynamic_attr: dict[str, Any] = {}
         if available:
-            attr.update(self.state_attributes or {})
-            attr.update(self.extra_state_attributes or {})
+            dynamic_attr.update(self.state_attributes or {})
+            dynamic_attr.update(self.extra_state_attributes or {})
+
+        if not static_cached:
+            static = self._async_calculate_static_attributes(
+                entry, customize, capability_attributes, static_key
+            )
+            if cache:
+                self._static_attributes = static
+        assert static is not None
+
+        end = timer()
+
+        if end - start > 0.4 and not self._slow_reported:
+            self._slow_reported = True
+            report_issue = self._suggest_report_issue()
+            _LOGGER.warning(
+                "Updating state for %s (%s) took %.3f seconds. Please %s",
+                entity_id,
+                type(self),
+                end - start,
+                report_issue,
+            )
+
+        force_update = self.force_update
+        if (
+            static_cached
+            and self._skip_unchanged_writes
+            and not force_update
+            and (fingerprint := self._write_fingerprint) is not None
+            and fingerprint[0] is hass.states.get(entity_id)
+            and fingerprint[1] == state
+            and fingerprint[2] == dynamic_attr
+        ):
+            return
+
+        # The static attributes, including the ones set in the config file,
+        # overwrite the state attributes.
+        attr = {
+            **(static.capability_attributes or {}),
+            **dynamic_attr,
+            **static.attributes,
+        }
+
+        if (
+            self._context_set is not None
+            and dt_util.utcnow() - self._context_set > self.context_recent_time
+        ):
+            self._context = None
+            self._context_set = None
+
+        hass.states.async_set(entity_id, state, attr, force_update, self._context)
+
+        if cache and self._skip_unchanged_writes:
+            self._write_fingerprint = (hass.states.get(entity_id), state, dynamic_attr)
+
+    def _static_attributes_key(self) -> tuple[Any, ...]:
+        """Return the values the cached static state attributes were derived from."""
+        instance_dict = self.__dict__
+        return tuple(
+            instance_dict.get(name, UNDEFINED)
+            for name in self._static_attributes_sources
+        )
+
+    @classmethod
+    def _static_properties_overridden(cls, base: type[Entity]) -> bool:
+        """Return if the class overrides a static attribute property of base."""
+        return any(
+            getattr(cls, name) is not getattr(base, name)
+            for name in cls._static_attribute_properties
+        )
+
+    def _async_calculate_static_attributes(
+        self,
+        entry: er.RegistryEntry | None,
+        customize: Any,
+        capability_attributes: Mapping[str, Any] | None,
+        key: tuple[Any, ...],
+    ) -> _StaticAttributes:
+        """Calculate the state attributes which rarely change."""
+        attr: dict[str, Any] = {}
 
         if (unit_of_measurement := self.unit_of_measurement) is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
@@ -818,31 +973,20 @@ class Entity(ABC):
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        end = timer()
-
-        if end - start > 0.4 and not self._slow_reported:
-            self._slow_reported = True
-            report_issue = self._suggest_report_issue()
-            _LOGGER.warning(
-                "Updating state for %s (%s) took %.3f seconds. Please %s",
-                entity_id,
-                type(self),
-                end - start,
-                report_issue,
-            )
-
         # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
+        if customize:
+            attr.update(customize.get(self.entity_id))
 
-        if (
-            self._context_set is not None
-            and dt_util.utcnow() - self._context_set > self.context_recent_time
-        ):
-            self._context = None
-            self._context_set = None
+        return _StaticAttributes(customize, key, capability_attributes, attr)
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Recalculate the cached static state attributes on the next write.
 
-        hass.states.async_set(entity_id, state, attr, self.force_update, self._context)
+        To be called by entities caching their static state attributes when
+        one of them changed.
+        """
+        self._static_attributes = None
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -1042,6 +1186,9 @@ class Entity(ABC):
 
         Not to be extended by integrations.
         """
+        self._static_attributes = None
+        self._write_fingerprint = None
+
         info = {
             "domain": self.platform.platform_name,
             "custom_component": "custom_components" in type(self).__module__,
@@ -1107,6 +1254,8 @@ class Entity(ABC):
             await self.async_remove()
             return
 
+        self._static_attributes = None
+
         assert old is not None
         if registry_entry.entity_id == old.entity_id:
             self.async_registry_entry_updated()
@@ -1140,6 +1289,7 @@ class Entity(ABC):
             return
 
         self.device_entry = dr.async_get(self.hass).async_get(data["device_id"])
+        self._static_attributes = None
         self.async_write_ha_state()
 
     @callback
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import math
+from random import uniform
 from typing import TYPE_CHECKING, Any, Protocol
 
 import voluptuous as vol
@@ -56,6 +59,12 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# How many seconds early a poll may start so the poll timers of the
+# platforms share loop timers, at most a tenth of the scan interval
+POLL_TIMER_JITTER = 0.5
+# The upper bounds in seconds of the buckets of the poll latency histograms
+POLL_LATENCY_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
 _LOGGER = getLogger(__name__)
 
 
@@ -98,6 +107,36 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+class _EntityPollStats:
+    """The poll statistics and cadence of an entity."""
+
+    __slots__ = ("polling", "deferred", "rounds_to_skip", "polls", "latency_histogram")
+
+    def __init__(self) -> None:
+        """Initialize the poll statistics."""
+        self.polling = False
+        # If the last poll did not fit in its round and is polled first next round
+        self.deferred = False
+        # The rounds skipped by an entity slower than the scan interval
+        self.rounds_to_skip = 0
+        self.polls = 0
+        self.latency_histogram = [0] * (len(POLL_LATENCY_BUCKETS) + 1)
+
+    def record(self, latency: float, scan_interval: float) -> None:
+        """Record the latency of a poll and adapt the cadence to it."""
+        self.polling = False
+        self.deferred = False
+        self.polls += 1
+        self.latency_histogram[bisect_left(POLL_LATENCY_BUCKETS, latency)] += 1
+        if latency > scan_interval > 0:
+            self.rounds_to_skip = math.ceil(latency / scan_interval) - 1
+
+    def defer(self) -> None:
+        """Move the poll to the next round."""
+        self.polling = False
+        self.deferred = True
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -133,7 +172,8 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
+        self._poll_stats: dict[str, _EntityPollStats] = {}
+        self._poll_budget: asyncio.Semaphore | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -532,6 +572,7 @@ class EntityPlatform:
             self._update_entity_states,
             self.scan_interval,
             name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            jitter=min(POLL_TIMER_JITTER, self.scan_interval.total_seconds() / 10),
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -847,39 +888,164 @@ class EntityPlatform:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        in parallel and other entities sequential. If the platform module sets
+        MAX_PARALLEL_POLLS, at most that many async entities are polled at the
+        same time.
+
+        An entity still being polled from a previous round is skipped, so it
+        does not hold back the other entities. An entity slower than the scan
+        interval is then polled once every as many rounds as its last poll took.
+        If the platform module sets POLL_JITTER, the polls of a round are
+        spread over that time to not poll all entities at the same instant.
+
+        A round has the scan interval to start its polls. The sequential polls,
+        and with MAX_PARALLEL_POLLS the parallel polls, that are still waiting
+        for other polls after that are moved to the next round, where they are
+        polled first.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        poll_stats = self._poll_stats
+        for entity_id in poll_stats.keys() - self.entities.keys():
+            del poll_stats[entity_id]
+
+        polls: list[tuple[Entity, _EntityPollStats]] = []
+        still_polling: list[str] = []
+        for entity in list(self.entities.values()):
+            if not entity.should_poll:
+                continue
+            if (stats := poll_stats.get(entity.entity_id)) is None:
+                stats = poll_stats[entity.entity_id] = _EntityPollStats()
+            if stats.polling:
+                still_polling.append(entity.entity_id)
+                continue
+            if stats.rounds_to_skip:
+                stats.rounds_to_skip -= 1
+                continue
+            # Mark all the entities of the round, so the next round skips the
+            # ones still waiting for their turn.
+            stats.polling = True
+            polls.append((entity, stats))
+
+        if still_polling:
             self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
+                (
+                    "Updating %s %s took longer than the scheduled update interval"
+                    " %s, still updating: %s"
+                ),
                 self.platform_name,
                 self.domain,
                 self.scan_interval,
+                ", ".join(still_polling),
             )
+
+        if not polls:
             return
 
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
+        # The deferred polls of the previous round go first
+        polls.sort(key=lambda poll: not poll[1].deferred)
+        loop = self.hass.loop
+        deadline = loop.time() + self.scan_interval.total_seconds()
+        jitter = getattr(self.platform, "POLL_JITTER", None)
+        spread = jitter.total_seconds() if jitter else 0
+
+        if self._update_in_sequence or len(polls) == 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            try:
+                for index, (entity, stats) in enumerate(polls):
+                    if index and loop.time() >= deadline:
+                        self.logger.debug(
+                            "Updating %s %s ran out of time, deferring %s polls",
+                            self.platform_name,
+                            self.domain,
+                            len(polls) - index,
+                        )
+                        for _, deferred_stats in polls[index:]:
+                            deferred_stats.defer()
+                        break
                     # If the entity is removed from hass during the previous
                     # entity being updated, we need to skip updating the
                     # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+                    if entity.hass:
+                        await self._async_poll_entity(
+                            entity, stats, spread / len(polls), deadline
+                        )
+            finally:
+                for _, stats in polls:
+                    stats.polling = False
+            return
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if self._poll_budget is None and (
+            max_parallel_polls := getattr(self.platform, "MAX_PARALLEL_POLLS", None)
+        ):
+            self._poll_budget = asyncio.Semaphore(max_parallel_polls)
+
+        await asyncio.gather(
+            *(
+                self._async_poll_entity(entity, stats, uniform(0, spread), deadline)
+                for entity, stats in polls
+            )
+        )
+
+    async def _async_poll_entity(
+        self,
+        entity: Entity,
+        stats: _EntityPollStats,
+        delay: float,
+        deadline: float,
+    ) -> None:
+        """Poll an entity after delay seconds and record how long it took.
+
+        The poll is deferred if it had to wait for other polls until after
+        the deadline of its round.
+        """
+        loop = self.hass.loop
+        start = loop.time()
+        deferred = False
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            if self._poll_budget is None or self._update_in_sequence:
+                start = loop.time()
+                await entity.async_update_ha_state(True)
+            else:
+                waited = self._poll_budget.locked()
+                async with self._poll_budget:
+                    if waited and loop.time() >= deadline:
+                        self.logger.debug(
+                            "Updating %s ran out of time, deferring its poll",
+                            entity.entity_id,
+                        )
+                        deferred = True
+                        return
+                    start = loop.time()
+                    await entity.async_update_ha_state(True)
+        finally:
+            if deferred:
+                stats.defer()
+            else:
+                stats.record(loop.time() - start, self.scan_interval.total_seconds())
+
+    @callback
+    def async_get_poll_statistics(self) -> dict[str, dict[str, Any]]:
+        """Return the poll statistics of the entities, for diagnostics."""
+        return {
+            entity_id: {
+                "polls": stats.polls,
+                "polling": stats.polling,
+                "deferred": stats.deferred,
+                "rounds_to_skip": stats.rounds_to_skip,
+                "latency_histogram": dict(
+                    zip(
+                        map(str, (*POLL_LATENCY_BUCKETS, math.inf)),
+                        stats.latency_histogram,
+                        strict=True,
+                    )
+                ),
+            }
+            for entity_id, stats in self._poll_stats.items()
+        }
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
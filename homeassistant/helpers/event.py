@@ -8,9 +8,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
 import logging
+import math
 from random import randint
 import time
 from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
+import weakref
 
 import attr
 
@@ -62,6 +64,12 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_TEMPLATE_REFRESH_SCHEDULER = "track_template_refresh_scheduler"
+
+TIMER_WHEEL = "timer_wheel"
+
+TIME_PATTERN_SCHEDULER = "time_pattern_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -881,6 +889,215 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRefreshScheduler:
+    """Order the refreshes of template trackers depending on each other.
+
+    Trackers are refreshed as soon as a state change they depend on
+    is delivered. The actions of some trackers, like template entities,
+    write the state of entities other trackers depend on. A state change
+    both depend on would refresh the downstream tracker twice: once for
+    the change itself and again when the upstream tracker writes its
+    state.
+
+    The scheduler learns which entities each tracker writes while it is
+    refreshed and which trackers depend on them. A tracker that only
+    uses its current result, like a template entity, may opt in to be
+    refreshed after its upstream trackers: it is refreshed once, in a
+    task, after the states written by its upstream trackers that depend
+    on the same state change were delivered. The trackers refreshed
+    together are sorted so the upstream ones come first. The other
+    trackers, like template triggers, are always refreshed for every
+    state change since they rely on each state they see.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._trackers = 0
+        self._pending: dict[
+            TrackTemplateResultInfo, list[EventType[EventStateChangedData]]
+        ] = {}
+        self._scheduled = False
+        self._refreshing: TrackTemplateResultInfo | None = None
+        # The states written by the trackers during this loop iteration
+        self._written: set[str] = set()
+        self._writes: weakref.WeakKeyDictionary[
+            TrackTemplateResultInfo, set[str]
+        ] = weakref.WeakKeyDictionary()
+        # The trackers writing an input of the trackers refreshed after them
+        self._upstream: weakref.WeakKeyDictionary[
+            TrackTemplateResultInfo, weakref.WeakSet[TrackTemplateResultInfo]
+        ] = weakref.WeakKeyDictionary()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_tracker(
+        self, tracker: TrackTemplateResultInfo, refresh_after_upstream: bool
+    ) -> None:
+        """Learn the states written by the trackers while there are some."""
+        self._trackers += 1
+        if refresh_after_upstream:
+            self._upstream[tracker] = weakref.WeakSet()
+            self.async_dependencies_changed(tracker)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_written,  # type: ignore[arg-type]
+                run_immediately=True,
+            )
+
+    @callback
+    def async_remove_tracker(self, tracker: TrackTemplateResultInfo) -> None:
+        """Forget a tracker that was removed."""
+        self._pending.pop(tracker, None)
+        self._upstream.pop(tracker, None)
+        if self._writes.pop(tracker, None):
+            for upstream in self._upstream.values():
+                upstream.discard(tracker)
+        self._trackers -= 1
+        if not self._trackers and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def async_dependencies_changed(self, tracker: TrackTemplateResultInfo) -> None:
+        """Find the upstream trackers of a tracker after its inputs changed."""
+        if (upstream := self._upstream.get(tracker)) is None:
+            return
+        upstream.clear()
+        for writer, writes in self._writes.items():
+            if writer is not tracker and tracker.async_depends_on(writes):
+                upstream.add(writer)
+
+    @callback
+    def async_refresh(
+        self,
+        tracker: TrackTemplateResultInfo,
+        event: EventType[EventStateChangedData],
+    ) -> None:
+        """Refresh a tracker for a state change, now or once its upstream did."""
+        if (events := self._pending.get(tracker)) is not None:
+            events.append(event)
+            return
+        if (upstream := self._upstream.get(tracker)) and self._has_upstream(
+            upstream, event.data["entity_id"]
+        ):
+            self._pending[tracker] = [event]
+            self._async_ensure_scheduled()
+            return
+        self._async_refresh_now(tracker, (event,))
+
+    @staticmethod
+    def _has_upstream(
+        upstream: Iterable[TrackTemplateResultInfo], entity_id: str
+    ) -> bool:
+        """Return if an upstream tracker is refreshed for entity_id."""
+        entity_ids = (entity_id,)
+        return any(writer.async_depends_on(entity_ids) for writer in upstream)
+
+    @callback
+    def _async_ensure_scheduled(self) -> None:
+        """Schedule refreshing the pending trackers."""
+        if not self._scheduled:
+            self._scheduled = True
+            self._hass.async_create_task(
+                self._async_refresh_pending(), "template refresh"
+            )
+
+    @callback
+    def _async_refresh_now(
+        self,
+        tracker: TrackTemplateResultInfo,
+        events: Iterable[EventType[EventStateChangedData]],
+    ) -> None:
+        """Refresh a tracker for state changes and record the states it writes."""
+        refreshing = self._refreshing
+        self._refreshing = tracker
+        try:
+            for event in events:
+                tracker.async_refresh_for_event(event)
+        finally:
+            self._refreshing = refreshing
+
+    @callback
+    def _async_state_written(self, event: EventType[EventStateChangedData]) -> None:
+        """Record the states written while a tracker is refreshed."""
+        if (tracker := self._refreshing) is None:
+            return
+        entity_id = event.data["entity_id"]
+        if not self._written:
+            self._hass.loop.call_soon(self._written.clear)
+        self._written.add(entity_id)
+        if (writes := self._writes.get(tracker)) is None:
+            writes = self._writes[tracker] = set()
+        elif entity_id in writes:
+            return
+        writes.add(entity_id)
+        entity_ids = (entity_id,)
+        for dependent, upstream in self._upstream.items():
+            if dependent is not tracker and dependent.async_depends_on(entity_ids):
+                upstream.add(tracker)
+
+    def _sorted(
+        self, trackers: list[TrackTemplateResultInfo]
+    ) -> list[TrackTemplateResultInfo]:
+        """Sort the trackers so the ones others depend on come first.
+
+        The trackers in a dependency cycle keep the order they were
+        scheduled in.
+        """
+        pending = set(trackers)
+        upstream: dict[TrackTemplateResultInfo, set[TrackTemplateResultInfo]] = {
+            tracker: pending.intersection(self._upstream.get(tracker, ()))
+            for tracker in trackers
+        }
+        if not any(upstream.values()):
+            return trackers
+
+        ordered: list[TrackTemplateResultInfo] = []
+        while upstream:
+            ready = [tracker for tracker, deps in upstream.items() if not deps]
+            if not ready:
+                ready = [next(iter(upstream))]
+            for tracker in ready:
+                del upstream[tracker]
+                ordered.append(tracker)
+            for deps in upstream.values():
+                deps.difference_update(ready)
+        return ordered
+
+    async def _async_refresh_pending(self) -> None:
+        """Refresh the trackers waiting for their upstream trackers."""
+        self._scheduled = False
+        pending = self._pending
+        self._pending = {}
+        for tracker in self._sorted(list(pending)):
+            events = pending[tracker]
+            if self._written and tracker.async_depends_on(self._written):
+                # The states written by the upstream trackers are
+                # about to be delivered to this tracker as well
+                self._pending[tracker] = events
+                continue
+            try:
+                self._async_refresh_now(tracker, events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while refreshing template tracker %s", tracker)
+        if self._pending:
+            self._async_ensure_scheduled()
+
+
+@callback
+def _async_get_template_refresh_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRefreshScheduler:
+    """Return the scheduler of the template tracker refreshes."""
+    if (scheduler := hass.data.get(TRACK_TEMPLATE_REFRESH_SCHEDULER)) is None:
+        scheduler = hass.data[
+            TRACK_TEMPLATE_REFRESH_SCHEDULER
+        ] = _TemplateRefreshScheduler(hass)
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -890,10 +1107,12 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        refresh_after_upstream: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._job = HassJob(action, f"track template result {track_templates}")
+        self._refresh_after_upstream = refresh_after_upstream
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
@@ -906,6 +1125,7 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._scheduler = _async_get_template_refresh_scheduler(hass)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -955,8 +1175,11 @@ class TrackTemplateResultInfo:
                 )
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_handle_state_change,
         )
+        self._scheduler.async_add_tracker(self, self._refresh_after_upstream)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1013,6 +1236,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.async_remove_tracker(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1021,6 +1245,27 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_for_event(self, event: EventType[EventStateChangedData]) -> None:
+        """Recalculate the templates a state change may affect."""
+        self._refresh(event)
+
+    @callback
+    def async_depends_on(self, entity_ids: Iterable[str]) -> bool:
+        """Return if the templates render again when the entities change."""
+        return any(
+            info.filter(entity_id)
+            for info in self._info.values()
+            for entity_id in entity_ids
+        )
+
+    @callback
+    def _async_handle_state_change(
+        self, event: EventType[EventStateChangedData]
+    ) -> None:
+        """Refresh the templates for a state change."""
+        self._scheduler.async_refresh(self, event)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1183,6 +1428,7 @@ class TrackTemplateResultInfo:
                     ]
                 )
             )
+            self._scheduler.async_dependencies_changed(self)
             _LOGGER.debug(
                 (
                     "Template group %s listens for %s, re-render blocker by super"
@@ -1230,6 +1476,7 @@ def async_track_template_result(
     raise_on_template_error: bool = False,
     strict: bool = False,
     has_super_template: bool = False,
+    refresh_after_upstream: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1263,13 +1510,20 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    refresh_after_upstream
+        When set to True, a state change that also refreshes a tracker writing
+        a state the templates depend on, like a template entity, only refreshes
+        the templates once that state was written. Only set it when the action
+        uses the latest result, since intermediate results are skipped.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, refresh_after_upstream
+    )
     tracker.async_setup(raise_on_template_error, strict=strict)
     return tracker
 
@@ -1375,6 +1629,129 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+class _TimerWheelTimer:
+    """A timer of the timer wheel, cancelled like an asyncio.TimerHandle."""
+
+    __slots__ = ("_tick", "_callback")
+
+    def __init__(self, tick: _TimerWheelTick, callback_: Callable[[], None]) -> None:
+        """Initialize the timer."""
+        self._tick = tick
+        self._callback = callback_
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        self._tick.async_cancel(self)
+
+    def _run(self) -> None:
+        """Run the timer."""
+        self._callback()
+
+
+def _run_tick_job(job: HassJob[[], None]) -> None:
+    """Run the tick of a job cancelled on shutdown."""
+    job.target()
+
+
+class _TimerWheelTick:
+    """The timers sharing a loop timer at the start of a tick."""
+
+    __slots__ = ("_wheel", "_key", "_timers", "handle")
+
+    def __init__(
+        self,
+        wheel: _TimerWheel,
+        key: tuple[float, int, bool],
+        when: float,
+        cancel_on_shutdown: bool,
+    ) -> None:
+        """Initialize the tick."""
+        self._wheel = wheel
+        self._key = key
+        self._timers: dict[_TimerWheelTimer, None] = {}
+        if cancel_on_shutdown:
+            # The loop timer is cancelled on shutdown like the timers of
+            # the jobs, see HomeAssistant._cancel_cancellable_timers
+            self.handle = wheel.loop.call_at(
+                when,
+                _run_tick_job,
+                HassJob(self._run, "timer wheel tick", cancel_on_shutdown=True),
+            )
+        else:
+            self.handle = wheel.loop.call_at(when, self._run)
+
+    def async_add(self, callback_: Callable[[], None]) -> _TimerWheelTimer:
+        """Add a timer to the tick."""
+        timer = _TimerWheelTimer(self, callback_)
+        self._timers[timer] = None
+        return timer
+
+    def async_cancel(self, timer: _TimerWheelTimer) -> None:
+        """Cancel a timer, and the loop timer if it was the last one."""
+        if self._timers.pop(timer, False) is None and not self._timers:
+            self.handle.cancel()
+            self._wheel.async_remove_tick(self._key)
+
+    def _run(self) -> None:
+        """Run the timers of the tick."""
+        self._wheel.async_remove_tick(self._key)
+        timers = self._timers
+        self._timers = {}
+        for timer in timers:
+            try:
+                timer._run()  # pylint: disable=protected-access
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer %s", timer)
+
+
+class _TimerWheel:
+    """Share the loop timers of the actions that accept to be called early.
+
+    The deadlines are hashed into ticks as long as the jitter the
+    actions accept. All the actions of a tick are called by a single
+    loop timer at the start of the tick, so they are never called late
+    because of the wheel. This keeps the loop scheduled heap small when
+    there are many timers. The actions of jobs cancelled on shutdown
+    share separate ticks that are cancelled with them.
+    """
+
+    __slots__ = ("loop", "_ticks")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.loop = hass.loop
+        self._ticks: dict[tuple[float, int, bool], _TimerWheelTick] = {}
+
+    @callback
+    def async_call_at(
+        self,
+        when: float,
+        jitter: float,
+        callback_: Callable[[], None],
+        cancel_on_shutdown: bool,
+    ) -> _TimerWheelTimer:
+        """Call callback_ at loop time when or up to jitter seconds earlier."""
+        key = (jitter, math.floor(when / jitter), cancel_on_shutdown)
+        if (tick := self._ticks.get(key)) is None or tick.handle.cancelled():
+            tick = self._ticks[key] = _TimerWheelTick(
+                self, key, key[1] * jitter, cancel_on_shutdown
+            )
+        return tick.async_add(callback_)
+
+    @callback
+    def async_remove_tick(self, key: tuple[float, int, bool]) -> None:
+        """Remove a tick that ran or has no timers left."""
+        self._ticks.pop(key, None)
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel."""
+    if (wheel := hass.data.get(TIMER_WHEEL)) is None:
+        wheel = hass.data[TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
 @callback
 @bind_hass
 def async_track_point_in_utc_time(
@@ -1382,15 +1759,22 @@ def async_track_point_in_utc_time(
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
     point_in_time: datetime,
+    *,
+    jitter: float = 0,
 ) -> CALLBACK_TYPE:
-    """Add a listener that fires once after a specific point in UTC time."""
+    """Add a listener that fires once after a specific point in UTC time.
+
+    The listener may be called up to jitter seconds early, so it can
+    share a timer with other listeners. Accepting jitter is worth it
+    when many listeners are tracked, like polling and refresh timers.
+    """
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
     expected_fire_timestamp = dt_util.utc_to_timestamp(utc_point_in_time)
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | _TimerWheelTimer | None = None
     loop = hass.loop
 
     @callback
@@ -1402,7 +1786,7 @@ def async_track_point_in_utc_time(
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
+        if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > jitter:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
             cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
@@ -1416,7 +1800,15 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    if jitter:
+        cancel_callback = _async_get_timer_wheel(hass).async_call_at(
+            loop.time() + delta,
+            jitter,
+            ft.partial(run_action, job),
+            bool(job.cancel_on_shutdown),
+        )
+    else:
+        cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1437,8 +1829,14 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    jitter: float = 0,
 ) -> CALLBACK_TYPE:
-    """Add a listener that is called in <delay>."""
+    """Add a listener that is called in <delay>.
+
+    The listener may be called up to jitter seconds early, so it can share
+    a timer with other listeners, see async_track_point_in_utc_time.
+    """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
 
@@ -1452,7 +1850,16 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    cancel_callback = hass.loop.call_at(hass.loop.time() + delay, run_action, job)
+    cancel_callback: asyncio.TimerHandle | _TimerWheelTimer
+    if jitter:
+        cancel_callback = _async_get_timer_wheel(hass).async_call_at(
+            hass.loop.time() + delay,
+            jitter,
+            ft.partial(run_action, job),
+            bool(job.cancel_on_shutdown),
+        )
+    else:
+        cancel_callback = hass.loop.call_at(hass.loop.time() + delay, run_action, job)
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -1475,8 +1882,13 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    jitter: float = 0,
 ) -> CALLBACK_TYPE:
-    """Add a listener that fires repetitively at every timedelta interval."""
+    """Add a listener that fires repetitively at every timedelta interval.
+
+    Each interval may elapse up to jitter seconds early, see
+    async_track_point_in_utc_time.
+    """
     remove: CALLBACK_TYPE
     interval_listener_job: HassJob[[datetime], None]
 
@@ -1495,7 +1907,7 @@ def async_track_time_interval(
         nonlocal interval_listener_job
 
         remove = async_track_point_in_utc_time(
-            hass, interval_listener_job, next_interval()
+            hass, interval_listener_job, next_interval(), jitter=jitter
         )
         hass.async_run_hass_job(job, now)
 
@@ -1507,7 +1919,9 @@ def async_track_time_interval(
     interval_listener_job = HassJob(
         interval_listener, job_name, cancel_on_shutdown=cancel_on_shutdown
     )
-    remove = async_track_point_in_utc_time(hass, interval_listener_job, next_interval())
+    remove = async_track_point_in_utc_time(
+        hass, interval_listener_job, next_interval(), jitter=jitter
+    )
 
     def remove_listener() -> None:
         """Remove interval listener."""
@@ -1615,6 +2029,152 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+class _TimePattern:
+    """A time pattern and the listeners of its matching times."""
+
+    __slots__ = (
+        "seconds",
+        "minutes",
+        "hours",
+        "local",
+        "microsecond",
+        "jobs",
+        "fire_job",
+        "next_fire",
+        "cancel",
+    )
+
+    def __init__(
+        self, seconds: list[int], minutes: list[int], hours: list[int], local: bool
+    ) -> None:
+        """Initialize the time pattern."""
+        self.seconds = seconds
+        self.minutes = minutes
+        self.hours = hours
+        self.local = local
+        # Avoid aligning all time patterns to the same second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        self.microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        self.jobs: dict[HassJob[[datetime], Any], None] = {}
+        self.fire_job: HassJob[[datetime], Any] | None = None
+        self.next_fire: datetime | None = None
+        self.cancel: CALLBACK_TYPE | None = None
+
+    def calculate_next(self, now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.find_next_time_expression_time(
+            localized_now, self.seconds, self.minutes, self.hours
+        ).replace(microsecond=self.microsecond)
+
+
+class _TimePatternScheduler:
+    """Schedule the time change listeners by time pattern.
+
+    The listeners with the same pattern share a single timer, so the
+    next time the pattern matches is calculated once and all of them
+    are called from the same wakeup.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._patterns: dict[
+            tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool],
+            _TimePattern,
+        ] = {}
+
+    @callback
+    def async_add_listener(
+        self,
+        job: HassJob[[datetime], Any],
+        seconds: list[int],
+        minutes: list[int],
+        hours: list[int],
+        local: bool,
+    ) -> CALLBACK_TYPE:
+        """Add a listener of the times matching a pattern."""
+        key = (tuple(seconds), tuple(minutes), tuple(hours), local)
+        if (pattern := self._patterns.get(key)) is None:
+            pattern = self._patterns[key] = _TimePattern(seconds, minutes, hours, local)
+            pattern.fire_job = HassJob(
+                ft.partial(self._async_fire, pattern),
+                f"time pattern {hours}:{minutes}:{seconds} local={local}",
+            )
+            self._async_schedule(pattern, pattern.calculate_next(dt_util.utcnow()))
+        pattern.jobs[job] = None
+
+        @callback
+        def _async_remove_listener() -> None:
+            """Remove the listener and the pattern once unused."""
+            if pattern.jobs.pop(job, False) is None and not pattern.jobs:
+                del self._patterns[key]
+                assert pattern.cancel is not None
+                pattern.cancel()
+
+        return _async_remove_listener
+
+    @callback
+    def _async_schedule(self, pattern: _TimePattern, next_fire: datetime) -> None:
+        """Schedule the next time the pattern matches."""
+        assert pattern.fire_job is not None
+        pattern.next_fire = next_fire
+        pattern.cancel = async_track_point_in_utc_time(
+            self._hass, pattern.fire_job, next_fire
+        )
+
+    @callback
+    def _async_fire(self, pattern: _TimePattern, _: datetime) -> None:
+        """Call the listeners of the pattern and schedule the next match."""
+        now = time_tracker_utcnow()
+        self._async_schedule(
+            pattern, pattern.calculate_next(now + timedelta(seconds=1))
+        )
+        fired = dt_util.as_local(now) if pattern.local else now
+        for job in list(pattern.jobs):
+            try:
+                self._hass.async_run_hass_job(job, fired)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error calling time change listener %s", job)
+
+    @callback
+    def async_next_fire_times(self) -> list[dict[str, Any]]:
+        """Return the next time each pattern matches."""
+        return [
+            {
+                "hours": pattern.hours,
+                "minutes": pattern.minutes,
+                "seconds": pattern.seconds,
+                "local": pattern.local,
+                "listeners": len(pattern.jobs),
+                "next_fire": pattern.next_fire,
+            }
+            for pattern in sorted(
+                self._patterns.values(),
+                key=lambda pattern: pattern.next_fire or dt_util.utcnow(),
+            )
+        ]
+
+
+@callback
+def _async_get_time_pattern_scheduler(hass: HomeAssistant) -> _TimePatternScheduler:
+    """Return the scheduler of the time change listeners."""
+    if (scheduler := hass.data.get(TIME_PATTERN_SCHEDULER)) is None:
+        scheduler = hass.data[TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(hass)
+    return scheduler
+
+
+@callback
+@bind_hass
+def async_time_change_next_fire_times(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the time patterns listened to and the next time each matches.
+
+    The patterns are sorted by their next match, for diagnostics.
+    """
+    return _async_get_time_pattern_scheduler(hass).async_next_fire_times()
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1637,55 +2197,13 @@ def async_track_utc_time_change(
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
     job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
-    matching_seconds = dt_util.parse_time_expression(second, 0, 59)
-    matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
-    matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        ).replace(microsecond=microsecond)
-
-    time_listener: CALLBACK_TYPE | None = None
-    pattern_time_change_listener_job: HassJob[[datetime], Any] | None = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-        nonlocal pattern_time_change_listener_job
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-        assert pattern_time_change_listener_job is not None
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener_job,
-            calculate_next(now + timedelta(seconds=1)),
-        )
-
-    pattern_time_change_listener_job = HassJob(
-        pattern_time_change_listener,
-        f"time change listener {hour}:{minute}:{second} {action}",
+    return _async_get_time_pattern_scheduler(hass).async_add_listener(
+        job,
+        dt_util.parse_time_expression(second, 0, 59),
+        dt_util.parse_time_expression(minute, 0, 59),
+        dt_util.parse_time_expression(hour, 0, 23),
+        local,
     )
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener_job, calculate_next(dt_util.utcnow())
-    )
-
-    @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
-
-    return unsub_pattern_time_change_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -1765,11 +2283,24 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        # When the entity only matched the domains or all states iterated,
+        # the template only depends on the fields it read from them
+        return (
+            new_state is None
+            or old_state is None
+            or (state_fields := info.state_fields) is None
+            or entity_id in info.entities
+            or any(
+                getattr(old_state, field) != getattr(new_state, field)
+                for field in state_fields
+            )
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
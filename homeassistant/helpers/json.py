@@ -69,6 +69,9 @@ else:
     )
     """Dump json bytes."""
 
+json_fragment = orjson.Fragment
+"""Wrap already serialized json so it is embedded as-is when dumping."""
+
 
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
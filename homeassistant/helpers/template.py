@@ -20,11 +20,13 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType
 from typing import (
     Any,
     Concatenate,
     Literal,
+    NamedTuple,
     NoReturn,
     ParamSpec,
     TypeVar,
@@ -52,13 +54,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -81,6 +86,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -93,6 +99,11 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_CACHE_STORAGE_KEY = "template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -103,15 +114,17 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 _GROUP_DOMAIN_PREFIX = "group."
 _ZONE_DOMAIN_PREFIX = "zone."
 
+# Map the collectable attributes to the State field they are read from,
+# entity_id for the ones that never change
 _COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+    "state": "state",
+    "attributes": "attributes",
+    "last_changed": "last_changed",
+    "last_updated": "last_updated",
+    "context": "context",
+    "domain": "entity_id",
+    "object_id": "entity_id",
+    "name": "attributes",
 }
 
 _T = TypeVar("_T")
@@ -343,6 +356,9 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "cacheable",
+        "state_fields",
+        "entity_fields",
     )
 
     def __init__(self, template: Template) -> None:
@@ -361,6 +377,14 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # False when the result depends on more than the states collected
+        self.cacheable = True
+        # The State fields read from the states of the domains or all
+        # states iterated, None if the whole states were used
+        self.state_fields: collections.abc.Set[str] | None = set()
+        # The State fields read from the state of each entity collected,
+        # None if the whole state was used
+        self.entity_fields: dict[str, set[str] | None] = {}
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -373,11 +397,27 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" cacheable={self.cacheable}"
+            f" state_fields={self.state_fields}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
         )
 
+    def _collect_entity(self, entity_id: str, fields: tuple[str, ...]) -> None:
+        """Collect an entity and the fields read from its state.
+
+        The whole state is used if no fields are given.
+        """
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_fields = self.entity_fields
+        if not fields:
+            entity_fields[entity_id] = None
+        elif entity_id not in entity_fields:
+            entity_fields[entity_id] = set(fields)
+        elif (collected := entity_fields[entity_id]) is not None:
+            collected.update(fields)
+
     def _filter_domains_and_entities(self, entity_id: str) -> bool:
         """Template should re-render if the entity state changes.
 
@@ -416,6 +456,8 @@ class RenderInfo:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        if self.state_fields is not None:
+            self.state_fields = frozenset(self.state_fields)
 
     def _freeze(self) -> None:
         self._freeze_sets()
@@ -461,6 +503,9 @@ class Template:
         "_strict",
         "_hash_cache",
         "_renders",
+        "_render_cache",
+        "_render_cache_hits",
+        "_render_cache_misses",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -478,6 +523,19 @@ class Template:
         self._strict: bool | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._render_cache: _RenderCache | None = None
+        self._render_cache_hits: int = 0
+        self._render_cache_misses: int = 0
+
+    @property
+    def render_cache_hits(self) -> int:
+        """Return how many renders to info reused the previous render."""
+        return self._render_cache_hits
+
+    @property
+    def render_cache_misses(self) -> int:
+        """Return how many renders to info could not reuse the previous render."""
+        return self._render_cache_misses
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -679,6 +737,17 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        if not kwargs:
+            if (
+                cached_render_info := self._async_get_cached_render_info(
+                    variables, strict
+                )
+            ) is not None:
+                self._render_cache_hits += 1
+                return cached_render_info
+            self._render_cache_misses += 1
+        self._render_cache = None
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(variables, strict=strict, **kwargs)
@@ -688,8 +757,56 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        if (
+            not kwargs
+            and render_info.cacheable
+            and render_info.exception is None
+            and not render_info.has_time
+            and not render_info.all_states
+            and not render_info.all_states_lifecycle
+            and not render_info.domains
+            and not render_info.domains_lifecycle
+            and _render_cache_variables(variables)
+        ):
+            get_state = self.hass.states.get
+            entity_fields = render_info.entity_fields
+            self._render_cache = _RenderCache(
+                None if variables is None else dict(variables),
+                strict,
+                render_info,
+                tuple(
+                    (entity_id, get_state(entity_id), entity_fields.get(entity_id))
+                    for entity_id in render_info.entities
+                ),
+            )
         return render_info
 
+    @callback
+    def _async_get_cached_render_info(
+        self, variables: TemplateVarsType, strict: bool
+    ) -> RenderInfo | None:
+        """Return the previous render if none of the states it used changed.
+
+        The result of a render is only kept when it depended on nothing
+        but the states of the entities it collected, see RenderInfo. Only
+        the fields the render read from each state are compared, so a new
+        state object with the same state does not render again unless the
+        render used the whole state.
+
+        The variables are compared by content, the render is only kept
+        when the values of the variables can not be modified in place.
+        """
+        if (render_cache := self._render_cache) is None:
+            return None
+        if render_cache.strict != strict or render_cache.variables != variables:
+            return None
+        assert self.hass
+        get_state = self.hass.states.get
+        for entity_id, state, fields in render_cache.states:
+            if not _same_state_fields(state, get_state(entity_id), fields):
+                return None
+        return render_cache.render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -763,11 +880,15 @@ class Template:
         self._strict = strict
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Templates with the same source share the compiled template
+        # of the environment for as long as one of them is alive
+        if (compiled := env.compiled_template_cache.get(self.template)) is None:
+            compiled = env.compiled_template_cache[
+                self.template
+            ] = jinja2.Template.from_code(env, self._compiled_code, env.globals, None)
+        self._compiled = compiled
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -786,6 +907,52 @@ class Template:
         return f"Template<template=({self.template}) renders={self._renders}>"
 
 
+def _render_cache_variables(variables: TemplateVarsType) -> bool:
+    """Return if a render with the variables can be reused.
+
+    The values must be immutable for a copy of the variables to tell if
+    they changed. Template states read the state machine when they are
+    used, so the states they return are collected by the render.
+    """
+    return variables is None or all(
+        value is None or isinstance(value, (str, int, float, TemplateStateBase))
+        for value in variables.values()
+    )
+
+
+def _same_state_fields(
+    old_state: State | None, new_state: State | None, fields: set[str] | None
+) -> bool:
+    """Return if the fields of the states are the same.
+
+    All fields are compared if fields is None.
+    """
+    if old_state is new_state:
+        return True
+    if old_state is None or new_state is None or fields is None:
+        return False
+    for field in fields:
+        if field == "attributes":
+            # Unchanged attributes are usually shared between states
+            if (
+                old_state.attributes is not new_state.attributes
+                and old_state.attributes != new_state.attributes
+            ):
+                return False
+        elif getattr(old_state, field) != getattr(new_state, field):
+            return False
+    return True
+
+
+class _RenderCache(NamedTuple):
+    """The last render of a template and the states it used."""
+
+    variables: TemplateVarsType
+    strict: bool
+    render_info: RenderInfo
+    states: tuple[tuple[str, State | None, set[str] | None], ...]
+
+
 @cache
 def _domain_states(hass: HomeAssistant, name: str) -> DomainStates:
     return DomainStates(hass, name)
@@ -926,23 +1093,44 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+    def _collect_state(self, *fields: str) -> None:
+        """Collect the entity or the fields read if it was iterated.
+
+        The whole state is used if no fields are given.
+        """
+        if (render_info := _render_info.get()) is None:
+            return
+        if self._collect:
+            render_info._collect_entity(  # pylint: disable=protected-access
+                self._entity_id, fields
+            )
+        elif render_info.state_fields is not None:
+            if fields:
+                render_info.state_fields.update(fields)  # type: ignore[attr-defined]
+            else:
+                render_info.state_fields = None
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
-        if item in _COLLECTABLE_STATE_ATTRIBUTES:
+        if (field := _COLLECTABLE_STATE_ATTRIBUTES.get(item)) is not None:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info._collect_entity(  # pylint: disable=protected-access
+                        self._entity_id, (field,)
+                    )
+                elif render_info.state_fields is not None:
+                    render_info.state_fields.add(field)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
         if item == "state_with_unit":
             return self.state_with_unit
+        if not self._collect:
+            # Jinja falls back to the methods, like as_dict, using the whole state
+            self._collect_state()
         raise KeyError
 
     @property
@@ -956,49 +1144,49 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state("entity_id")
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state("entity_id")
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.name
 
     @property
@@ -1015,7 +1203,7 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state", "attributes")
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1029,6 +1217,21 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.__eq__(other)
 
+    def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
+        """Ensure we collect when the cached dict representation is used."""
+        self._collect_state()
+        return super().as_dict()
+
+    def as_dict_json(self) -> str:
+        """Ensure we collect when the cached JSON representation is used."""
+        self._collect_state()
+        return super().as_dict_json()
+
+    def as_compressed_state_json(self) -> str:
+        """Ensure we collect when the cached JSON representation is used."""
+        self._collect_state()
+        return super().as_compressed_state_json()
+
 
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
@@ -1043,6 +1246,9 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        if not self._collect:
+            # A state of the domains or all states iterated is rendered
+            self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1072,7 +1278,9 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect._collect_entity(  # pylint: disable=protected-access
+            entity_id, ()
+        )
 
 
 def _state_generator(
@@ -2090,6 +2298,8 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    if (render_info := _render_info.get()) is not None:
+        render_info.cacheable = False
     return random.choice(values)
 
 
@@ -2274,6 +2484,86 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the bytecode of the templates compiled in the previous run."""
+    store: Store[dict[str, Any]] = Store(
+        hass, BYTECODE_CACHE_STORAGE_VERSION, BYTECODE_CACHE_STORAGE_KEY
+    )
+    bytecode_cache = _get_bytecode_cache(hass)
+    if (data := await store.async_load()) and data["ha_version"] == __version__:
+        bytecode_cache.load(data["bytecode"])
+
+    @callback
+    def _async_save(_: Event) -> None:
+        """Save the bytecode if templates were compiled."""
+        if bytecode_cache.dirty:
+            store.async_delay_save(
+                bytecode_cache.data_to_save, BYTECODE_CACHE_SAVE_DELAY
+            )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save)
+
+
+@singleton(_BYTECODE_CACHE)
+def _get_bytecode_cache(hass: HomeAssistant) -> HassBytecodeCache:
+    return HassBytecodeCache()
+
+
+class HassBytecodeCache(jinja2.BytecodeCache):
+    """An in-memory jinja bytecode cache persisted in the storage.
+
+    The cache is keyed by the hash of the template source, the options of
+    the environment and the time zone, the bytecode includes the jinja and
+    python versions it was compiled with and is discarded on a mismatch.
+    The cache is dropped when Home Assistant is updated. Only the bytecode
+    of the templates compiled during the current run is saved.
+
+    Templates may be compiled in any thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty bytecode cache."""
+        self._lock = threading.Lock()
+        self._bytecode: dict[str, bytes] = {}
+        self._used: set[str] = set()
+        self.dirty = False
+
+    def load(self, bytecode: dict[str, str]) -> None:
+        """Load the bytecode stored by data_to_save."""
+        loaded = {key: base64.b64decode(value) for key, value in bytecode.items()}
+        with self._lock:
+            self._bytecode = loaded
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode of a template into the bucket."""
+        with self._lock:
+            if (bytecode := self._bytecode.get(bucket.key)) is None:
+                return
+            self._used.add(bucket.key)
+        bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode of a template that was compiled."""
+        bytecode = bucket.bytecode_to_string()
+        with self._lock:
+            self._bytecode[bucket.key] = bytecode
+            self._used.add(bucket.key)
+            self.dirty = True
+
+    def data_to_save(self) -> dict[str, Any]:
+        """Return the bytecode of the templates used to save in the storage."""
+        with self._lock:
+            self.dirty = False
+            used = [(key, self._bytecode[key]) for key in self._used]
+        return {
+            "ha_version": __version__,
+            "bytecode": {
+                key: base64.b64encode(bytecode).decode() for key, bytecode in used
+            },
+        }
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2289,6 +2579,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_template_cache: weakref.WeakValueDictionary[
+            str, jinja2.Template
+        ] = weakref.WeakValueDictionary()
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2375,6 +2668,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         # This environment has access to hass, attach its loader to enable imports.
         self.loader = _get_hass_loader(hass)
+        self.bytecode_cache = _get_bytecode_cache(hass)
+        self._bytecode_scope = f"limited={limited},strict={strict}"
 
         # We mark these as a context functions to ensure they get
         # evaluated fresh with every execution, rather than executed
@@ -2391,37 +2686,52 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
             return pass_context(wrapper)
 
-        self.globals["device_entities"] = hassfunction(device_entities)
+        def hassfunction_uncacheable(
+            func: Callable[Concatenate[HomeAssistant, _P], _R],
+        ) -> Callable[Concatenate[Any, _P], _R]:
+            """Wrap function that depend on hass but not only on the states."""
+
+            @wraps(func)
+            def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+                if (render_info := _render_info.get()) is not None:
+                    render_info.cacheable = False
+                return func(hass, *args, **kwargs)
+
+            return pass_context(wrapper)
+
+        self.globals["device_entities"] = hassfunction_uncacheable(device_entities)
         self.filters["device_entities"] = pass_context(self.globals["device_entities"])
 
-        self.globals["device_attr"] = hassfunction(device_attr)
+        self.globals["device_attr"] = hassfunction_uncacheable(device_attr)
         self.filters["device_attr"] = pass_context(self.globals["device_attr"])
 
-        self.globals["is_device_attr"] = hassfunction(is_device_attr)
+        self.globals["is_device_attr"] = hassfunction_uncacheable(is_device_attr)
         self.tests["is_device_attr"] = pass_eval_context(self.globals["is_device_attr"])
 
-        self.globals["config_entry_id"] = hassfunction(config_entry_id)
+        self.globals["config_entry_id"] = hassfunction_uncacheable(config_entry_id)
         self.filters["config_entry_id"] = pass_context(self.globals["config_entry_id"])
 
-        self.globals["device_id"] = hassfunction(device_id)
+        self.globals["device_id"] = hassfunction_uncacheable(device_id)
         self.filters["device_id"] = pass_context(self.globals["device_id"])
 
-        self.globals["areas"] = hassfunction(areas)
+        self.globals["areas"] = hassfunction_uncacheable(areas)
         self.filters["areas"] = pass_context(self.globals["areas"])
 
-        self.globals["area_id"] = hassfunction(area_id)
+        self.globals["area_id"] = hassfunction_uncacheable(area_id)
         self.filters["area_id"] = pass_context(self.globals["area_id"])
 
-        self.globals["area_name"] = hassfunction(area_name)
+        self.globals["area_name"] = hassfunction_uncacheable(area_name)
         self.filters["area_name"] = pass_context(self.globals["area_name"])
 
-        self.globals["area_entities"] = hassfunction(area_entities)
+        self.globals["area_entities"] = hassfunction_uncacheable(area_entities)
         self.filters["area_entities"] = pass_context(self.globals["area_entities"])
 
-        self.globals["area_devices"] = hassfunction(area_devices)
+        self.globals["area_devices"] = hassfunction_uncacheable(area_devices)
         self.filters["area_devices"] = pass_context(self.globals["area_devices"])
 
-        self.globals["integration_entities"] = hassfunction(integration_entities)
+        self.globals["integration_entities"] = hassfunction_uncacheable(
+            integration_entities
+        )
         self.filters["integration_entities"] = pass_context(
             self.globals["integration_entities"]
         )
@@ -2481,10 +2791,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = pass_context(self.globals["expand"])
-        self.globals["closest"] = hassfunction(closest)
-        self.filters["closest"] = pass_context(hassfunction(closest_filter))
-        self.globals["distance"] = hassfunction(distance)
-        self.globals["is_hidden_entity"] = hassfunction(is_hidden_entity)
+        self.globals["closest"] = hassfunction_uncacheable(closest)
+        self.filters["closest"] = pass_context(hassfunction_uncacheable(closest_filter))
+        self.globals["distance"] = hassfunction_uncacheable(distance)
+        self.globals["is_hidden_entity"] = hassfunction_uncacheable(is_hidden_entity)
         self.tests["is_hidden_entity"] = pass_eval_context(
             self.globals["is_hidden_entity"]
         )
@@ -2571,9 +2881,27 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_cached(source)
 
         return cached
 
+    def _compile_cached(self, source: str | jinja2.nodes.Template) -> CodeType:
+        """Compile the template or load its bytecode from the bytecode cache."""
+        if self.bytecode_cache is None or not isinstance(source, str):
+            return super().compile(source)
+        # Jinja folds constant expressions when a template is compiled, like
+        # filters applied to literals, so the bytecode depends on the filters
+        # of the environment and the time zone some of them convert to
+        bucket = self.bytecode_cache.get_bucket(
+            self,
+            f"{self._bytecode_scope},time_zone={dt_util.DEFAULT_TIME_ZONE}",
+            source,
+            source,
+        )
+        if bucket.code is None:
+            bucket.code = super().compile(source)
+            self.bytecode_cache.set_bucket(bucket)
+        return bucket.code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
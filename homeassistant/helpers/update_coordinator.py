@@ -29,6 +29,10 @@ from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
+# How many seconds early a refresh may start so the refresh timers of the
+# coordinators share loop timers. It is shorter than the random
+# microsecond the refreshes are staggered with.
+REFRESH_TIMER_JITTER = 0.05
 
 _DataT = TypeVar("_DataT")
 _BaseDataUpdateCoordinatorT = TypeVar(
@@ -228,6 +232,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             self.hass,
             self._job,
             utcnow().replace(microsecond=self._microsecond) + self.update_interval,
+            jitter=REFRESH_TIMER_JITTER,
         )
 
     async def _handle_refresh_interval(self, _now: datetime) -> None:
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -32,6 +33,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .util.async_ import gather_with_concurrency
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 # Typing imports that create a circular dependency
@@ -48,6 +50,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_PLATFORM_IMPORTS = "platform_imports"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +64,9 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+CUSTOM_MANIFESTS_STORAGE_KEY = "custom_components_manifests"
+CUSTOM_MANIFESTS_STORAGE_VERSION = 1
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -189,25 +195,63 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    def get_sub_directories(
+        paths: list[str],
+        cached_directories: dict[str, Any],
+        directories: dict[str, Any],
+    ) -> list[str]:
+        """Return the names of all sub directories in a set of paths.
+
+        The sub directories of a path are read from cached_directories, as long
+        as the modification time of the path did not change, and stored in
+        directories with it.
+        """
+        names: list[str] = []
+        for path in paths:
+            try:
+                mtime = pathlib.Path(path).stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = cached_directories.get(path)
+            if cached and cached["mtime"] == mtime:
+                sub_directories = cached["sub_directories"]
+            else:
+                with os.scandir(path) as entries:
+                    sub_directories = sorted(
+                        entry.name for entry in entries if entry.is_dir()
+                    )
+            directories[path] = {"mtime": mtime, "sub_directories": sub_directories}
+            names.extend(sub_directories)
+        return names
+
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store: Store[dict[str, Any]] = Store(
+        hass, CUSTOM_MANIFESTS_STORAGE_VERSION, CUSTOM_MANIFESTS_STORAGE_KEY
+    )
+    cached = await store.async_load() or {}
+    directories: dict[str, Any] = {}
+    manifests: dict[str, Any] = {}
+
+    names = await hass.async_add_executor_job(
+        get_sub_directories,
+        custom_components.__path__,
+        cached.get("directories", {}),
+        directories,
     )
 
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        names,
+        cached.get("manifests", {}),
+        manifests,
     )
+    data = {"directories": directories, "manifests": manifests}
+    if data != cached:
+        await store.async_save(data)
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -541,33 +585,90 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+@ft.cache
+def _get_builtin_manifests() -> tuple[int, dict[str, Manifest]]:
+    """Return the manifests of the built-in integrations generated by hassfest.
+
+    The manifests are returned with the modification time of the generated file.
+    """
+    manifests_path = pathlib.Path(generated.__path__[0]) / "integration_manifests.json"
+    try:
+        mtime = manifests_path.stat().st_mtime_ns
+        return mtime, cast(dict[str, Manifest], json_loads(manifests_path.read_bytes()))
+    except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+        _LOGGER.warning("Unable to read the built-in integration manifests: %s", err)
+        return 0, {}
+
+
 class Integration:
     """An integration in Home Assistant."""
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        cached_manifests: dict[str, Any] | None = None,
+        manifests: dict[str, Any] | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        The manifests of the built-in integrations are read from the manifests
+        generated by hassfest, unless their manifest.json was modified after
+        them. The other manifests are read from cached_manifests, as long as
+        their modification time did not change, and stored in manifests with it.
+        """
+        if root_module.__name__ == PACKAGE_BUILTIN:
+            builtin_mtime, builtin_manifests = _get_builtin_manifests()
+            if manifest := builtin_manifests.get(domain):
+                file_path = pathlib.Path(root_module.__path__[0]) / domain
+                try:
+                    stale = (
+                        file_path / "manifest.json"
+                    ).stat().st_mtime_ns > builtin_mtime
+                except OSError:
+                    stale = True
+                if not stale:
+                    return cls(
+                        hass,
+                        f"{PACKAGE_BUILTIN}.{domain}",
+                        file_path,
+                        cast(Manifest, dict(manifest)),
+                    )
+                _LOGGER.debug(
+                    "The manifest of %s is newer than the generated manifests",
+                    domain,
+                )
+
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
                 continue
 
+            cached = cached_manifests and cached_manifests.get(str(manifest_path))
+            if cached and cached["mtime"] == mtime:
+                manifest = cast(Manifest, cached["manifest"])
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+            if manifests is not None:
+                manifests[str(manifest_path)] = {"mtime": mtime, "manifest": manifest}
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 manifest_path.parent,
-                manifest,
+                cast(Manifest, dict(manifest)),
             )
 
             if integration.is_built_in:
@@ -826,25 +927,59 @@ class Integration:
         """Return a platform for an integration."""
         cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
-        if full_name in cache:
-            return cache[full_name]
+        if full_name not in cache:
+            try:
+                cache[full_name] = self._import_platform(platform_name)
+            except ImportError:
+                raise
+            except Exception as err:
+                _LOGGER.exception(
+                    "Unexpected exception importing platform %s.%s",
+                    self.pkg_path,
+                    platform_name,
+                )
+                raise ImportError(
+                    f"Exception importing {self.pkg_path}.{platform_name}"
+                ) from err
 
-        try:
-            cache[full_name] = self._import_platform(platform_name)
-        except ImportError:
-            raise
-        except Exception as err:
-            _LOGGER.exception(
-                "Unexpected exception importing platform %s.%s",
-                self.pkg_path,
-                platform_name,
-            )
-            raise ImportError(
-                f"Exception importing {self.pkg_path}.{platform_name}"
-            ) from err
+        # Record the platforms used while the startup profile is recorded
+        if (platform_imports := self.hass.data.get(DATA_PLATFORM_IMPORTS)) is not None:
+            platform_imports.setdefault(full_name, None)
 
         return cache[full_name]
 
+    def preimport_platforms(self, platform_names: Iterable[str]) -> None:
+        """Import platforms ahead of their use.
+
+        Errors are only logged at debug level, they are reported again when
+        the platform is requested with get_platform. The modules of a platform
+        that failed to import are removed from sys.modules.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        for platform_name in platform_names:
+            full_name = f"{self.domain}.{platform_name}"
+            if full_name in cache:
+                continue
+
+            try:
+                cache[full_name] = self._import_platform(platform_name)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Unable to preimport platform %s.%s",
+                    self.pkg_path,
+                    platform_name,
+                    exc_info=True,
+                )
+                # The submodules of the platform imported before the error
+                # are dropped so its setup imports the platform from scratch
+                module_name = f"{self.pkg_path}.{platform_name}"
+                for name in [
+                    name
+                    for name in sys.modules
+                    if name == module_name or name.startswith(f"{module_name}.")
+                ]:
+                    sys.modules.pop(name, None)
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
@@ -855,13 +990,19 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: list[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: list[str],
+    cached_manifests: dict[str, Any] | None = None,
+    manifests: dict[str, Any] | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, cached_manifests, manifests
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -956,6 +1097,32 @@ async def async_get_integrations(
     return results
 
 
+async def async_preimport_platforms(
+    hass: HomeAssistant, platforms: Iterable[str]
+) -> None:
+    """Import integration platforms in the executor ahead of their setup.
+
+    The platforms are given as <domain>.<platform> and imported in the given
+    order, the platforms of different integrations in parallel.
+    """
+    platforms_by_domain: dict[str, list[str]] = {}
+    for full_name in platforms:
+        domain, _, platform_name = full_name.partition(".")
+        platforms_by_domain.setdefault(domain, []).append(platform_name)
+
+    integrations = await async_get_integrations(hass, platforms_by_domain)
+    await gather_with_concurrency(
+        MAX_LOAD_CONCURRENTLY,
+        *(
+            hass.async_add_executor_job(
+                integration.preimport_platforms, platforms_by_domain[domain]
+            )
+            for domain, integration in integrations.items()
+            if isinstance(integration, Integration)
+        ),
+    )
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -6,15 +6,24 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import time
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfPower
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change,
     async_track_state_change_event,
 )
@@ -120,6 +129,73 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_10k_filtered_listeners(hass):
+    """Fire 100k events against 10k listeners that filter by entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        entity_id = f"light.kitchen{idx}"
+
+        @core.callback
+        def event_filter(event, entity_id=entity_id):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx}"})
+
+    await hass.async_block_till_done()
+
+    assert count == listeners
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_10k_keyed_listeners(hass):
+    """Fire 100k events against 10k listeners keyed by entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        hass.bus.async_listen_keyed(
+            event_name, "entity_id", [f"light.kitchen{idx}"], listener
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx}"})
+
+    await hass.async_block_till_done()
+
+    assert count == listeners
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -227,6 +303,110 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+async def _call_later_timers(hass, jitter):
+    """Call 50k timers due within the next second.
+
+    The timers are spread over a second, so the CPU time is measured
+    instead of the wall time.
+    """
+    count = 0
+    timers_to_call = 50000
+    done = asyncio.Event()
+
+    @core.callback
+    def action(_):
+        """Handle timer."""
+        nonlocal count
+        count += 1
+        if count == timers_to_call:
+            done.set()
+
+    job = core.HassJob(action)
+    start = time.process_time()
+
+    for idx in range(timers_to_call):
+        async_call_later(hass, idx / timers_to_call, job, jitter=jitter)
+
+    await done.wait()
+
+    return time.process_time() - start
+
+
+@benchmark
+async def call_later_50k_timers(hass):
+    """Call 50k timers each scheduled on the event loop."""
+    return await _call_later_timers(hass, 0)
+
+
+@benchmark
+async def call_later_50k_timers_with_jitter(hass):
+    """Call 50k timers that accept 50 ms of jitter from the timer wheel."""
+    return await _call_later_timers(hass, 0.05)
+
+
+async def _sensor_entity_writes(
+    hass, cache_static_attributes, skip_unchanged_writes=False, unchanged=False
+):
+    """Write the state of a power sensor 100k times."""
+    writes = 10**5
+
+    class PowerSensor(SensorEntity):
+        """Power sensor reporting a new value on every write."""
+
+        _cache_static_attributes = cache_static_attributes
+        _skip_unchanged_writes = skip_unchanged_writes
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_name = "Power"
+        _attr_native_unit_of_measurement = UnitOfPower.WATT
+        _attr_state_class = SensorStateClass.MEASUREMENT
+
+    sensor = PowerSensor()
+    sensor.hass = hass
+    sensor.entity_id = "sensor.power"
+    sensor.platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+
+    start = timer()
+
+    for value in range(writes):
+        native_value = 0 if unchanged else value
+        sensor._attr_native_value = native_value  # pylint: disable=protected-access
+        sensor.async_write_ha_state()
+
+    return timer() - start
+
+
+@benchmark
+async def sensor_entity_write_ha_state(hass):
+    """Write the state of a sensor 100k times."""
+    return await _sensor_entity_writes(hass, False)
+
+
+@benchmark
+async def sensor_entity_write_ha_state_static_attributes_cached(hass):
+    """Write the state of a sensor caching its static attributes 100k times."""
+    return await _sensor_entity_writes(hass, True)
+
+
+@benchmark
+async def sensor_entity_write_unchanged_ha_state(hass):
+    """Write the same state of a sensor 100k times."""
+    return await _sensor_entity_writes(hass, True, unchanged=True)
+
+
+@benchmark
+async def sensor_entity_write_unchanged_ha_state_skipped(hass):
+    """Write the same state of a sensor skipping unchanged writes 100k times."""
+    return await _sensor_entity_writes(hass, True, True, True)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +494,51 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _reduce_statistics_per_day(vectorized):
+    """Reduce a year of hourly statistics of 50 meters to daily statistics."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    hour_start = 1672531200.0
+    stats = {
+        f"sensor.meter_{meter}": [
+            {
+                "start": hour_start + hour * 3600,
+                "end": hour_start + (hour + 1) * 3600,
+                "mean": float(hour % 24),
+                "min": float(hour % 12),
+                "max": float(hour % 36),
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(24 * 365)
+        ]
+        for meter in range(50)
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    if not vectorized:
+        statistics.VECTORIZED_REDUCE_MIN_ROWS = 10**9
+
+    start = timer()
+    statistics._reduce_statistics_per_day(  # pylint: disable=protected-access
+        stats, types
+    )
+    return timer() - start
+
+
+@benchmark
+async def reduce_statistics_per_day(hass):
+    """Reduce a year of hourly statistics of 50 meters with numpy."""
+    return _reduce_statistics_per_day(True)
+
+
+@benchmark
+async def reduce_statistics_per_day_python(hass):
+    """Reduce a year of hourly statistics of 50 meters without numpy."""
+    return _reduce_statistics_per_day(False)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
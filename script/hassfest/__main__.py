@@ -15,6 +15,7 @@ from . import (
     coverage,
     dependencies,
     dhcp,
+    integration_manifests,
     json,
     manifest,
     metadata,
@@ -36,6 +37,7 @@ INTEGRATION_PLUGINS = [
     config_schema,
     dependencies,
     dhcp,
+    integration_manifests,
     json,
     manifest,
     mqtt,
@@ -0,0 +1,57 @@
+"""Generate the integration manifests file."""
+from __future__ import annotations
+
+import json
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: dict[str, Integration]) -> str:
+    """Validate and generate the integration manifests data."""
+    manifests = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest_path is not None
+    }
+
+    return json.dumps(manifests, separators=(",", ":"), sort_keys=True)
+
+
+def validate(integrations: dict[str, Integration], config: Config) -> None:
+    """Validate integration manifests file."""
+    manifests_path = config.root / "homeassistant/generated/integration_manifests.json"
+    config.cache["integration_manifests"] = content = generate_and_validate(
+        integrations
+    )
+
+    with open(str(manifests_path)) as fp:
+        current = fp.read()
+
+    if config.specific_integrations:
+        generated = json.loads(current)
+        for integration in integrations.values():
+            if integration.core and generated.get(integration.domain) != (
+                integration.manifest
+            ):
+                integration.add_error(
+                    "integration_manifests",
+                    "Manifest in integration_manifests.json is not up to date. "
+                    "Run python3 -m script.hassfest",
+                    fixable=True,
+                )
+        return
+
+    if current != content + "\n":
+        config.add_error(
+            "integration_manifests",
+            "File integration_manifests.json is not up to date. "
+            "Run python3 -m script.hassfest",
+            fixable=True,
+        )
+
+
+def generate(integrations: dict[str, Integration], config: Config) -> None:
+    """Generate integration manifests file."""
+    manifests_path = config.root / "homeassistant/generated/integration_manifests.json"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['integration_manifests']}\n")
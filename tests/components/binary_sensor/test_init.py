@@ -6,7 +6,7 @@ import pytest
 
 from homeassistant.components import binary_sensor
 from homeassistant.config_entries import ConfigEntry, ConfigFlow
-from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.const import ATTR_ICON, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -126,3 +126,55 @@ async def test_name(hass: HomeAssistant) -> None:
 
     state = hass.states.get(entity4.entity_id)
     assert state.attributes == {"device_class": "battery", "friendly_name": "Battery"}
+
+
+async def test_cache_static_attributes(hass: HomeAssistant) -> None:
+    """Test binary sensors cache their static attributes unless they override them."""
+
+    class StaticBinarySensor(binary_sensor.BinarySensorEntity):
+        """Binary sensor using the base implementation of the static attributes."""
+
+        _attr_device_class = binary_sensor.BinarySensorDeviceClass.DOOR
+        _attr_is_on = True
+
+    class DynamicIconBinarySensor(StaticBinarySensor):
+        """Binary sensor overriding one of the static attributes."""
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            return "mdi:door-open" if self.is_on else "mdi:door-closed"
+
+    assert StaticBinarySensor._cache_static_attributes
+    assert not DynamicIconBinarySensor._cache_static_attributes
+
+    entity = StaticBinarySensor()
+    entity.hass = hass
+    entity.entity_id = "binary_sensor.test"
+    entity.async_write_ha_state()
+    assert entity._static_attributes is not None
+    state = hass.states.get("binary_sensor.test")
+    assert state.state == STATE_ON
+    assert state.attributes == {"device_class": "door"}
+
+    # Dynamically set attributes are picked up
+    entity._attr_is_on = False
+    entity._attr_icon = "mdi:door"
+    entity.async_write_ha_state()
+    state = hass.states.get("binary_sensor.test")
+    assert state.state == STATE_OFF
+    assert state.attributes == {"device_class": "door", ATTR_ICON: "mdi:door"}
+
+    entity = DynamicIconBinarySensor()
+    entity.hass = hass
+    entity.entity_id = "binary_sensor.dynamic"
+    entity.async_write_ha_state()
+    assert hass.states.get("binary_sensor.dynamic").attributes[ATTR_ICON] == (
+        "mdi:door-open"
+    )
+    entity._attr_is_on = False
+    entity.async_write_ha_state()
+    assert entity._static_attributes is None
+    assert hass.states.get("binary_sensor.dynamic").attributes[ATTR_ICON] == (
+        "mdi:door-closed"
+    )
@@ -9,10 +9,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import async_get
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from . import _get_diagnostics_for_config_entry, _get_diagnostics_for_device
 
-from tests.common import MockConfigEntry, mock_platform
+from tests.common import MockConfigEntry, MockEntity, MockEntityPlatform, mock_platform
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 
@@ -124,6 +125,52 @@ async def test_download_diagnostics(
     }
 
 
+async def test_download_diagnostics_entity_polling(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test download diagnostics include the poll statistics of the entities."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    platform = MockEntityPlatform(hass, platform_name="fake_integration")
+    platform.config_entry = config_entry
+    other_platform = MockEntityPlatform(hass, platform_name="fake_integration")
+    other_platform.config_entry = MockConfigEntry(domain="fake_integration")
+
+    await platform.async_add_entities(
+        [
+            MockEntity(
+                unique_id="device_entity",
+                device_info={"identifiers": {("test", "test")}},
+            ),
+            MockEntity(unique_id="other_entity"),
+        ]
+    )
+    await other_platform.async_add_entities(
+        [MockEntity(entity_id="test_domain.other_entry")]
+    )
+    await platform._update_entity_states(dt_util.utcnow())
+    await other_platform._update_entity_states(dt_util.utcnow())
+
+    diagnostics = await _get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["entity_polling"].keys() == {
+        "test_domain.fake_integration_device_entity",
+        "test_domain.fake_integration_other_entity",
+    }
+    stats = diagnostics["entity_polling"]["test_domain.fake_integration_device_entity"]
+    assert stats["polls"] == 1
+    assert sum(stats["latency_histogram"].values()) == 1
+
+    device = async_get(hass).async_get_device(identifiers={("test", "test")})
+    diagnostics = await _get_diagnostics_for_device(
+        hass, hass_client, config_entry, device
+    )
+    assert diagnostics["entity_polling"].keys() == {
+        "test_domain.fake_integration_device_entity"
+    }
+
+
 async def test_failure_scenarios(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -454,6 +454,168 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with columnar results."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(10):
+        hass.states.async_set("sensor.power", str(value))
+        hass.states.async_set("sensor.mode", "eco" if value % 2 else "boost")
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "unavailable")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.mode"],
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    power = response["result"]["sensor.power"]
+    assert power["s"] == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, None]
+    assert len(power["lu"]) == 11
+    assert "st" not in power
+    mode = response["result"]["sensor.mode"]
+    assert mode["st"] == ["boost", "eco"]
+    assert mode["s"] == [0, 1] * 5
+    assert len(mode["lu"]) == 10
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.mode"],
+            "columnar": True,
+            "max_points": 4,
+            "downsample": "max",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]["s"]) <= 4
+    assert response["result"]["sensor.mode"] == mode
+
+
+async def test_history_during_period_downsampled(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period and stream downsample numeric entities."""
+    now = dt_util.utcnow() - timedelta(minutes=1)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for value in range(20):
+            freezer.move_to(now + timedelta(seconds=value + 0.5))
+            hass.states.async_set("sensor.power", str(value), {"unit": "W"})
+            hass.states.async_set("sensor.mode", "eco" if value % 2 else "boost")
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = now + timedelta(seconds=20)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.mode"],
+            "minimal_response": True,
+            "max_points": 4,
+            "downsample": "mean",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    power = response["result"]["sensor.power"]
+    assert [state["s"] for state in power] == ["2", "7", "12", "17"]
+    assert power[0]["a"] == {"unit": "W"}
+    assert power[1]["lu"] == (now + timedelta(seconds=9.5)).timestamp()
+    # Non-numeric entities are not downsampled
+    assert len(response["result"]["sensor.mode"]) == 20
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "resolution": 10,
+            "downsample": "last",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "9",
+        "19",
+    ]
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 4,
+            "resolution": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "resolution": "inf",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "history/stream",
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "max_points": 4,
+            "downsample": "max",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.power"]] == [
+        "4",
+        "9",
+        "14",
+        "19",
+    ]
+    assert response["event"]["end_time"] == (now + timedelta(seconds=19.5)).timestamp()
+
+
 async def test_history_stream_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
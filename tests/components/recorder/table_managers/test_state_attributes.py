@@ -0,0 +1,49 @@
+"""Test state attributes table manager."""
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+
+
+async def test_serialize_from_event_reuses_shared_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test attributes shared between states are only serialized once."""
+    manager = recorder.get_instance(hass).state_attributes_manager
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.attributes is state_two.attributes
+
+    def _event(state: State) -> Event:
+        return Event(EVENT_STATE_CHANGED, {"new_state": state})
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_mock:
+        assert (
+            manager.serialize_from_event(_event(state_one))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert (
+            manager.serialize_from_event(_event(state_two))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert len(shared_attrs_bytes_mock.mock_calls) == 1
+
+        # Changing the excluded attributes invalidates the cached result
+        recorder.get_instance(
+            hass
+        ).state_attributes_manager._exclude_attributes_by_domain["sensor"] = {
+            "unit_of_measurement"
+        }
+        assert manager.serialize_from_event(_event(state_two)) == b"{}"
+        assert len(shared_attrs_bytes_mock.mock_calls) == 2
+
+        assert manager.serialize_from_event(Event(EVENT_STATE_CHANGED, {})) == b"{}"
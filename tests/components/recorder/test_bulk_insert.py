@@ -0,0 +1,120 @@
+"""The tests for the recorder bulk insert buffer."""
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder.bulk_insert import (
+    BulkInsertBuffer,
+    dialect_supports_bulk_insert,
+)
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+
+@pytest.fixture
+def session():
+    """Return a session for an in memory database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    assert dialect_supports_bulk_insert(engine.dialect)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def test_bulk_insert_resolves_dependencies(session: Session) -> None:
+    """Test rows referencing other new rows get their foreign keys."""
+    buffer = BulkInsertBuffer()
+    states_meta = StatesMeta(entity_id="sensor.power")
+    state_attributes = StateAttributes(shared_attrs="{}", hash=1)
+    first = States(state="1", last_updated_ts=1.0)
+    first.states_meta_rel = states_meta
+    first.state_attributes = state_attributes
+    second = States(state="2", last_updated_ts=2.0)
+    second.states_meta_rel = states_meta
+    second.state_attributes = state_attributes
+    second.old_state = first
+    third = States(state="3", last_updated_ts=3.0)
+    third.states_meta_rel = states_meta
+    third.old_state = second
+    event_type = EventTypes(event_type="test_event")
+    event_data = EventData(shared_data='{"a":1}', hash=2)
+    event = Events(time_fired_ts=4.0)
+    event.event_type_rel = event_type
+    event.event_data_rel = event_data
+
+    # Added in reverse order to make sure the dependencies are resolved
+    for obj in (third, second, first, state_attributes, event, event_type):
+        buffer.add(obj)
+    # event_data was never added, but is referenced by event
+    assert len(buffer) == 6
+
+    buffer.flush(session)
+    session.commit()
+    buffer.clear()
+    assert len(buffer) == 0
+
+    assert states_meta.metadata_id is not None
+    assert event_data.data_id is not None
+    rows = session.execute(
+        select(
+            States.state,
+            States.state_id,
+            States.old_state_id,
+            States.metadata_id,
+            States.attributes_id,
+        ).order_by(States.last_updated_ts)
+    ).all()
+    assert rows == [
+        ("1", first.state_id, None, states_meta.metadata_id, 1),
+        ("2", second.state_id, first.state_id, states_meta.metadata_id, 1),
+        ("3", third.state_id, second.state_id, states_meta.metadata_id, None),
+    ]
+    assert session.execute(
+        select(Events.event_type_id, Events.data_id, Events.time_fired_ts)
+    ).all() == [(event_type.event_type_id, event_data.data_id, 4.0)]
+
+
+def test_bulk_insert_rollback_forgets_ids(session: Session) -> None:
+    """Test ids are forgotten when a flush fails part way."""
+    buffer = BulkInsertBuffer()
+    states_meta = StatesMeta(entity_id="sensor.power")
+    state = States(state="1", last_updated_ts=1.0)
+    state.states_meta_rel = states_meta
+    buffer.add(states_meta)
+    buffer.add(state)
+
+    original_execute = session.execute
+
+    def _fail_on_states(statement, *args, **kwargs):
+        if statement.table.name == "states":
+            raise OperationalError("insert", {}, "forced to fail")
+        return original_execute(statement, *args, **kwargs)
+
+    with patch.object(session, "execute", _fail_on_states), pytest.raises(
+        OperationalError
+    ):
+        buffer.flush(session)
+
+    assert states_meta.metadata_id is not None
+    buffer.rollback()
+    session.rollback()
+    assert states_meta.metadata_id is None
+    assert state.state_id is None
+    assert len(buffer) == 2
+
+    buffer.flush(session)
+    session.commit()
+    assert session.execute(select(States.metadata_id)).scalars().all() == [
+        states_meta.metadata_id
+    ]
@@ -7,6 +7,7 @@ from collections.abc import Callable
 from copy import copy
 from datetime import datetime, timedelta
 import json
+import math
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -24,7 +25,10 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import (
+    process_timestamp,
+    row_to_compressed_state,
+)
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
     LegacyLazyStatePreSchema31,
@@ -32,7 +36,7 @@ from homeassistant.components.recorder.models.legacy import (
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -1200,3 +1204,155 @@ def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty(
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     hass = hass_recorder()
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def test_get_significant_states_columnar(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test significant states can be returned as columns."""
+    hass = hass_recorder()
+    zero = dt_util.utcnow()
+    start = zero + timedelta(seconds=0.5)
+    one = zero + timedelta(seconds=1)
+    two = zero + timedelta(seconds=2)
+    end = zero + timedelta(seconds=3)
+
+    with freeze_time(zero) as freezer:
+        hass.states.set("sensor.power", "10.5")
+        hass.states.set("media_player.test", "idle")
+        wait_recording_done(hass)
+        freezer.move_to(one)
+        hass.states.set("sensor.power", "unavailable")
+        hass.states.set("media_player.test", "playing")
+        wait_recording_done(hass)
+        freezer.move_to(two)
+        hass.states.set("sensor.power", "12")
+        hass.states.set("media_player.test", "playing", {"changed": True})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        columns = history.get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start,
+            end,
+            ["media_player.test", "sensor.power", "sensor.missing"],
+        )
+
+    assert list(columns) == ["media_player.test", "sensor.power"]
+    power = columns["sensor.power"]
+    assert power.numeric
+    assert power.timestamps.tolist() == [
+        start.timestamp(),
+        one.timestamp(),
+        two.timestamp(),
+    ]
+    assert power.states[0] == 10.5
+    assert math.isnan(power.states[1])
+    assert power.states[2] == 12
+    assert json.loads(json_dumps(power.as_compressed_state())) == {
+        "s": [10.5, None, 12.0],
+        "lu": power.timestamps.tolist(),
+    }
+
+    media_player = columns["media_player.test"]
+    assert not media_player.numeric
+    # The attribute change is not a state change
+    assert media_player.as_compressed_state() == {
+        "s": [0, 1],
+        "lu": [start.timestamp(), one.timestamp()],
+        "st": ["idle", "playing"],
+    }
+
+
+def test_get_significant_states_downsampled(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test only the kept rows are converted, each with its own attributes."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=20)
+
+    with freeze_time(start) as freezer:
+        for value in range(20):
+            freezer.move_to(start + timedelta(seconds=value + 0.5))
+            # Every other write only changes the attributes
+            hass.states.set(entity_id, str(value // 2), {"reading": value})
+        wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.modern.row_to_compressed_state",
+        wraps=row_to_compressed_state,
+    ) as convert:
+        states = history.get_significant_states(
+            hass,
+            start,
+            end,
+            [entity_id],
+            significant_changes_only=False,
+            compressed_state_format=True,
+            max_points=5,
+            downsample=history.DownsampleMethod.LAST,
+        )
+    assert convert.call_count == 5
+    assert states[entity_id] == [
+        {
+            "s": str(value // 2),
+            "a": {"reading": value},
+            "lu": (start + timedelta(seconds=value + 0.5)).timestamp(),
+            "lc": (start + timedelta(seconds=value - 0.5)).timestamp(),
+        }
+        for value in (3, 7, 11, 15, 19)
+    ]
+
+    states = history.get_significant_states(
+        hass,
+        start,
+        end,
+        [entity_id],
+        significant_changes_only=False,
+        minimal_response=True,
+        compressed_state_format=True,
+        max_points=5,
+        downsample=history.DownsampleMethod.MAX,
+    )
+    assert [state["s"] for state in states[entity_id]] == ["1", "3", "5", "7", "9"]
+    assert states[entity_id][0]["a"] == {"reading": 3}
+    assert "a" not in states[entity_id][1]
+
+
+def test_state_changes_during_period_columnar_downsampled(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test state changes can be returned as downsampled columns."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=100)
+
+    with freeze_time(start) as freezer:
+        for value in range(100):
+            freezer.move_to(start + timedelta(seconds=value + 0.5))
+            hass.states.set(entity_id, str(value))
+        wait_recording_done(hass)
+
+    columns = history.state_changes_during_period_columnar(hass, start, end, entity_id)
+    assert len(columns[entity_id]) == 100
+
+    columns = history.state_changes_during_period_columnar(
+        hass,
+        start,
+        end,
+        entity_id,
+        max_points=10,
+        downsample=history.DownsampleMethod.MAX,
+    )
+    downsampled = columns[entity_id]
+    assert downsampled.states.tolist() == [9, 19, 29, 39, 49, 59, 69, 79, 89, 99]
+    assert downsampled.timestamps[0] == (start + timedelta(seconds=9.5)).timestamp()
+
+    assert (
+        history.state_changes_during_period_columnar(hass, start, end, "sensor.missing")
+        == {}
+    )
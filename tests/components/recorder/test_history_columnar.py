@@ -0,0 +1,174 @@
+"""The tests for columnar history results."""
+import math
+
+import numpy as np
+import pytest
+
+from homeassistant.components.recorder.history.columnar import (
+    DownsampleMethod,
+    HistoryColumns,
+    columns_to_compressed_states,
+    downsample_columns,
+    downsample_states,
+    states_to_columns,
+)
+
+
+def test_states_to_columns() -> None:
+    """Test numeric and string states are detected and repeats are dropped."""
+    columns = states_to_columns(
+        ["1", "1", "unknown", "unavailable", "2.5", "2.5"], [0, 1, 2, 3, 4, 5]
+    )
+    assert columns.numeric
+    assert columns.timestamps.tolist() == [0, 2, 4]
+    assert columns.states[0] == 1
+    assert math.isnan(columns.states[1])
+    assert columns.states[2] == 2.5
+
+    columns = states_to_columns(["on", "on", "off", "unavailable"], [0, 1, 2, 3])
+    assert not columns.numeric
+    assert columns.string_table == ["on", "off", "unavailable"]
+    assert columns.states.tolist() == [0, 1, 2]
+    assert columns.timestamps.tolist() == [0, 2, 3]
+
+    columns = states_to_columns(["unavailable"], [0])
+    assert not columns.numeric
+
+
+def _ramp(count: int) -> HistoryColumns:
+    """Return count points increasing by one each second."""
+    return HistoryColumns(
+        np.arange(count, dtype=np.float64), np.arange(count, dtype=np.float64)
+    )
+
+
+def test_downsample_buckets() -> None:
+    """Test reducing points to buckets."""
+    columns = _ramp(20)
+    assert downsample_columns(columns, 20, DownsampleMethod.MEAN, 0, 20) is columns
+
+    for method, expected in (
+        (DownsampleMethod.MIN, [0, 5, 10, 15]),
+        (DownsampleMethod.MAX, [4, 9, 14, 19]),
+        (DownsampleMethod.MEAN, [2, 7, 12, 17]),
+        (DownsampleMethod.LAST, [4, 9, 14, 19]),
+    ):
+        downsampled = downsample_columns(columns, 4, method, 0, 20)
+        assert downsampled.states.tolist() == expected
+        assert downsampled.timestamps.tolist() == [4, 9, 14, 19]
+
+    columns.states[5:10] = np.nan
+    downsampled = downsample_columns(columns, 4, DownsampleMethod.MEAN, 0, 20)
+    assert math.isnan(downsampled.states[1])
+    assert downsampled.states[2] == 12
+
+
+def test_downsample_lttb() -> None:
+    """Test LTTB keeps the extremes and the first and last point."""
+    values = np.zeros(100)
+    values[37] = 50
+    values[62] = -50
+    columns = HistoryColumns(np.arange(100, dtype=np.float64), values)
+    downsampled = downsample_columns(columns, 10, DownsampleMethod.LTTB, 0, 100)
+    assert len(downsampled) == 10
+    timestamps = downsampled.timestamps.tolist()
+    assert timestamps[0] == 0
+    assert timestamps[-1] == 99
+    assert 37 in timestamps
+    assert 62 in timestamps
+
+    columns.states[50:55] = np.nan
+    downsampled = downsample_columns(columns, 10, DownsampleMethod.LTTB, 0, 100)
+    assert 50 in downsampled.timestamps.tolist()
+
+
+def test_downsample_lttb_max_points() -> None:
+    """Test LTTB never returns more than max_points."""
+    values = np.arange(100, dtype=np.float64)
+    values[::4] = np.nan
+    columns = HistoryColumns(np.arange(100, dtype=np.float64), values)
+    for max_points in (1, 2, 3, 10, 30):
+        downsampled = downsample_columns(
+            columns, max_points, DownsampleMethod.LTTB, 0, 100
+        )
+        assert len(downsampled) == max_points
+        assert len(set(downsampled.timestamps.tolist())) == max_points
+
+    with pytest.raises(ValueError):
+        downsample_columns(columns, 0, DownsampleMethod.LTTB, 0, 100)
+
+
+def test_downsample_ignores_strings() -> None:
+    """Test non-numeric columns are not downsampled."""
+    columns = states_to_columns(["on", "off"] * 10, list(range(20)))
+    assert downsample_columns(columns, 3, DownsampleMethod.MEAN, 0, 20) is columns
+
+
+def test_columns_to_compressed_states() -> None:
+    """Test numeric columns are converted back to compressed states."""
+    columns = HistoryColumns(np.array([1.0, 2.0, 3.0]), np.array([4.0, np.nan, 2.5]))
+    assert columns_to_compressed_states(columns) == [
+        {"s": "4", "lu": 1.0},
+        {"s": "unavailable", "lu": 2.0},
+        {"s": "2.5", "lu": 3.0},
+    ]
+
+
+def test_columns_to_compressed_states_keeps_states() -> None:
+    """Test the original states are kept when converting back."""
+    states = ["20.0", "unknown", "1e3", "20", "unavailable", "5"]
+    columns = states_to_columns(states, list(range(6)))
+    assert columns_to_compressed_states(columns) == [
+        {"s": state, "lu": timestamp} for timestamp, state in enumerate(states)
+    ]
+
+    downsampled = downsample_columns(columns, 3, DownsampleMethod.LAST, 0, 6)
+    assert [state["s"] for state in columns_to_compressed_states(downsampled)] == [
+        "unknown",
+        "20",
+        "5",
+    ]
+    downsampled = downsample_columns(columns, 3, DownsampleMethod.MAX, 0, 6)
+    assert [state["s"] for state in columns_to_compressed_states(downsampled)] == [
+        "20.0",
+        "1e3",
+        "5",
+    ]
+    columns = states_to_columns(["1", "unknown", "3", "4"], list(range(4)))
+    downsampled = downsample_columns(columns, 3, DownsampleMethod.MEAN, 0, 3)
+    assert [state["s"] for state in columns_to_compressed_states(downsampled)] == [
+        "1",
+        "unknown",
+        "3.5",
+    ]
+
+
+def test_downsample_states() -> None:
+    """Test downsampling states keeps the position of the state of each point."""
+    states = [str(value // 2) for value in range(20)]
+    timestamps = [value + 0.5 for value in range(20)]
+    assert (
+        downsample_states(states, timestamps, 20, DownsampleMethod.LAST, 0, 20) is None
+    )
+    assert (
+        downsample_states(
+            ["on", "off"] * 10, timestamps, 5, DownsampleMethod.LAST, 0, 20
+        )
+        is None
+    )
+
+    # Repeated states are kept so each point comes from its own state
+    assert downsample_states(states, timestamps, 5, DownsampleMethod.LAST, 0, 20) == [
+        (3, "1", 3.5),
+        (7, "3", 7.5),
+        (11, "5", 11.5),
+        (15, "7", 15.5),
+        (19, "9", 19.5),
+    ]
+    assert downsample_states(states, timestamps, 5, DownsampleMethod.MIN, 0, 20) == [
+        (3, "0", 3.5),
+        (7, "2", 7.5),
+        (11, "4", 11.5),
+        (15, "6", 15.5),
+        (19, "8", 19.5),
+    ]
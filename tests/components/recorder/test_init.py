@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
 import sqlite3
 import threading
@@ -56,6 +57,7 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.spill_queue import SpillQueue, event_to_spill
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
@@ -67,14 +69,16 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er, recorder as recorder_helper
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.json import json_loads
 
 from .common import (
@@ -120,6 +124,7 @@ def _default_recorder(hass):
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
         exclude_attributes_by_domain={},
+        spill_path=None,
     )
 
 
@@ -379,7 +384,8 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in chain(instance.event_session, instance._bulk_insert or ()):
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
@@ -389,6 +395,9 @@ def test_saving_state_with_exception(
         get_instance(hass).event_session,
         "flush",
         side_effect=_throw_if_state_in_session,
+    ), patch(
+        "homeassistant.components.recorder.core.BulkInsertBuffer.flush",
+        side_effect=_throw_if_state_in_session,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -421,7 +430,8 @@ def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in chain(instance.event_session, instance._bulk_insert or ()):
             if isinstance(obj, States):
                 raise SQLAlchemyError(
                     "insert the state", "fake params", "forced to fail"
@@ -431,6 +441,9 @@ def test_saving_state_with_sqlalchemy_exception(
         get_instance(hass).event_session,
         "flush",
         side_effect=_throw_if_state_in_session,
+    ), patch(
+        "homeassistant.components.recorder.core.BulkInsertBuffer.flush",
+        side_effect=_throw_if_state_in_session,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -1914,6 +1927,122 @@ async def test_database_lock_and_overflow_checks_available_memory(
         assert len(db_events) >= 2
 
 
+async def test_backlog_overflow_spills_to_disk(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spilled to disk when the queue overflows and recorded in order."""
+    config = {
+        recorder.CONF_COMMIT_INTERVAL: 0,
+        recorder.CONF_SPILL_TO_DISK: True,
+    }
+    with patch.object(recorder, "DEFAULT_SPILL_DIRECTORY", str(tmp_path / "spill")):
+        instance = await async_setup_recorder_instance(hass, config)
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "_reached_max_backlog_percentage", return_value=True):
+        instance._async_check_queue()
+    assert "new events will be written to" in caplog.text
+    assert "The recorder will stop recording events" not in caplog.text
+    assert instance.recording
+
+    context = Context(user_id="b8a5a3d1c3d34fb2a3c4e2d8b6b0c5f3")
+    for value in range(5):
+        hass.states.async_set("sensor.power", str(value), context=context)
+    assert instance.spill_backlog == 5
+
+    for _ in range(10):
+        await async_wait_recording_done(hass)
+        if not instance._spilling:
+            break
+    assert not instance._spilling
+    assert instance.spill_backlog == 0
+    assert instance.spill_drain_rate is not None
+    assert "caught up with the events spilled to disk" in caplog.text
+
+    # New events go through the queue again
+    hass.states.async_set("sensor.power", "5")
+    await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.state_id, row.state, row.old_state_id, row.context_user_id_bin)
+                for row in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.power")
+                .order_by(States.state_id)
+            ]
+
+    rows = await instance.async_add_executor_job(_get_states)
+    assert [row[1] for row in rows] == ["0", "1", "2", "3", "4", "5"]
+    assert [row[2] for row in rows] == [None] + [row[0] for row in rows[:-1]]
+    assert {row[3] for row in rows[:-1]} == {bytes.fromhex(context.user_id)}
+
+
+async def test_events_spilled_by_previous_run_recorded_first(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events spilled by a previous run are recorded before the queued events."""
+    spill_path = str(tmp_path / "spill")
+    previous_run = SpillQueue(spill_path)
+    old_state = None
+    lines = []
+    for value in ("0", "1"):
+        new_state = State("sensor.power", value)
+        lines.append(
+            event_to_spill(
+                Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": "sensor.power",
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                )
+            )
+        )
+        old_state = new_state
+    previous_run.append(lines)
+    previous_run.close()
+
+    load = SpillQueue.load
+
+    def _load_and_queue_event(spill_queue: SpillQueue) -> None:
+        load(spill_queue)
+        # Queue an event of this run before the spilled events are recorded
+        run_callback_threadsafe(
+            hass.loop, hass.states.async_set, "sensor.power", "2"
+        ).result()
+
+    config = {recorder.CONF_COMMIT_INTERVAL: 0, recorder.CONF_SPILL_TO_DISK: True}
+    with patch.object(recorder, "DEFAULT_SPILL_DIRECTORY", spill_path), patch.object(
+        SpillQueue, "load", _load_and_queue_event
+    ):
+        instance = await async_setup_recorder_instance(hass, config)
+        await async_wait_recording_done(hass)
+
+    assert instance.spill_backlog == 0
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.state_id, row.state, row.old_state_id)
+                for row in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.power")
+                .order_by(States.state_id)
+            ]
+
+    rows = await instance.async_add_executor_job(_get_states)
+    assert [row[1] for row in rows] == ["0", "1", "2"]
+    assert [row[2] for row in rows] == [None] + [row[0] for row in rows[:-1]]
+
+
 async def test_database_lock_timeout(
     recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
 ) -> None:
@@ -1654,6 +1654,124 @@ async def test_purge_many_old_events(
             assert events.count() == 0
 
 
+async def test_purge_by_id_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging states and events by ranges of ids."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    utcnow = dt_util.utcnow()
+    purge_before = utcnow - timedelta(days=4)
+
+    def _add_out_of_order_states() -> None:
+        with session_scope(hass=hass) as session:
+            for state, timestamp in (
+                ("purgeme_7", utcnow - timedelta(days=6)),
+                ("dontpurgeme_8", utcnow),
+                ("purgeme_9", utcnow - timedelta(days=5)),
+                # Recorded after the newest state to purge
+                ("purgeme_10", utcnow - timedelta(days=7)),
+            ):
+                _add_state_without_event_linkage(
+                    session, "test.out_of_order", state, timestamp
+                )
+                convert_pending_states_to_meta(instance, session)
+                session.flush()
+
+    await instance.async_add_executor_job(_add_out_of_order_states)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert states.count() == 10
+        assert state_attributes.count() == 7
+        assert events.count() == 6
+
+        with patch.object(
+            instance.database_engine.optimizer, "purge_by_id_range", True
+        ), patch.object(purge, "SQLITE_MAX_BIND_VARS", 2):
+            purges = 0
+            while not purge_old_data(
+                instance,
+                purge_before,
+                repack=False,
+                states_batch_size=1,
+                events_batch_size=1,
+            ):
+                purges += 1
+                assert instance.purge_progress.purge_before == purge_before
+                assert not instance.purge_progress.finished
+                assert purges < 20
+
+        assert purges > 2
+        assert {state.state for state in states} == {
+            "dontpurgeme_4",
+            "dontpurgeme_5",
+            "dontpurgeme_8",
+        }
+        assert state_attributes.count() == 2
+        assert events.count() == 2
+
+        dontpurgeme_5 = states.filter(States.state == "dontpurgeme_5").one()
+        dontpurgeme_4 = states.filter(States.state == "dontpurgeme_4").one()
+        assert dontpurgeme_5.old_state_id == dontpurgeme_4.state_id
+        assert dontpurgeme_4.old_state_id is None
+        assert "test.recorder2" in instance.states_manager._last_committed_id
+
+    progress = instance.purge_progress
+    assert progress.finished
+    # purgeme_10 was purged by the batches of ids
+    assert progress.states_purged == 6
+    assert progress.attributes_purged == 4
+    assert progress.events_purged == 4
+    assert progress.event_data_purged == 0
+    assert progress.as_dict()["purge_before"] == purge_before.isoformat()
+
+
+async def test_purge_by_id_range_not_committed(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the purge progress only advances when the purge is committed."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with session_scope(hass=hass) as session, patch.object(
+        instance.database_engine.optimizer, "purge_by_id_range", True
+    ), patch.object(purge, "SQLITE_MAX_BIND_VARS", 2):
+        states = session.query(States)
+        initial_states_count = states.count()
+        assert not purge_old_data(
+            instance, purge_before, repack=False, states_batch_size=1
+        )
+        progress = instance.purge_progress.as_dict()
+        states_count = states.count()
+
+        with patch.object(
+            purge,
+            "_select_statistics_runs_to_purge",
+            side_effect=OperationalError("statement", {}, []),
+        ):
+            purge_old_data(instance, purge_before, repack=False, states_batch_size=1)
+        assert instance.purge_progress.as_dict() == progress
+        assert states.count() == states_count
+
+        assert not purge_old_data(
+            instance, purge_before, repack=False, states_batch_size=1
+        )
+        assert instance.purge_progress.next_state_id > progress["next_state_id"]
+        assert (
+            instance.purge_progress.states_purged
+            == initial_states_count - states.count()
+        )
+
+
 async def test_purge_old_events_purges_the_event_type_ids(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -0,0 +1,143 @@
+"""The tests for the recorder spill queue."""
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.components.recorder import spill_queue
+from homeassistant.components.recorder.db_schema import EventData, StateAttributes
+from homeassistant.components.recorder.spill_queue import (
+    SpillQueue,
+    event_from_spill,
+    event_to_spill,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.util import dt as dt_util
+
+
+def test_event_round_trip() -> None:
+    """Test events can be restored after they were spilled."""
+    now = dt_util.utcnow()
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State(
+        "sensor.power",
+        "1",
+        {"unit_of_measurement": "W"},
+        now - timedelta(minutes=5),
+        now - timedelta(minutes=1),
+    )
+    new_state = State(
+        "sensor.power", "2", {"unit_of_measurement": "W"}, context=context
+    )
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.power", "old_state": old_state, "new_state": new_state},
+        EventOrigin.remote,
+        now,
+        context,
+    )
+
+    restored = event_from_spill(event_to_spill(event))
+
+    assert restored.event_type == EVENT_STATE_CHANGED
+    assert restored.origin is EventOrigin.remote
+    assert restored.time_fired == now
+    assert restored.context == context
+    assert restored.context.user_id == "user"
+    assert restored.context.parent_id == "parent"
+    assert restored.data["entity_id"] == "sensor.power"
+    assert restored.data["old_state"].as_dict() == old_state.as_dict()
+    assert restored.data["new_state"].as_dict() == new_state.as_dict()
+
+    removed = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.power", "old_state": new_state, "new_state": None},
+    )
+    assert event_from_spill(event_to_spill(removed)).data["new_state"] is None
+
+    other = Event("custom_event", {"value": [1, 2]})
+    assert event_from_spill(event_to_spill(other)).data == {"value": [1, 2]}
+
+
+def test_spill_queue_reads_in_order(tmp_path: Path) -> None:
+    """Test events are read back in order across segments."""
+    path = str(tmp_path / "spill")
+    queue = SpillQueue(path)
+    assert queue.read(10) == []
+
+    with patch.object(spill_queue, "SEGMENT_MAX_BYTES", 4):
+        queue.append([b"1", b"2", b"3"])
+        queue.append([b"4", b"5"])
+        queue.append([b"6"])
+        assert len(list(tmp_path.joinpath("spill").iterdir())) == 3
+        assert queue.size == 6
+
+        assert queue.read(4) == [b"1", b"2", b"3", b"4"]
+        assert queue.size == 2
+        # The first segment was read completely
+        assert len(list(tmp_path.joinpath("spill").iterdir())) == 2
+
+        queue.append([b"7"])
+        assert queue.read(10) == [b"5", b"6", b"7"]
+        assert queue.size == 0
+        assert list(tmp_path.joinpath("spill").iterdir()) == []
+
+        queue.append([b"8"])
+        assert queue.read(10) == [b"8"]
+
+    queue.close()
+
+
+def test_spill_queue_load(tmp_path: Path) -> None:
+    """Test segments left over from a previous run are read."""
+    path = str(tmp_path / "spill")
+    queue = SpillQueue(path)
+    queue.append([b"1", b"2"])
+    queue.close()
+    # Simulate an interrupted write
+    with open(tmp_path / "spill" / "00000001.jsonl", "ab") as segment:
+        segment.write(b"3")
+
+    queue = SpillQueue(path)
+    queue.load()
+    assert queue.size == 3
+    queue.append([b"4"])
+    assert queue.read(10) == [b"1", b"2", b"4"]
+    assert queue.size == 0
+    queue.close()
+
+    queue = SpillQueue(str(tmp_path / "missing"))
+    queue.load()
+    assert queue.size == 0
+
+
+def test_spilled_event_rows_match() -> None:
+    """Test spilled events are recorded with the same rows as live events.
+
+    Attributes and event data come back with JSON types, which
+    serialize to the same JSON the recorder stores.
+    """
+    now = dt_util.utcnow()
+    attributes = {"hs_color": (10.5, 20), "last_seen": now, "levels": {1: "low"}}
+    state = State("light.kitchen", "on", attributes)
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.kitchen", "old_state": None, "new_state": state},
+    )
+
+    restored = event_from_spill(event_to_spill(event))
+
+    restored_attributes = restored.data["new_state"].attributes
+    assert restored_attributes == {
+        "hs_color": [10.5, 20],
+        "last_seen": now.isoformat(),
+        "levels": {"1": "low"},
+    }
+    assert StateAttributes.shared_attrs_bytes_from_event(
+        restored, {}, {}, None
+    ) == StateAttributes.shared_attrs_bytes_from_event(event, {}, {}, None)
+
+    other = Event("custom_event", {"values": (1, 2), "time": now})
+    assert EventData.shared_data_bytes_from_event(
+        event_from_spill(event_to_spill(other)), None
+    ) == EventData.shared_data_bytes_from_event(other, None)
@@ -3,6 +3,7 @@ from collections.abc import Callable
 
 # pylint: disable=invalid-name
 from datetime import timedelta
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -20,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _reduce_statistics_vectorized,
     async_add_external_statistics,
     async_import_statistics,
     get_last_short_term_statistics,
@@ -27,6 +29,9 @@ from homeassistant.components.recorder.statistics import (
     get_latest_short_term_statistics,
     get_metadata,
     list_statistic_ids,
+    reduce_day_ts_factory,
+    reduce_month_ts_factory,
+    reduce_week_ts_factory,
 )
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
@@ -2352,3 +2357,64 @@ def test_change_with_none(
     assert stats == {}
 
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.parametrize(
+    ("factory", "period"),
+    [
+        (reduce_day_ts_factory, timedelta(days=1)),
+        (reduce_week_ts_factory, timedelta(days=7)),
+        (reduce_month_ts_factory, timedelta(days=31)),
+    ],
+)
+def test_reduce_statistics_vectorized(factory, period) -> None:
+    """Test the vectorized reduction matches the Python reduction."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    start = dt_util.parse_datetime("2022-10-20 00:00:00+00:00").timestamp()
+    stat_list = [
+        {
+            "start": start + hour * 3600,
+            "end": start + (hour + 1) * 3600,
+            "mean": None if hour < 24 * 35 else hour * 1.5,
+            "min": None if hour < 24 * 35 else hour - 0.5,
+            "max": None if hour < 24 * 35 else hour + 0.5,
+            "last_reset": None,
+            "state": float(hour),
+            "sum": hour * 2.0,
+        }
+        # Covers the end of daylight saving time
+        for hour in range(24 * 60)
+        if hour % 97
+    ]
+    stats = {"sensor.test": stat_list}
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    same_period, period_start_end = factory()
+
+    with patch.object(statistics, "VECTORIZED_REDUCE_MIN_ROWS", len(stat_list) + 1):
+        expected = statistics._reduce_statistics(
+            stats, same_period, period_start_end, period, types
+        )
+    reduced = _reduce_statistics_vectorized(stats, period_start_end, types)
+
+    assert reduced == {
+        "sensor.test": [
+            {
+                key: value if key != "mean" or value is None else pytest.approx(value)
+                for key, value in row.items()
+            }
+            for row in expected["sensor.test"]
+        ]
+    }
+    assert any(row["mean"] is None for row in reduced["sensor.test"])
+
+    # Without numpy the Python reduction is used
+    with patch.dict(sys.modules, {"numpy": None}):
+        assert _reduce_statistics_vectorized(stats, period_start_end, types) is None
+        assert (
+            statistics._reduce_statistics(
+                stats, same_period, period_start_end, period, types
+            )
+            == expected
+        )
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
@@ -0,0 +1,252 @@
+"""The tests for the recorder statistics accumulator."""
+from datetime import datetime, timedelta
+from typing import Any
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.recorder.statistics_accumulator import (
+    StatisticsAccumulator,
+)
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+START = datetime(2023, 6, 1, 12, 0, tzinfo=dt_util.UTC)
+END = START + timedelta(minutes=5)
+
+POWER_ATTRIBUTES = {"state_class": "measurement", "unit_of_measurement": "kW"}
+ENERGY_ATTRIBUTES = {"state_class": "total_increasing", "unit_of_measurement": "kWh"}
+
+
+def _state(
+    entity_id: str,
+    state: str,
+    seconds: float,
+    attributes: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> State:
+    """Return a state updated seconds after START."""
+    last_updated = START + timedelta(seconds=seconds)
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_updated=last_updated,
+        last_changed=kwargs.get("last_changed", last_updated),
+    )
+
+
+def _accumulator() -> StatisticsAccumulator:
+    """Return an accumulator for sensors covering the states from START."""
+    with freeze_time(START - timedelta(minutes=5)):
+        accumulator = StatisticsAccumulator()
+        accumulator.add_domain("sensor")
+    return accumulator
+
+
+def test_get_aggregates() -> None:
+    """Test getting the aggregates of measurements during a period."""
+    accumulator = _accumulator()
+    before = _state("sensor.test", "10", -10, POWER_ATTRIBUTES)
+    during = _state("sensor.test", "40", 60, POWER_ATTRIBUTES)
+    attributes_changed = _state(
+        "sensor.test",
+        "40",
+        120,
+        {**POWER_ATTRIBUTES, "other": 1},
+        last_changed=during.last_changed,
+    )
+    unavailable = _state("sensor.test", "unavailable", 150, POWER_ATTRIBUTES)
+    lowest = _state("sensor.test", "5", 180, POWER_ATTRIBUTES)
+    after = _state("sensor.test", "100", 300, POWER_ATTRIBUTES)
+    for state in (before, during, attributes_changed, unavailable, lowest, after):
+        accumulator.add_state(state)
+    accumulator.add_state(_state("light.test", "on", 10))
+
+    aggregates, unknown = accumulator.get_aggregates(
+        START, END, ["sensor.test", "light.test"]
+    )
+    assert unknown == ["light.test"]
+    aggregate = aggregates["sensor.test"]
+    assert (aggregate.min, aggregate.max, aggregate.state) == (5.0, 40.0, lowest)
+    assert aggregate.mean(END) == pytest.approx((10 * 60 + 40 * 120 + 5 * 120) / 300)
+
+    # The next period starts with the last state of this one
+    aggregates, unknown = accumulator.get_aggregates(
+        END, END + timedelta(minutes=5), ["sensor.test"]
+    )
+    aggregate = aggregates["sensor.test"]
+    assert (aggregate.min, aggregate.max) == (5.0, 100.0)
+
+
+def test_get_aggregates_without_float_states() -> None:
+    """Test periods without float states."""
+    accumulator = _accumulator()
+    accumulator.add_state(_state("sensor.test", "unavailable", -10, POWER_ATTRIBUTES))
+    accumulator.add_state(_state("sensor.test", "unknown", 10, POWER_ATTRIBUTES))
+    accumulator.add_state(_state("sensor.test", "1", 500, POWER_ATTRIBUTES))
+
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) == (
+        {"sensor.test": None},
+        [],
+    )
+    # There are no states during the period and the start state is not a float
+    accumulator.add_start_states(START, ["sensor.new"], {})
+    assert accumulator.get_aggregates(
+        START - timedelta(minutes=5), START, ["sensor.new"]
+    ) == ({}, [])
+
+
+def test_get_states() -> None:
+    """Test getting the states of sums during a period."""
+    accumulator = _accumulator()
+    states = [
+        _state("sensor.energy", str(value), seconds, ENERGY_ATTRIBUTES)
+        for seconds, value in ((-10, 1), (10, 2), (20, 3), (30, 2), (40, 4), (50, 5))
+    ]
+    for state in states:
+        accumulator.add_state(state)
+
+    # The states which do not change the sum are not kept
+    assert accumulator.get_states(
+        START, END, {"sensor.energy": "total_increasing"}
+    ) == ({"sensor.energy": [states[0], states[2], states[3], states[5]]}, [])
+    # The states are not compacted for another state class
+    assert accumulator.get_states(START, END, {"sensor.energy": "total"}) == (
+        {},
+        ["sensor.energy"],
+    )
+
+
+def test_get_states_new_cycle() -> None:
+    """Test the states around a new cycle of a total are kept."""
+    accumulator = _accumulator()
+    attributes = {**ENERGY_ATTRIBUTES, "state_class": "total"}
+    new_cycle = {**attributes, "last_reset": START.isoformat()}
+    states = [
+        _state("sensor.energy", value, seconds, state_attributes)
+        for seconds, value, state_attributes in (
+            (-10, "3", attributes),
+            (10, "1", attributes),
+            (20, "2", attributes),
+            (30, "4", attributes),
+            (40, "1", new_cycle),
+            (50, "0", new_cycle),
+            (60, "7", new_cycle),
+        )
+    ]
+    for state in states:
+        accumulator.add_state(state)
+
+    assert accumulator.get_states(START, END, {"sensor.energy": "total"}) == (
+        {"sensor.energy": [states[0], states[3], states[4], states[6]]},
+        [],
+    )
+
+
+def test_memory_bounded() -> None:
+    """Test the memory used does not grow with the number of states."""
+    accumulator = _accumulator()
+    for index in range(3000):
+        accumulator.add_state(
+            _state("sensor.power", str(index % 7), index / 5, POWER_ATTRIBUTES)
+        )
+        accumulator.add_state(
+            _state("sensor.energy", str(index), index / 5, ENERGY_ATTRIBUTES)
+        )
+
+    periods = accumulator._entities["sensor.energy"].periods
+    assert [len(period.states) for period in periods.values()] == [2, 2]
+    aggregates, _ = accumulator.get_aggregates(
+        END, END + timedelta(minutes=5), ["sensor.power"]
+    )
+    assert (aggregates["sensor.power"].min, aggregates["sensor.power"].max) == (0, 6)
+
+
+def test_unknown_start_state() -> None:
+    """Test entities without a state before the period are read from the database."""
+    accumulator = _accumulator()
+    during = _state("sensor.new", "2", 10, POWER_ATTRIBUTES)
+    accumulator.add_state(during)
+
+    assert accumulator.get_aggregates(START, END, ["sensor.new", "sensor.old"]) == (
+        {},
+        ["sensor.new", "sensor.old"],
+    )
+    from_database = _state("sensor.old", "1", 0, POWER_ATTRIBUTES)
+    accumulator.add_start_states(
+        START, ["sensor.new", "sensor.old"], {"sensor.old": [from_database]}
+    )
+    aggregates, unknown = accumulator.get_aggregates(
+        END, END + timedelta(minutes=5), ["sensor.new", "sensor.old"]
+    )
+    assert unknown == []
+    assert aggregates["sensor.new"].state == during
+    assert aggregates["sensor.old"].state == from_database
+
+    accumulator.remove_entity("sensor.old")
+    assert accumulator.get_aggregates(
+        END, END + timedelta(minutes=5), ["sensor.old"]
+    ) == ({}, ["sensor.old"])
+
+
+def test_changed_state_class_or_unit() -> None:
+    """Test periods where the state class or unit changed are read from the database."""
+    accumulator = _accumulator()
+    accumulator.add_state(_state("sensor.class", "1", -10, POWER_ATTRIBUTES))
+    accumulator.add_state(_state("sensor.unit", "1", -10, POWER_ATTRIBUTES))
+    accumulator.add_state(_state("sensor.class", "2", 10, POWER_ATTRIBUTES))
+    accumulator.add_state(_state("sensor.class", "3", 20, ENERGY_ATTRIBUTES))
+    accumulator.add_state(
+        _state("sensor.unit", "2", 10, {**POWER_ATTRIBUTES, "unit_of_measurement": "W"})
+    )
+
+    assert accumulator.get_aggregates(START, END, ["sensor.class", "sensor.unit"]) == (
+        {},
+        ["sensor.class", "sensor.unit"],
+    )
+
+
+def test_discard_until() -> None:
+    """Test the periods which were compiled are discarded."""
+    accumulator = _accumulator()
+    first = _state("sensor.test", "1", 10, POWER_ATTRIBUTES)
+    second = _state("sensor.test", "2", 20, POWER_ATTRIBUTES)
+    accumulator.add_state(first)
+    accumulator.add_state(second)
+    accumulator.discard_until(END)
+
+    assert accumulator._entities["sensor.test"].periods == {}
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
+    aggregates, _ = accumulator.get_aggregates(
+        END, END + timedelta(minutes=5), ["sensor.test"]
+    )
+    assert aggregates["sensor.test"].state == second
+
+
+def test_not_covered() -> None:
+    """Test periods are not covered after a reset or when states arrive late."""
+    accumulator = _accumulator()
+    with freeze_time(START + timedelta(seconds=1)):
+        accumulator.reset()
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
+
+    accumulator = _accumulator()
+    assert accumulator.get_aggregates(START + timedelta(seconds=1), END, []) is None
+    assert accumulator.get_states(START, END + timedelta(minutes=5), {}) is None
+
+    accumulator = _accumulator()
+    accumulator.discard_until(START)
+    accumulator.add_state(_state("sensor.test", "1", -10))
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
+    # The accumulator was reset
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
+
+    accumulator = _accumulator()
+    accumulator.add_state(_state("sensor.test", "1", 10))
+    accumulator.add_state(_state("sensor.test", "1", 5))
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
+
+    accumulator = _accumulator()
+    accumulator.invalidate()
+    assert accumulator.get_aggregates(START, END, ["sensor.test"]) is None
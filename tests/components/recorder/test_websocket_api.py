@@ -2134,7 +2134,10 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
+        "spill_backlog": 0,
+        "spill_drain_rate": None,
         "thread_running": True,
     }
 
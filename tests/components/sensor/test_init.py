@@ -2438,3 +2438,66 @@ def test_async_rounded_state_registered_entity_with_display_precision(
     hass.states.async_set(entity_id, "-0.0")
     state = hass.states.get(entity_id)
     assert async_rounded_state(hass, entity_id, state) == "0.0000"
+
+
+async def test_cache_static_attributes(hass: HomeAssistant) -> None:
+    """Test sensors cache their static attributes unless they override them."""
+
+    class StaticSensor(SensorEntity):
+        """Sensor using the base implementation of the static attributes."""
+
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+        _attr_native_value = 20
+        _attr_state_class = SensorStateClass.MEASUREMENT
+
+    class DynamicUnitSensor(StaticSensor):
+        """Sensor overriding one of the static attributes."""
+
+        @property
+        def native_unit_of_measurement(self) -> str | None:
+            """Return the unit of measurement."""
+            return UnitOfTemperature.CELSIUS
+
+    class OptInSensor(DynamicUnitSensor):
+        """Sensor overriding a static attribute and caching anyway."""
+
+        _cache_static_attributes = True
+
+    assert StaticSensor._cache_static_attributes
+    assert not DynamicUnitSensor._cache_static_attributes
+    assert OptInSensor._cache_static_attributes
+
+    hass.config.units = METRIC_SYSTEM
+    entity = StaticSensor()
+    entity.hass = hass
+    entity.entity_id = "sensor.test"
+    entity.async_write_ha_state()
+    assert entity._static_attributes is not None
+    state = hass.states.get("sensor.test")
+    assert state.state == "20"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+    assert state.attributes["state_class"] == SensorStateClass.MEASUREMENT
+
+    # Dynamically set attributes are picked up
+    entity._attr_state_class = SensorStateClass.TOTAL
+    entity._attr_icon = "mdi:thermometer"
+    entity.async_write_ha_state()
+    state = hass.states.get("sensor.test")
+    assert state.attributes["state_class"] == SensorStateClass.TOTAL
+    assert state.attributes["icon"] == "mdi:thermometer"
+
+    # A unit system change is picked up
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    entity.async_write_ha_state()
+    state = hass.states.get("sensor.test")
+    assert state.state == "68"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.FAHRENHEIT
+
+    entity = DynamicUnitSensor()
+    entity.hass = hass
+    entity.entity_id = "sensor.dynamic"
+    entity.async_write_ha_state()
+    assert entity._static_attributes is None
+    state = hass.states.get("sensor.dynamic")
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.FAHRENHEIT
@@ -197,6 +197,70 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_accumulated_states(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test compiling statistics from the states accumulated by the recorder."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    now = dt_util.utcnow()
+    start = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    start += timedelta(minutes=5)
+
+    with freeze_time(start) as freezer:
+        for offset, power, energy in (
+            (1, "10", "1"),
+            (120, "20", "3"),
+            (360, "30", "6"),
+        ):
+            freezer.move_to(start + timedelta(seconds=offset))
+            hass.states.set("sensor.power", power, POWER_SENSOR_ATTRIBUTES)
+            hass.states.set("sensor.energy", energy, ENERGY_SENSOR_ATTRIBUTES)
+            wait_recording_done(hass)
+        freezer.move_to(start + timedelta(minutes=10))
+
+        do_adhoc_statistics(hass, start=start)
+        wait_recording_done(hass)
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_states_mock:
+            do_adhoc_statistics(hass, start=start + timedelta(minutes=5))
+            wait_recording_done(hass)
+        # The state at the start of the second period is known
+        get_states_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, start, period="5minute")
+    assert stats["sensor.power"] == [
+        {
+            "start": start.timestamp(),
+            "end": (start + timedelta(minutes=5)).timestamp(),
+            "mean": pytest.approx((10 * 119 + 20 * 180) / 299),
+            "min": 10.0,
+            "max": 20.0,
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+        {
+            "start": (start + timedelta(minutes=5)).timestamp(),
+            "end": (start + timedelta(minutes=10)).timestamp(),
+            "mean": pytest.approx(28.0),
+            "min": 20.0,
+            "max": 30.0,
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+    ]
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.energy"]] == [
+        (3.0, 2.0),
+        (6.0, 5.0),
+    ]
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -0,0 +1,67 @@
+"""Test the Websocket API subscribe_entities broadcast."""
+import json
+from unittest.mock import patch
+
+from homeassistant.components.websocket_api import messages
+from homeassistant.components.websocket_api.broadcast import (
+    async_get_entities_broadcast,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockUser
+
+
+async def test_entities_broadcast(hass: HomeAssistant) -> None:
+    """Test state changes are serialized once and forwarded per subscription."""
+    admin = MockUser(is_owner=True)
+    limited = MockUser()
+    limited.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    sent: dict[str, list[dict]] = {"admin": [], "limited": [], "filtered": []}
+
+    def _sender(name):
+        return lambda key, message, collapsed: sent[name].append(json.loads(message))
+
+    broadcast = async_get_entities_broadcast(hass)
+    assert async_get_entities_broadcast(hass) is broadcast
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsubs = [
+        broadcast.async_subscribe(set(), admin, _sender("admin"), 1),
+        broadcast.async_subscribe(set(), admin, _sender("admin"), 2),
+        broadcast.async_subscribe(set(), limited, _sender("limited"), 3),
+        broadcast.async_subscribe({"light.other"}, admin, _sender("filtered"), 4),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    with patch.object(
+        messages, "message_to_json", wraps=messages.message_to_json
+    ) as message_to_json:
+        hass.states.async_set("light.permitted", "on")
+        hass.states.async_set("light.not_permitted", "on")
+        await hass.async_block_till_done()
+
+    assert message_to_json.call_count == 2
+    assert [message["id"] for message in sent["admin"]] == [1, 2, 1, 2]
+    assert sent["admin"][0]["event"]["a"]["light.permitted"]["s"] == "on"
+    assert sent["admin"][2]["event"]["a"]["light.not_permitted"]["s"] == "on"
+    assert sent["admin"][0]["event"] == sent["admin"][1]["event"]
+    assert sent["limited"] == [
+        {"id": 3, "type": "event", "event": sent["admin"][0]["event"]}
+    ]
+    assert sent["filtered"] == []
+
+    # Permission changes apply to existing subscriptions
+    limited.mock_policy({})
+    hass.states.async_set("light.permitted", "off")
+    await hass.async_block_till_done()
+    assert len(sent["limited"]) == 1
+    assert len(sent["admin"]) == 6
+
+    unsubs.pop(0)()
+    hass.states.async_set("light.permitted", "on")
+    await hass.async_block_till_done()
+    assert [message["id"] for message in sent["admin"][6:]] == [2]
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
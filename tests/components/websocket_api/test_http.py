@@ -1,8 +1,10 @@
 """Test Websocket API http module."""
 import asyncio
 from datetime import timedelta
+import json
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -431,6 +433,153 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compress(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are compressed once compression is enabled."""
+    for idx in range(10):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"data": "x" * 2000})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESS_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    # Small messages are not compressed
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert json.loads(msg.data) == {"id": 2, "type": "pong"}
+
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    result = json.loads(zlib.decompress(msg.data))
+    assert result["id"] == 3
+    assert len(result["result"]) == 10
+
+    with patch.object(http, "COMPRESS_EXECUTOR_MIN_SIZE", 1):
+        await websocket_client.send_json({"id": 4, "type": "get_states"})
+        msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert json.loads(zlib.decompress(msg.data))["id"] == 4
+
+
+async def test_backpressure(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test results skip the queue, state changes collapse and events are dropped."""
+    handler = http.WebSocketHandler(hass, MagicMock())
+    handler._connection = MagicMock(backpressure=True)
+    collapsed = MagicMock(return_value="collapsed")
+
+    with patch.object(http, "MAX_PENDING_MSG", 2), patch.object(
+        http, "PENDING_MSG_PEAK", 1
+    ):
+        handler._send_collapsible_message((5, "light.kitchen"), "change 1", collapsed)
+        handler._send_message("event 1")
+        handler._send_message("event 2")
+        handler._send_message("event 3")
+        handler._send_message({"id": 1, "type": "result", "success": True})
+        handler._send_result_message('{"id":2,"type":"result","success":true}')
+        # Only results are tagged, the content of other messages is not inspected
+        handler._send_message('{"id":3,"type":"result","success":true}')
+        # A queued change is replaced without growing the queue
+        handler._send_collapsible_message((5, "light.kitchen"), "change 2", collapsed)
+        # Changes of other entities are dropped like other messages
+        handler._send_collapsible_message((5, "light.other"), "change 3", collapsed)
+
+        assert caplog.text.count("dropping messages until the client catches up") == 1
+        assert collapsed.call_count == 1
+        assert [handler._pop_message() for _ in range(4)] == [
+            '{"id":1,"type":"result","success":true}',
+            '{"id":2,"type":"result","success":true}',
+            "collapsed",
+            "event 1",
+        ]
+        assert not handler._message_queue
+        assert not handler._collapsible_messages
+
+        # Once the client caught up, a new change is queued again
+        handler._send_collapsible_message((5, "light.kitchen"), "change 4", collapsed)
+        handler._send_collapsible_message((5, "light.other"), "change 5", collapsed)
+    assert "Client caught up with pending messages, dropped 4 messages" in caplog.text
+    assert handler._pop_message() == "change 4"
+    assert handler._pop_message() == "change 5"
+    assert collapsed.call_count == 1
+
+
+async def test_backpressure_collapsible_limit(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test changes of many entities do not grow the queue past the limit."""
+    handler = http.WebSocketHandler(hass, MagicMock())
+    handler._connection = MagicMock(backpressure=True)
+    collapsed = MagicMock(return_value="collapsed")
+
+    with patch.object(http, "MAX_PENDING_MSG", 4), patch.object(
+        http, "PENDING_MSG_PEAK", 2
+    ):
+        for idx in range(10):
+            handler._send_collapsible_message(
+                (5, f"light.{idx}"), f"change {idx}", collapsed
+            )
+
+    assert caplog.text.count("dropping messages until the client catches up") == 1
+    assert len(handler._message_queue) == 4
+    assert list(handler._collapsible_messages) == [
+        (5, f"light.{idx}") for idx in range(4)
+    ]
+
+
+async def test_backpressure_drops_until_caught_up(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test messages are dropped until the queue is back under the peak."""
+    handler = http.WebSocketHandler(hass, MagicMock())
+    handler._connection = MagicMock(backpressure=True)
+
+    with patch.object(http, "MAX_PENDING_MSG", 4), patch.object(
+        http, "PENDING_MSG_PEAK", 2
+    ):
+        for idx in range(6):
+            handler._send_message(f"event {idx}")
+        # Dipping below the limit does not stop dropping messages
+        handler._pop_message()
+        handler._send_message("event 6")
+        handler._pop_message()
+        handler._pop_message()
+        handler._send_message("event 7")
+        handler._send_message("event 8")
+        handler._send_message("event 9")
+
+    assert caplog.text.count("dropping messages until the client catches up") == 1
+    assert "Client caught up with pending messages, dropped 3 messages" in caplog.text
+    assert list(handler._message_queue) == ["event 3", "event 7", "event 8", "event 9"]
+
+
+async def test_backpressure_pending_results(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the connection is closed when the client does not read results."""
+    handler = http.WebSocketHandler(hass, MagicMock())
+    handler._connection = MagicMock(backpressure=True)
+
+    with patch.object(http, "MAX_PENDING_MSG", 2):
+        for idx in range(3):
+            handler._send_result_message(f"result {idx}")
+
+    assert "Client unable to keep up with pending results" in caplog.text
+    assert list(handler._priority_queue) == ["result 0", "result 1"]
+    assert handler._closing
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,10 +1,14 @@
 """Test Websocket API messages module."""
+import json
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
+    cached_state_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -256,3 +260,28 @@ async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_cached_state_message(hass: HomeAssistant) -> None:
+    """Test the full state message of state_changed events."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off", {"brightness": 10})
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
+
+    changed = json.loads(cached_state_message(5, events[1]))
+    assert changed["id"] == 5
+    assert changed["type"] == "event"
+    assert set(changed["event"]["a"]["light.window"]) == {"s", "a", "c", "lc"}
+    assert changed["event"]["a"]["light.window"]["a"] == {"brightness": 10}
+    assert json.loads(cached_state_message(6, events[2])) == {
+        "id": 6,
+        "type": "event",
+        "event": {"r": ["light.window"]},
+    }
+    assert json.loads(cached_state_diff_message(6, events[2])) == {
+        "id": 6,
+        "type": "event",
+        "event": {"r": ["light.window"]},
+    }
@@ -1,10 +1,16 @@
 """The test for the World clock sensor platform."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
+from tests.common import async_fire_time_changed
+
 
 @pytest.fixture
 def time_zone():
@@ -51,3 +57,33 @@ async def test_time_format(hass: HomeAssistant, time_zone) -> None:
     assert state is not None
 
     assert state.state == dt_util.now(time_zone=time_zone).strftime(time_format)
+
+
+async def test_unchanged_time_not_written(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polling the same time again does not write the state."""
+    freezer.move_to("2023-10-21 12:00:00+00:00")
+    config = {"sensor": {"platform": "worldclock", "time_zone": "America/New_York"}}
+
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        config,
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.worldclock_sensor")
+    assert state.state == "08:00"
+
+    with patch("homeassistant.core.StateMachine.async_set") as async_set:
+        freezer.tick(timedelta(seconds=30))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert not async_set.called
+    assert hass.states.get("sensor.worldclock_sensor") is state
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.worldclock_sensor").state == "08:01"
@@ -0,0 +1,62 @@
+"""Tests for hassfest integration manifests."""
+import json
+import pathlib
+
+import pytest
+
+from script.hassfest import integration_manifests
+from script.hassfest.model import Config, Integration
+
+
+@pytest.fixture
+def config(tmp_path: pathlib.Path) -> Config:
+    """Fixture for hassfest config with a generated manifests file."""
+    generated = tmp_path / "homeassistant/generated"
+    generated.mkdir(parents=True)
+    (generated / "integration_manifests.json").write_text(
+        json.dumps({"test": {"domain": "test", "name": "Test"}}, separators=(",", ":"))
+        + "\n"
+    )
+    return Config(
+        specific_integrations=None,
+        root=tmp_path,
+        action="validate",
+        requirements=False,
+    )
+
+
+@pytest.fixture
+def integration() -> Integration:
+    """Fixture for hassfest integration model."""
+    integration = Integration(pathlib.Path("homeassistant/components/test"))
+    integration._manifest = {"domain": "test", "name": "Test"}
+    integration.manifest_path = integration.path / "manifest.json"
+    return integration
+
+
+def test_validate_up_to_date(config: Config, integration: Integration) -> None:
+    """Test validating an up to date manifests file."""
+    integration_manifests.validate({"test": integration}, config)
+    assert not config.errors
+
+
+def test_validate_drift(config: Config, integration: Integration) -> None:
+    """Test validating a manifests file that drifted from the manifests."""
+    integration.manifest["name"] = "Renamed"
+    integration_manifests.validate({"test": integration}, config)
+    assert [error.plugin for error in config.errors] == ["integration_manifests"]
+    assert config.errors[0].fixable
+
+
+def test_validate_drift_specific_integration(
+    config: Config, integration: Integration
+) -> None:
+    """Test validating the manifest of a specific integration that drifted."""
+    config.specific_integrations = [integration.path]
+    integration_manifests.validate({"test": integration}, config)
+    assert not integration.errors
+
+    integration.manifest["name"] = "Renamed"
+    integration_manifests.validate({"test": integration}, config)
+    assert not config.errors
+    assert [error.plugin for error in integration.errors] == ["integration_manifests"]
@@ -10,16 +10,20 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 import voluptuous as vol
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_PICTURE,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
 from homeassistant.core import Context, HomeAssistant, HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
 from tests.common import (
@@ -733,6 +737,163 @@ async def test_capability_attrs(hass: HomeAssistant) -> None:
     assert state.attributes["always"] == "there"
 
 
+async def test_cache_static_attributes(hass: HomeAssistant) -> None:
+    """Test static attributes are cached until they are invalidated."""
+
+    class StaticEntity(entity.Entity):
+        """Entity caching its static attributes."""
+
+        _cache_static_attributes = True
+        _attr_icon = "mdi:one"
+        picture = "/one.png"
+
+        @property
+        def entity_picture(self) -> str:
+            """Return the entity picture."""
+            return self.picture
+
+    entry = er.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    ent = StaticEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+    ent.add_to_platform_start(hass, MagicMock(platform_name="test-platform"), None)
+    await ent.add_to_platform_finish()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_ICON] == "mdi:one"
+    assert state.attributes[ATTR_ENTITY_PICTURE] == "/one.png"
+
+    ent.picture = "/two.png"
+    ent._attr_extra_state_attributes = {"dynamic": 1}
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_ENTITY_PICTURE] == "/one.png"
+    assert state.attributes["dynamic"] == 1
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ENTITY_PICTURE] == "/two.png"
+
+    # Changing an _attr_ attribute recalculates the static attributes
+    ent._attr_icon = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:two"
+
+    ent.picture = "/three.png"
+    registry.async_update_entity("hello.world", name="Registry name")
+    await hass.async_block_till_done()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_ENTITY_PICTURE] == "/three.png"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Registry name"
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {ATTR_ICON: "mdi:four"}})
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:four"
+
+
+@pytest.mark.parametrize("cache_static_attributes", [False, True])
+async def test_write_state_property_order(
+    hass: HomeAssistant, cache_static_attributes: bool
+) -> None:
+    """Test the capability attributes are read before the state."""
+    calls = []
+
+    class OrderEntity(entity.Entity):
+        """Entity recording the order its properties are read in."""
+
+        _cache_static_attributes = cache_static_attributes
+
+        @property
+        def capability_attributes(self) -> dict[str, Any]:
+            """Return the capability attributes."""
+            calls.append("capability_attributes")
+            return {}
+
+        @property
+        def state(self) -> str:
+            """Return the state."""
+            calls.append("state")
+            return "on"
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            calls.append("icon")
+            return "mdi:order"
+
+    ent = OrderEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.async_write_ha_state()
+    assert calls == ["capability_attributes", "state", "icon"]
+
+
+async def test_skip_unchanged_writes(hass: HomeAssistant) -> None:
+    """Test writes of an unchanged state are skipped."""
+
+    class SkippingEntity(entity.Entity):
+        """Entity skipping unchanged writes."""
+
+        _cache_static_attributes = True
+        _attr_extra_state_attributes = {"dynamic": 1}
+
+    ent = SkippingEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.platform = MagicMock(platform_name="test-platform")
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+
+    with patch.object(
+        SkippingEntity, "_async_calculate_static_attributes"
+    ) as calculate, patch("homeassistant.core.StateMachine.async_set") as async_set:
+        ent.async_write_ha_state()
+    assert not calculate.called
+    assert not async_set.called
+
+    ent._attr_extra_state_attributes = {"dynamic": 2}
+    ent.async_write_ha_state()
+    state2 = hass.states.get("hello.world")
+    assert state2 is not state
+    assert state2.attributes["dynamic"] == 2
+
+    # The state is written again once it was changed by someone else
+    hass.states.async_set("hello.world", "other")
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+
+    ent._attr_force_update = True
+    with patch("homeassistant.core.StateMachine.async_set") as async_set:
+        ent.async_write_ha_state()
+    assert async_set.called
+
+
+async def test_skip_unchanged_writes_opt_out(hass: HomeAssistant) -> None:
+    """Test entities can opt out of skipping unchanged writes."""
+
+    class WritingEntity(entity.Entity):
+        """Entity writing every update."""
+
+        _cache_static_attributes = True
+        _skip_unchanged_writes = False
+
+    ent = WritingEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.platform = MagicMock(platform_name="test-platform")
+    ent.async_write_ha_state()
+
+    with patch("homeassistant.core.StateMachine.async_set") as async_set:
+        ent.async_write_ha_state()
+    assert async_set.called
+
+
 async def test_warn_slow_write_state(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3,6 +3,7 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import math
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -69,6 +70,24 @@ async def test_polling_only_updates_entities_it_should_poll(
     assert poll_ent.async_update.called
 
 
+async def test_polling_shares_loop_timers(hass: HomeAssistant) -> None:
+    """Test platforms polled at the same time share a loop timer."""
+    handles = set(hass.loop._scheduled)
+    # Start in the middle of a tick of the poll timers
+    with patch.object(
+        hass.loop, "time", return_value=math.floor(hass.loop.time()) + 0.25
+    ):
+        for platform_name in ("first", "second"):
+            platform = MockEntityPlatform(hass, platform_name=platform_name)
+            await platform.async_add_entities([MockEntity(should_poll=True)])
+    new_handles = [
+        handle
+        for handle in set(hass.loop._scheduled) - handles
+        if not handle.cancelled()
+    ]
+    assert len(new_handles) == 1
+
+
 async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -516,6 +535,144 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert peak_update_count == 1
 
 
+async def test_slow_entity_polled_on_own_cadence(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a slow entity does not hold back the polls of other entities."""
+    platform = MockPlatform()
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    release = asyncio.Event()
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        polls = 0
+
+        async def async_update(self):
+            self.polls += 1
+            if self.entity_id == "test_domain.slow":
+                await release.wait()
+
+    slow = AsyncEntity(entity_id="test_domain.slow")
+    fast = AsyncEntity(entity_id="test_domain.fast")
+    await handle.async_add_entities([slow, fast])
+
+    first_round = asyncio.create_task(handle._update_entity_states(dt_util.utcnow()))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert (slow.polls, fast.polls) == (1, 1)
+
+    await handle._update_entity_states(dt_util.utcnow())
+    assert (slow.polls, fast.polls) == (1, 2)
+    assert "still updating: test_domain.slow" in caplog.text
+
+    # The poll of the slow entity takes longer than the scan interval
+    handle.scan_interval = timedelta(microseconds=1)
+    release.set()
+    await first_round
+    stats = handle.async_get_poll_statistics()
+    assert stats["test_domain.slow"]["polls"] == 1
+    assert stats["test_domain.fast"]["polls"] == 2
+    assert sum(stats["test_domain.fast"]["latency_histogram"].values()) == 2
+
+    # The slow entity skips as many rounds as its poll took
+    assert stats["test_domain.slow"]["rounds_to_skip"] > 0
+    await handle._update_entity_states(dt_util.utcnow())
+    assert (slow.polls, fast.polls) == (1, 3)
+
+
+async def test_parallel_polls_not_limited_by_default(hass: HomeAssistant) -> None:
+    """Test all async entities are polled at the same time by default."""
+    platform = MockPlatform()
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    release = asyncio.Event()
+    polling = []
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            polling.append(self.entity_id)
+            await release.wait()
+
+    await handle.async_add_entities(
+        [AsyncEntity(entity_id=f"test_domain.entity_{idx}") for idx in range(20)]
+    )
+
+    update = asyncio.create_task(handle._update_entity_states(dt_util.utcnow()))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert len(polling) == 20
+    assert handle._poll_budget is None
+
+    release.set()
+    await update
+
+
+async def test_polls_deferred_after_scan_interval(hass: HomeAssistant) -> None:
+    """Test polls waiting past the scan interval move to the next round."""
+    platform = MockPlatform()
+    platform.MAX_PARALLEL_POLLS = 1
+
+    mock_entity_platform(hass, "test_domain.async_platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    polled = []
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            polled.append(self.entity_id)
+            await asyncio.sleep(0)
+
+    entities = [AsyncEntity(entity_id=f"test_domain.entity_{idx}") for idx in range(3)]
+    await handle.async_add_entities(entities)
+    handle.scan_interval = timedelta(microseconds=1)
+
+    await handle._update_entity_states(dt_util.utcnow())
+    assert polled == ["test_domain.entity_0"]
+    stats = handle.async_get_poll_statistics()
+    assert [stats[entity.entity_id]["deferred"] for entity in entities] == [
+        False,
+        True,
+        True,
+    ]
+
+    # The deferred polls go first
+    await handle._update_entity_states(dt_util.utcnow())
+    assert polled == ["test_domain.entity_0", "test_domain.entity_1"]
+
+    # The statistics of removed entities are dropped
+    await handle.async_remove_entity("test_domain.entity_2")
+    await handle._update_entity_states(dt_util.utcnow())
+    assert "test_domain.entity_2" not in handle.async_get_poll_statistics()
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import math
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -16,7 +17,7 @@ import pytest
 
 from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -26,6 +27,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_time_change_next_fire_times,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1738,6 +1740,100 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_dependent_trackers(hass: HomeAssistant) -> None:
+    """Test templates depending on the output of another tracker render once."""
+    hass.states.async_set("sensor.source", "1")
+    hass.states.async_set("sensor.upstream", "10")
+    results = []
+    trigger_results = []
+
+    @callback
+    def downstream_listener(event, updates):
+        results.append(updates.pop().result)
+
+    @callback
+    def trigger_listener(event, updates):
+        trigger_results.append(updates.pop().result)
+
+    @callback
+    def upstream_listener(event, updates):
+        hass.states.async_set("sensor.upstream", updates.pop().result)
+
+    downstream = Template(
+        '{{ states("sensor.source") | int + states("sensor.upstream") | int }}', hass
+    )
+    # Tracked first, so it would be refreshed before the upstream tracker
+    async_track_template_result(
+        hass,
+        [TrackTemplate(downstream, None)],
+        downstream_listener,
+        refresh_after_upstream=True,
+    )
+    # Sees every state change, like a template trigger
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template(downstream.template, hass), None)],
+        trigger_listener,
+    )
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template('{{ states("sensor.source") | int * 10 }}', hass), None
+            )
+        ],
+        upstream_listener,
+    )
+    await hass.async_block_till_done()
+
+    # The tracker writing sensor.upstream is not known yet
+    hass.states.async_set("sensor.source", "2")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert results == [12, 22]
+
+    misses = downstream.render_cache_misses
+    hass.states.async_set("sensor.source", "3")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert results == [12, 22, 33]
+    assert downstream.render_cache_misses - misses == 1
+    assert trigger_results == [12, 22, 23, 33]
+
+
+async def test_track_template_result_iterated_state_fields(
+    hass: HomeAssistant,
+) -> None:
+    """Test iterated states only re-render when a field read changed."""
+    hass.states.async_set("sensor.one", "on", {"unit": "W"})
+    hass.states.async_set("sensor.two", "off")
+    template = Template(
+        "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+    results = []
+
+    @callback
+    def listener(event, updates):
+        results.append(updates.pop().result)
+
+    async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+    await hass.async_block_till_done()
+    misses = template.render_cache_misses
+
+    hass.states.async_set("sensor.one", "on", {"unit": "kW"})
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert template.render_cache_misses == misses
+
+    hass.states.async_set("sensor.two", "on")
+    hass.states.async_set("sensor.three", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert results[-1] == 3
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -3917,6 +4013,67 @@ async def test_periodic_task_minute(hass: HomeAssistant) -> None:
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_pattern(hass: HomeAssistant) -> None:
+    """Test periodic tasks with the same pattern share a single timer."""
+    runs = []
+    other_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        handles = set(hass.loop._scheduled)
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(x)), minute="/5", second=0
+        )
+        unsub_other = async_track_utc_time_change(
+            hass, callback(lambda x: other_runs.append(x)), minute="/5", second="0"
+        )
+        unsub_hourly = async_track_utc_time_change(
+            hass, callback(lambda x: None), minute=0, second=0
+        )
+        assert len(set(hass.loop._scheduled) - handles) == 2
+
+    next_fire_times = sorted(
+        async_time_change_next_fire_times(hass), key=lambda item: -item["listeners"]
+    )
+    assert [
+        (fire_times["minutes"], fire_times["listeners"], fire_times["next_fire"].minute)
+        for fire_times in next_fire_times
+    ] == [(list(range(0, 60, 5)), 2, 0), ([0], 1, 0)]
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert len(other_runs) == 1
+    # The patterns are sorted by their next match
+    next_fire_times = async_time_change_next_fire_times(hass)
+    assert next_fire_times[0]["listeners"] == 2
+    assert next_fire_times[0]["next_fire"].replace(microsecond=0) == datetime(
+        now.year + 1, 5, 24, 12, 5, 0, tzinfo=dt_util.UTC
+    )
+
+    unsub()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert len(other_runs) == 2
+
+    unsub_other()
+    unsub_hourly()
+    assert async_time_change_next_fire_times(hass) == []
+
+
 async def test_periodic_task_hour(hass: HomeAssistant) -> None:
     """Test periodic tasks per hour."""
     specific_runs = []
@@ -4434,6 +4591,81 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_later_jitter(hass: HomeAssistant) -> None:
+    """Test calling actions that accept jitter from a shared timer."""
+    calls = []
+    jitter = 10
+    scheduled = len(hass.loop._scheduled)
+    now = hass.loop.time()
+    tick_start = math.floor(now / jitter) * jitter + jitter
+
+    async_call_later(
+        hass, tick_start + 1 - now, lambda _: calls.append(1), jitter=jitter
+    )
+    async_call_later(
+        hass, tick_start + 2 - now, lambda _: calls.append(2), jitter=jitter
+    )
+    remove = async_call_later(
+        hass, tick_start + 3 - now, lambda _: calls.append(3), jitter=jitter
+    )
+    assert len(hass.loop._scheduled) == scheduled + 1
+    remove()
+
+    async_fire_time_changed_exact(
+        hass, dt_util.utcnow() + timedelta(seconds=tick_start - 0.5 - now)
+    )
+    await hass.async_block_till_done()
+    assert calls == []
+
+    # Actions are called at the start of their tick, never after their delay
+    async_fire_time_changed_exact(
+        hass, dt_util.utcnow() + timedelta(seconds=tick_start + 0.1 - now)
+    )
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+
+    # Removing the last action of a tick cancels its timer
+    handles = set(hass.loop._scheduled)
+    remove = async_call_later(hass, 1, lambda _: calls.append(4), jitter=jitter)
+    (handle,) = set(hass.loop._scheduled) - handles
+    remove()
+    assert handle.cancelled()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2 * jitter))
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+
+
+async def test_jitter_cancel_on_shutdown(hass: HomeAssistant) -> None:
+    """Test jobs cancelled on shutdown share timers cancelled on shutdown."""
+    calls = []
+    handles = set(hass.loop._scheduled)
+    async_call_later(
+        hass,
+        1,
+        HassJob(lambda _: calls.append(1), cancel_on_shutdown=True),
+        jitter=10,
+    )
+    unsub = async_track_time_interval(
+        hass,
+        lambda _: calls.append(2),
+        timedelta(seconds=1),
+        cancel_on_shutdown=True,
+        jitter=10,
+    )
+    async_call_later(hass, 1, lambda _: calls.append(3), jitter=10)
+    new_handles = set(hass.loop._scheduled) - handles
+    # One tick for the jobs cancelled on shutdown and one for the others
+    assert len(new_handles) == 2
+
+    hass._cancel_cancellable_timers()
+    assert len([handle for handle in new_handles if handle.cancelled()]) == 1
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert calls == [3]
+    unsub()
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
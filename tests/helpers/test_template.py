@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+import gc
 import json
 import logging
 import math
@@ -19,6 +20,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     VOLUME_LITERS,
@@ -28,6 +30,7 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    __version__,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -4096,6 +4099,81 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_shared(hass: HomeAssistant) -> None:
+    """Test templates with the same source share the compiled template."""
+    template_string = "{{ 1 + 1 }}"
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+    limited = template.Template(template_string, hass)
+    assert tpl.async_render() == tpl2.async_render() == 2
+    assert limited.async_render(limited=True) == 2
+
+    assert tpl._compiled is tpl2._compiled
+    assert tpl._compiled is not limited._compiled
+    env = tpl._env
+    assert env.compiled_template_cache.get(template_string) is tpl._compiled
+
+    del tpl, tpl2
+    # Compiled jinja templates reference themselves
+    gc.collect()
+    assert not env.compiled_template_cache.get(template_string)
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the bytecode of compiled templates is reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    assert len(data["bytecode"]) == 1
+
+    # Simulate a restart
+    for key in (template._BYTECODE_CACHE, template._ENVIRONMENT):
+        hass.data.pop(key)
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = template._get_bytecode_cache(hass)
+    assert template.Template("{{ 40 + 2 }}", hass).async_render() == 42
+    assert not bytecode_cache.dirty
+    assert template.Template("{{ 40 + 3 }}", hass).async_render() == 43
+    assert bytecode_cache.dirty
+
+    # The bytecode is dropped when Home Assistant is updated
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["ha_version"] = "0.1"
+    hass.data.pop(template._BYTECODE_CACHE)
+    await template.async_load_bytecode_cache(hass)
+    assert not template._get_bytecode_cache(hass)._bytecode
+
+
+async def test_bytecode_cache_time_zone(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test constants folded with the time zone are not reused after it changed."""
+    source = "{{ 0 | timestamp_custom('%H:%M') }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == "16:00"
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY] = {
+        "version": template.BYTECODE_CACHE_STORAGE_VERSION,
+        "data": template._get_bytecode_cache(hass).data_to_save(),
+    }
+
+    # Simulate a restart with another time zone
+    await hass.config.async_update(time_zone="Europe/Amsterdam")
+    for key in (template._BYTECODE_CACHE, template._ENVIRONMENT):
+        hass.data.pop(key)
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == "01:00"
+    assert template._get_bytecode_cache(hass).dirty
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -4537,6 +4615,106 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_cache(hass: HomeAssistant) -> None:
+    """Test the render is reused while the states it used do not change."""
+    hass.states.async_set("sensor.used", "1")
+    hass.states.async_set("sensor.other", "2")
+    variables = {"offset": 1}
+    tmpl = template.Template('{{ states("sensor.used") | int + offset }}', hass)
+
+    info = tmpl.async_render_to_info(variables)
+    assert info.result() == 2
+    assert tmpl.async_render_to_info(variables) is info
+    hass.states.async_set("sensor.other", "3")
+    assert tmpl.async_render_to_info(variables) is info
+    assert (tmpl.render_cache_hits, tmpl.render_cache_misses) == (2, 1)
+
+    # Changes to the state or the variables render again
+    hass.states.async_set("sensor.used", "2")
+    info = tmpl.async_render_to_info(variables)
+    assert info.result() == 3
+    # The attributes were not read and new states with the same state
+    # do not change the result
+    hass.states.async_set("sensor.used", "2", {"unit": "W"})
+    assert tmpl.async_render_to_info(variables) is info
+    hass.states.async_set("sensor.used", "2", {"unit": "W"}, force_update=True)
+    assert tmpl.async_render_to_info(variables) is info
+    assert tmpl.async_render_to_info({"offset": 2}).result() == 4
+    hass.states.async_remove("sensor.used")
+    assert tmpl.async_render_to_info({"offset": 2}).exception is not None
+    assert (tmpl.render_cache_hits, tmpl.render_cache_misses) == (4, 4)
+
+    # The attributes are compared when they were read
+    tmpl = template.Template('{{ state_attr("sensor.other", "unit") }}', hass)
+    info = tmpl.async_render_to_info()
+    hass.states.async_set("sensor.other", "4")
+    assert tmpl.async_render_to_info() is info
+    hass.states.async_set("sensor.other", "4", {"unit": "W"})
+    assert tmpl.async_render_to_info().result() == "W"
+    assert (tmpl.render_cache_hits, tmpl.render_cache_misses) == (1, 2)
+
+    # Fields like last_updated are compared when they were read
+    tmpl = template.Template("{{ states.sensor.other.last_updated }}", hass)
+    info = tmpl.async_render_to_info()
+    hass.states.async_set("sensor.other", "4", {"unit": "W"}, force_update=True)
+    assert tmpl.async_render_to_info() is not info
+
+    # Renders depending on more than the collected states are never reused
+    for uncacheable in (
+        "{{ now() }}",
+        "{{ states.sensor | count }}",
+        "{{ [1, 2] | random }}",
+        '{{ area_id("sensor.other") }}',
+        '{{ distance("sensor.other") }}',
+        '{{ closest("sensor.other") }}',
+        '{{ "sensor.other" | closest }}',
+    ):
+        tmpl = template.Template(uncacheable, hass)
+        tmpl.async_render_to_info()
+        tmpl.async_render_to_info()
+        assert tmpl.render_cache_hits == 0
+
+
+async def test_render_to_info_cache_variables(hass: HomeAssistant) -> None:
+    """Test the render is not reused when the variables changed in place."""
+    tmpl = template.Template("{{ offset }}", hass)
+    variables = {"offset": 1}
+    assert tmpl.async_render_to_info(variables).result() == 1
+    variables["offset"] = 2
+    assert tmpl.async_render_to_info(variables).result() == 2
+    assert tmpl.async_render_to_info({"offset": 2}).result() == 2
+    assert tmpl.render_cache_hits == 1
+
+    # Renders with mutable variables are never reused
+    tmpl = template.Template("{{ values[0] }}", hass)
+    variables = {"values": [1]}
+    assert tmpl.async_render_to_info(variables).result() == 1
+    variables["values"][0] = 2
+    assert tmpl.async_render_to_info(variables).result() == 2
+    assert tmpl.render_cache_hits == 0
+
+
+async def test_render_to_info_state_fields(hass: HomeAssistant) -> None:
+    """Test the fields read from the iterated states are collected."""
+    hass.states.async_set("sensor.test", "on", {"friendly_name": "Test"})
+
+    info = render_to_info(hass, "{{ states.sensor | map(attribute='name') | list }}")
+    assert info.state_fields == {"attributes"}
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('state', 'eq', 'on') | map(attribute='domain') | list }}",
+    )
+    assert info.state_fields == {"state", "entity_id"}
+    info = render_to_info(hass, "{{ states.sensor | count }}")
+    assert info.state_fields == set()
+    info = render_to_info(
+        hass, "{{ states.sensor.test.last_updated }}{{ states.sensor | list }}"
+    )
+    assert info.state_fields is None
+    info = render_to_info(hass, "{{ (states.sensor | first).as_dict() }}")
+    assert info.state_fields is None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -2,10 +2,12 @@
 import asyncio
 from datetime import timedelta
 import logging
+import math
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
 
 import aiohttp
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import requests
 
@@ -89,6 +91,29 @@ def crd_without_update_interval(
     return get_crd(hass, None)
 
 
+async def test_refresh_timers_shared(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test coordinators refreshed at the same time share a loop timer."""
+    handles = set(hass.loop._scheduled)
+    unsubs = []
+    with patch.object(hass.loop, "time", return_value=math.floor(hass.loop.time())):
+        for _ in range(2):
+            crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+            crd._microsecond = 100000
+            unsubs.append(crd.async_add_listener(lambda: None))
+    new_handles = [
+        handle
+        for handle in set(hass.loop._scheduled) - handles
+        if not handle.cancelled()
+    ]
+    assert len(new_handles) == 1
+
+    for unsub in unsubs:
+        unsub()
+    assert new_handles[0].cancelled()
+
+
 async def test_async_refresh(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
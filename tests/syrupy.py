@@ -22,7 +22,7 @@ import voluptuous as vol
 import voluptuous_serialize
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import State
+from homeassistant.core import InternedAttributes, State
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import (
     area_registry as ar,
@@ -30,6 +30,7 @@ from homeassistant.helpers import (
     entity_registry as er,
     issue_registry as ir,
 )
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 
 class _ANY:
@@ -192,9 +193,16 @@ class HomeAssistantSnapshotSerializer(AmberDataSerializer):
     @classmethod
     def _serializable_state(cls, data: State) -> SerializableData:
         """Prepare a Home Assistant State for serialization."""
+        state = data.as_dict()
+        attributes = state["attributes"]
+        if isinstance(attributes, InternedAttributes):
+            # Whether the attributes are shared with other states is not
+            # part of the state
+            attributes = ReadOnlyDict(attributes)
         return StateSnapshot(
-            data.as_dict()
+            state
             | {
+                "attributes": attributes,
                 "context": ANY,
                 "last_changed": ANY,
                 "last_updated": ANY,
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -17,11 +17,13 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+import homeassistant.util.dt as dt_util
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_coro,
     mock_entity_platform,
@@ -959,3 +961,48 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+async def test_startup_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the platforms used during startup are preimported on the next one."""
+
+    async def async_setup(hass, config):
+        integration = await loader.async_get_integration(hass, "normal_integration")
+        integration.get_platform("light")
+        return True
+
+    mock_integration(
+        hass, MockModule(domain="normal_integration", async_setup=async_setup)
+    )
+    mock_entity_platform(hass, "light.normal_integration", MockPlatform())
+    hass_storage[bootstrap.STARTUP_PROFILE_STORAGE_KEY] = {
+        "version": bootstrap.STARTUP_PROFILE_STORAGE_VERSION,
+        "data": ["removed_integration.light", "normal_integration.sensor"],
+    }
+
+    preimport_cancelled = asyncio.Event()
+
+    async def _async_preimport_platforms(*args: Any) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            preimport_cancelled.set()
+            raise
+
+    with patch(
+        "homeassistant.loader.async_preimport_platforms",
+        side_effect=_async_preimport_platforms,
+    ) as mock_preimport:
+        await bootstrap._async_set_up_integrations(hass, {"normal_integration": {}})
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    mock_preimport.assert_called_once_with(hass, ["normal_integration.sensor"])
+    # The preimport still running after stage 2 is cancelled
+    assert preimport_cancelled.is_set()
+    assert loader.DATA_PLATFORM_IMPORTS not in hass.data
+    assert hass_storage[bootstrap.STARTUP_PROFILE_STORAGE_KEY]["data"] == [
+        "normal_integration.light"
+    ]
@@ -6,7 +6,9 @@ import asyncio
 from datetime import datetime, timedelta
 import functools
 import gc
+import json
 import logging
+import math
 import os
 from tempfile import TemporaryDirectory
 import threading
@@ -51,6 +53,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
@@ -797,6 +800,72 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners are only called for matching data values."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.bed"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": ["unhashable"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bed",
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_run_immediately(hass: HomeAssistant) -> None:
+    """Test keyed listeners can be called immediately."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen"], listener, run_immediately=True
+    )
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # No async_block_till_done here
+    assert len(calls) == 1
+    unsub()
+
+    async def async_listener(event):
+        """Mock coroutine listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            "test", "entity_id", ["light.kitchen"], async_listener, True
+        )
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", ["light.kitchen"], listener)
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -1113,6 +1182,145 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.lamp", "off")
+    old_bowl = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches = []
+
+    @ha.callback
+    def batch_listener(batch):
+        """Mock batch listener."""
+        batches.append(batch)
+
+    unsub = hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "off", {"brightness": 100}),
+            ("light.lamp", "off", None),
+            ("light.new", "on", {"brightness": 5}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # light.lamp did not change
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.new",
+    ]
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.bowl",
+        "light.new",
+    ]
+    bowl = hass.states.get("light.bowl")
+    new = hass.states.get("light.new")
+    assert bowl.state == "off"
+    assert bowl.attributes is old_bowl.attributes
+    assert bowl.last_updated == new.last_updated
+    assert bowl.context is not new.context
+    assert events[0].time_fired == bowl.last_updated
+
+    # Single writes are delivered to batch listeners as a batch of one
+    hass.states.async_set("light.lamp", "on")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert [event.data["entity_id"] for event in batches[1]] == ["light.lamp"]
+
+    # Nothing changed, nothing fired
+    hass.states.async_set_many([("light.lamp", "on", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert len(events) == 3
+
+    unsub()
+    hass.states.async_set_many([("light.lamp", "off", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert len(events) == 4
+
+
+async def test_statemachine_set_many_context(hass: HomeAssistant) -> None:
+    """Test setting multiple states with a shared context."""
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.lamp", "on", None)], context=context
+    )
+    assert hass.states.get("light.bowl").context is context
+    assert hass.states.get("light.lamp").context is context
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(MATCH_ALL, lambda batch: None)
+
+
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test states with the same attributes share one attributes object."""
+    hass.states.async_set("sensor.one", "1", {"unit": "W", "precision": 1})
+    hass.states.async_set("sensor.two", "2", {"unit": "W", "precision": 1})
+    hass.states.async_set("sensor.three", "3", {"unit": "W", "precision": True})
+    hass.states.async_set("sensor.four", "4", {"unit": "W", "options": ["a", "b"]})
+    hass.states.async_set("sensor.five", "5", {"unit": "W", "options": ["a", "b"]})
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    three = hass.states.get("sensor.three")
+    four = hass.states.get("sensor.four")
+    five = hass.states.get("sensor.five")
+
+    assert isinstance(one.attributes, ha.InternedAttributes)
+    assert one.attributes is two.attributes
+    # True == 1 but they must not share a JSON representation
+    assert one.attributes is not three.attributes
+    # 0.0 == -0.0 but they must not share a JSON representation
+    hass.states.async_set("sensor.zero", "0", {"unit": "W", "offset": 0.0})
+    hass.states.async_set("sensor.negative_zero", "0", {"unit": "W", "offset": -0.0})
+    assert (
+        hass.states.get("sensor.zero").attributes
+        is not hass.states.get("sensor.negative_zero").attributes
+    )
+    assert (
+        math.copysign(1, hass.states.get("sensor.negative_zero").attributes["offset"])
+        == -1
+    )
+    # Lists can not be interned
+    assert not isinstance(four.attributes, ha.InternedAttributes)
+    assert four.attributes is not five.attributes
+    assert four.attributes == five.attributes
+
+    with pytest.raises(RuntimeError):
+        one.attributes["unit"] = "kW"
+
+    assert json.loads(one.as_dict_json()) == json.loads(json_dumps(one.as_dict()))
+    assert json.loads(three.as_dict_json())["attributes"] == {
+        "unit": "W",
+        "precision": True,
+    }
+    assert json.loads("{" + two.as_compressed_state_json() + "}") == {
+        "sensor.two": json.loads(json_dumps(two.as_compressed_state()))
+    }
+    assert one.attributes.as_json_fragment() is two.attributes.as_json_fragment()
+
+
+async def test_statemachine_unchanged_attributes_not_interned(
+    hass: HomeAssistant,
+) -> None:
+    """Test unchanged attributes are reused without building an intern key."""
+    hass.states.async_set("sensor.one", "1", {"unit": "W", "precision": 1})
+    attributes = hass.states.get("sensor.one").attributes
+
+    with patch.object(
+        ha.StateMachine, "_async_intern_attributes", side_effect=AssertionError
+    ):
+        hass.states.async_set("sensor.one", "2", {"unit": "W", "precision": 1})
+        hass.states.async_set("sensor.one", "3", attributes)
+    assert hass.states.get("sensor.one").attributes is attributes
+
+    hass.states.async_set("sensor.one", "3", {"unit": "kW", "precision": 1})
+    assert hass.states.get("sensor.one").attributes["unit"] == "kW"
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
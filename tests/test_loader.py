@@ -1,5 +1,7 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+import sys
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -726,3 +728,138 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_builtin_integration_resolved_from_generated_manifests(
+    hass: HomeAssistant,
+) -> None:
+    """Test built-in integrations are resolved without reading their manifest."""
+    _, builtin_manifests = loader._get_builtin_manifests()
+    assert builtin_manifests["hue"]["domain"] == "hue"
+
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_json_loads.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.manifest == {**builtin_manifests["hue"], "is_built_in": True}
+    assert "is_built_in" not in builtin_manifests["hue"]
+
+
+async def test_builtin_integration_manifest_newer_than_generated_manifests(
+    hass: HomeAssistant,
+) -> None:
+    """Test a manifest modified after the generated manifests is read from disk."""
+    builtin_mtime, builtin_manifests = loader._get_builtin_manifests()
+    stale_manifest = {**builtin_manifests["hue"], "name": "Stale"}
+
+    with patch(
+        "homeassistant.loader._get_builtin_manifests",
+        return_value=(0, {"hue": stale_manifest}),
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+    # The generated manifests are used while they are newer than the manifest
+    with patch(
+        "homeassistant.loader._get_builtin_manifests",
+        return_value=(builtin_mtime, {"zwave_js": stale_manifest}),
+    ), patch("homeassistant.loader.json_loads") as mock_json_loads:
+        integration = await loader.async_get_integration(hass, "zwave_js")
+    assert not mock_json_loads.called
+    assert integration.name == "Stale"
+
+
+async def test_custom_components_manifests_cached(
+    hass: HomeAssistant, hass_storage: dict[str, Any], enable_custom_integrations: None
+) -> None:
+    """Test the manifests of custom components are cached by modification time."""
+    integrations = await loader._async_get_custom_components(hass)
+    cached = hass_storage[loader.CUSTOM_MANIFESTS_STORAGE_KEY]["data"]["manifests"]
+    manifest_path = str(integrations["test"].file_path / "manifest.json")
+    assert integrations["test"].manifest == {
+        **cached[manifest_path]["manifest"],
+        "is_built_in": False,
+    }
+
+    with patch(
+        "homeassistant.loader.json_loads", wraps=loader.json_loads
+    ) as mock_json_loads, patch(
+        "homeassistant.helpers.storage.Store.async_save"
+    ) as mock_save:
+        assert (await loader._async_get_custom_components(hass)).keys() == (
+            integrations.keys()
+        )
+    assert not mock_json_loads.called
+    assert not mock_save.called
+
+    cached[manifest_path]["mtime"] -= 1
+    with patch(
+        "homeassistant.loader.json_loads", wraps=loader.json_loads
+    ) as mock_json_loads:
+        integrations = await loader._async_get_custom_components(hass)
+    assert mock_json_loads.call_count == 1
+    assert integrations["test"].manifest["domain"] == "test"
+
+
+async def test_preimport_platforms(hass: HomeAssistant) -> None:
+    """Test platforms are preimported and their use is recorded."""
+    await loader.async_preimport_platforms(hass, ["hue.light", "hue.not_a_platform"])
+
+    assert hass.data[loader.DATA_COMPONENTS]["hue.light"] is hue_light
+    assert "hue.not_a_platform" not in hass.data[loader.DATA_COMPONENTS]
+
+    integration = await loader.async_get_integration(hass, "hue")
+    hass.data[loader.DATA_PLATFORM_IMPORTS] = {}
+    with patch.object(integration, "_import_platform") as mock_import:
+        assert integration.get_platform("light") is hue_light
+        assert integration.get_platform("light") is hue_light
+
+    assert not mock_import.called
+    assert list(hass.data[loader.DATA_PLATFORM_IMPORTS]) == ["hue.light"]
+
+
+async def test_preimport_platform_failure(hass: HomeAssistant) -> None:
+    """Test the modules of a platform that failed to preimport are removed."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    def _import_platform(platform_name: str) -> None:
+        sys.modules["homeassistant.components.hue.broken"] = Mock()
+        sys.modules["homeassistant.components.hue.broken.helper"] = Mock()
+        raise ImportError
+
+    with patch.object(integration, "_import_platform", side_effect=_import_platform):
+        await hass.async_add_executor_job(integration.preimport_platforms, ["broken"])
+
+    assert "hue.broken" not in hass.data[loader.DATA_COMPONENTS]
+    assert "homeassistant.components.hue.broken" not in sys.modules
+    assert "homeassistant.components.hue.broken.helper" not in sys.modules
+    assert "homeassistant.components.hue" in sys.modules
+
+
+async def test_custom_components_directories_cached(
+    hass: HomeAssistant, hass_storage: dict[str, Any], enable_custom_integrations: None
+) -> None:
+    """Test the custom components directories are cached by modification time."""
+    integrations = await loader._async_get_custom_components(hass)
+    directories = hass_storage[loader.CUSTOM_MANIFESTS_STORAGE_KEY]["data"][
+        "directories"
+    ]
+    (path,) = directories
+    assert "test" in directories[path]["sub_directories"]
+
+    with patch("homeassistant.loader.os.scandir") as mock_scandir:
+        assert (await loader._async_get_custom_components(hass)).keys() == (
+            integrations.keys()
+        )
+    assert not mock_scandir.called
+
+    directories[path]["mtime"] -= 1
+    directories[path]["sub_directories"] = ["test"]
+    with patch(
+        "homeassistant.loader.os.scandir", wraps=loader.os.scandir
+    ) as mock_scandir:
+        assert (await loader._async_get_custom_components(hass)).keys() == (
+            integrations.keys()
+        )
+    assert mock_scandir.call_count == 1